@@ -4,6 +4,8 @@ calibration and image extraction, as well as supporting algorithms.
 """
 
 import warnings
+from collections import defaultdict
+
 import numpy as np
 import astropy.units as u
 
@@ -140,35 +142,96 @@ class CameraCalibrator(TelescopeComponent):
         if self._check_r1_empty(waveforms):
             return
 
+        dl0 = event.dl0.tel[telid]
+        dl0.selected_gain_channel = selected_gain_channel
+
+        if not self.data_volume_reducer.reduces_data_volume:
+            # nothing is removed, so the r1 waveforms are used without a copy
+            dl0.waveform = waveforms
+            dl0.selected_pixels = None
+            return
+
         reduced_waveforms_mask = self.data_volume_reducer(
             waveforms, telid=telid, selected_gain_channel=selected_gain_channel
         )
 
         waveforms_copy = waveforms.copy()
         waveforms_copy[~reduced_waveforms_mask] = 0
-        event.dl0.tel[telid].waveform = waveforms_copy
-        event.dl0.tel[telid].selected_gain_channel = selected_gain_channel
+        dl0.waveform = waveforms_copy
 
-    def _calibrate_dl1(self, event, telid):
-        waveforms = event.dl0.tel[telid].waveform
-        selected_gain_channel = event.dl0.tel[telid].selected_gain_channel
+        # pixel-wise reduction, later steps only need to process these pixels
+        if reduced_waveforms_mask.ndim == 1:
+            dl0.selected_pixels = np.flatnonzero(reduced_waveforms_mask)
+        else:
+            dl0.selected_pixels = None
+
+    def _prepare_dl1(self, event, telid):
+        """
+        Apply the corrections needed before the image extraction to the
+        dl0 waveforms of a telescope event.
+
+        If the data volume reduction selected pixels and the image extractor
+        supports it, only the waveforms of these pixels are prepared.
+
+        Returns None if the event has no dl0 data, otherwise the waveforms,
+        the selected gain channel, the remaining time shift to apply to
+        the peak time after extraction (or None) and the indices of the
+        pixels the waveforms belong to (None for all pixels)
+        """
+        dl0 = event.dl0.tel[telid]
+        waveforms = dl0.waveform
         dl1_calib = event.calibration.tel[telid].dl1
 
         if self._check_dl0_empty(waveforms):
-            return
+            return None
 
         selected_gain_channel = event.r1.tel[telid].selected_gain_channel
         time_shift = event.calibration.tel[telid].dl1.time_shift
+        pedestal_offset = dl1_calib.pedestal_offset
         readout = self.subarray.tel[telid].camera.readout
-        n_pixels, n_samples = waveforms.shape
+        n_samples = waveforms.shape[-1]
+
+        selected_pixels = None
+        if dl0.selected_pixels is not None and self.image_extractor.pixel_independent:
+            selected_pixels = dl0.selected_pixels
+            waveforms = waveforms[selected_pixels]
+            if selected_gain_channel is not None:
+                selected_gain_channel = selected_gain_channel[selected_pixels]
+            if pedestal_offset is not None:
+                pedestal_offset = pedestal_offset[selected_pixels]
 
         # subtract any remaining pedestal before extraction
-        if dl1_calib.pedestal_offset is not None:
+        if pedestal_offset is not None:
             # this copies intentionally, we don't want to modify the dl0 data
             # waveforms have shape (n_pixel, n_samples), pedestals (n_pixels, )
-            waveforms = waveforms - dl1_calib.pedestal_offset[:, np.newaxis]
+            waveforms = waveforms - pedestal_offset[:, np.newaxis]
+
+        remaining_shift = None
+        # shift waveforms if time_shift calibration is available
+        if n_samples > 1 and time_shift is not None:
+            if self.apply_waveform_time_shift.tel[telid]:
+                sampling_rate = readout.sampling_rate.to_value(u.GHz)
+                time_shift_samples = time_shift * sampling_rate
+                waveforms, remaining_shift = shift_waveforms(
+                    waveforms, time_shift_samples, selected_pixels=selected_pixels
+                )
+                remaining_shift /= sampling_rate
+            else:
+                remaining_shift = time_shift
+                if selected_pixels is not None:
+                    remaining_shift = remaining_shift[selected_pixels]
 
-        if n_samples == 1:
+        if not self.apply_peak_time_shift.tel[telid]:
+            remaining_shift = None
+
+        return waveforms, selected_gain_channel, remaining_shift, selected_pixels
+
+    def _extract(self, waveforms, telid, selected_gain_channel, batch=False):
+        """
+        Extract charge and peak time from the waveforms of one telescope event,
+        or from a stack of events of the same telescope if ``batch`` is True
+        """
+        if waveforms.shape[-1] == 1:
             # To handle ASTRI and dst
             # TODO: Improved handling of ASTRI and dst
             #   - dst with custom EventSource?
@@ -176,28 +239,34 @@ class CameraCalibrator(TelescopeComponent):
             #   - Don't do anything if dl1 container already filled
             #   - Update on SST review decision
             charge = waveforms[..., 0].astype(np.float32)
-            peak_time = np.zeros(n_pixels, dtype=np.float32)
-        else:
+            peak_time = np.zeros(waveforms.shape[:-1], dtype=np.float32)
+            return charge, peak_time
 
-            # shift waveforms if time_shift calibration is available
-            if time_shift is not None:
-                if self.apply_waveform_time_shift.tel[telid]:
-                    sampling_rate = readout.sampling_rate.to_value(u.GHz)
-                    time_shift_samples = time_shift * sampling_rate
-                    waveforms, remaining_shift = shift_waveforms(
-                        waveforms, time_shift_samples
-                    )
-                    remaining_shift /= sampling_rate
-                else:
-                    remaining_shift = time_shift
-
-            charge, peak_time = self.image_extractor(
+        if batch:
+            return self.image_extractor.extract_batch(
                 waveforms, telid=telid, selected_gain_channel=selected_gain_channel
             )
+        return self.image_extractor(
+            waveforms, telid=telid, selected_gain_channel=selected_gain_channel
+        )
+
+    @staticmethod
+    def _fill_dl1(event, telid, charge, peak_time, remaining_shift, selected_pixels):
+        """ apply the remaining corrections and fill the dl1 container """
+        dl1_calib = event.calibration.tel[telid].dl1
 
-            # correct non-integer remainder of the shift if given
-            if self.apply_peak_time_shift.tel[telid] and time_shift is not None:
-                peak_time -= remaining_shift
+        # correct non-integer remainder of the shift if given
+        if remaining_shift is not None:
+            peak_time -= remaining_shift
+
+        # pixels removed by the data volume reduction have no signal
+        if selected_pixels is not None:
+            n_pixels = event.dl0.tel[telid].waveform.shape[-2]
+            selected_charge, selected_peak_time = charge, peak_time
+            charge = np.zeros(n_pixels, dtype=selected_charge.dtype)
+            peak_time = np.zeros(n_pixels, dtype=selected_peak_time.dtype)
+            charge[selected_pixels] = selected_charge
+            peak_time[selected_pixels] = selected_peak_time
 
         # Calibrate extracted charge
         charge *= dl1_calib.relative_factor / dl1_calib.absolute_factor
@@ -205,6 +274,17 @@ class CameraCalibrator(TelescopeComponent):
         event.dl1.tel[telid].image = charge
         event.dl1.tel[telid].peak_time = peak_time
 
+    def _calibrate_dl1(self, event, telid):
+        prepared = self._prepare_dl1(event, telid)
+        if prepared is None:
+            return
+
+        waveforms, selected_gain_channel, remaining_shift, selected_pixels = prepared
+        charge, peak_time = self._extract(waveforms, telid, selected_gain_channel)
+        self._fill_dl1(
+            event, telid, charge, peak_time, remaining_shift, selected_pixels
+        )
+
     def __call__(self, event):
         """
         Perform the full camera calibration from R1 to DL1. Any calibration
@@ -222,8 +302,61 @@ class CameraCalibrator(TelescopeComponent):
             self._calibrate_dl0(event, telid)
             self._calibrate_dl1(event, telid)
 
+    def calibrate_batch(self, events):
+        """
+        Perform the full camera calibration from R1 to DL1 for several events.
+
+        The images of all events of a telescope are extracted at once using
+        `~ctapipe.image.extractor.ImageExtractor.extract_batch`, which avoids
+        the per-event overhead of the extraction. The result is the same as
+        calling the calibrator for each event.
+
+        Parameters
+        ----------
+        events : Iterable[container]
+            `ctapipe` event containers
+        """
+        prepared = defaultdict(list)
+        for event in events:
+            tel = event.r1.tel or event.dl0.tel or event.dl1.tel
+            for telid in tel.keys():
+                self._calibrate_dl0(event, telid)
+                tel_event = self._prepare_dl1(event, telid)
+                if tel_event is not None:
+                    prepared[telid].append((event, *tel_event))
+
+        for telid, tel_events in prepared.items():
+            _, waveforms, selected_gain_channel, _, _ = zip(*tel_events)
+
+            # events can only be stacked if they have the same shape
+            stackable = len({w.shape for w in waveforms}) == 1 and not any(
+                gain is None for gain in selected_gain_channel
+            )
+            if stackable:
+                results = zip(
+                    *self._extract(
+                        np.stack(waveforms),
+                        telid,
+                        np.stack(selected_gain_channel),
+                        batch=True,
+                    )
+                )
+            else:
+                results = (
+                    self._extract(w, telid, gain)
+                    for w, gain in zip(waveforms, selected_gain_channel)
+                )
+
+            for (event, _, _, remaining_shift, selected_pixels), (
+                charge,
+                peak_time,
+            ) in zip(tel_events, results):
+                self._fill_dl1(
+                    event, telid, charge, peak_time, remaining_shift, selected_pixels
+                )
+
 
-def shift_waveforms(waveforms, time_shift_samples):
+def shift_waveforms(waveforms, time_shift_samples, selected_pixels=None):
     """
     Shift the waveforms by the mean integer shift to mediate
     time differences between pixels.
@@ -238,6 +371,9 @@ def shift_waveforms(waveforms, time_shift_samples):
         The shift to apply in units of samples.
         Waveforms are shifted to the left by the smallest integer
         that minimizes inter-pixel differences.
+    selected_pixels: ndarray or None
+        If given, ``waveforms`` only contains these pixels of the camera.
+        The mean shift is still computed from all pixels.
 
     Returns
     -------
@@ -247,6 +383,8 @@ def shift_waveforms(waveforms, time_shift_samples):
         The remaining shift after applying the integer shift to the waveforms.
     """
     mean_shift = time_shift_samples.mean()
+    if selected_pixels is not None:
+        time_shift_samples = time_shift_samples[selected_pixels]
     integer_shift = np.round(time_shift_samples - mean_shift).astype("int16")
     remaining_shift = time_shift_samples - integer_shift
     shifted_waveforms = _shift_waveforms_by_integer(waveforms, integer_shift)
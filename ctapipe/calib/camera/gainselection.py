@@ -4,6 +4,8 @@ Algorithms to select correct gain channel
 from abc import abstractmethod
 from enum import IntEnum
 import numpy as np
+from numba import njit
+
 from ctapipe.core import Component, traits
 
 __all__ = [
@@ -93,6 +95,22 @@ class ManualGainSelector(GainSelector):
         return np.full(n_pixels, GainChannel[self.channel])
 
 
+@njit
+def _select_above_threshold(waveforms, threshold):
+    """
+    Select the low gain channel for pixels with a high gain sample above
+    ``threshold``, stopping at the first such sample of each pixel
+    """
+    _, n_pixels, n_samples = waveforms.shape
+    selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
+    for pixel in range(n_pixels):
+        for sample in range(n_samples):
+            if waveforms[0, pixel, sample] > threshold:
+                selected_gain_channel[pixel] = 1
+                break
+    return selected_gain_channel
+
+
 class ThresholdGainSelector(GainSelector):
     """
     Select gain channel according to a maximum threshold value.
@@ -106,4 +124,4 @@ class ThresholdGainSelector(GainSelector):
     ).tag(config=True)
 
     def select_channel(self, waveforms):
-        return (waveforms[0] > self.threshold).any(axis=1).astype(np.int8)
+        return _select_above_threshold(waveforms, self.threshold)
@@ -31,6 +31,71 @@ def test_camera_calibrator(example_event, example_subarray):
     assert peak_time.shape == (1764,)
 
 
+def test_calibrate_batch(example_subarray):
+    from ctapipe.io import EventSource
+    from ctapipe.utils import get_dataset_path
+
+    path = get_dataset_path("gamma_test_large.simtel.gz")
+    with EventSource(path, max_events=5) as source:
+        events = [deepcopy(event) for event in source]
+    expected = deepcopy(events)
+
+    calibrator = CameraCalibrator(subarray=example_subarray)
+    calibrator.calibrate_batch(events)
+
+    for event, expected_event in zip(events, expected):
+        calibrator(expected_event)
+        assert set(event.dl1.tel) == set(expected_event.dl1.tel)
+        for telid, dl1 in expected_event.dl1.tel.items():
+            np.testing.assert_array_equal(event.dl1.tel[telid].image, dl1.image)
+            np.testing.assert_array_equal(
+                event.dl1.tel[telid].peak_time, dl1.peak_time
+            )
+
+
+def test_dl0_without_reduction(example_event, example_subarray):
+    """ without data volume reduction, dl0 shares the r1 waveforms """
+    calibrator = CameraCalibrator(subarray=example_subarray)
+    calibrator(example_event)
+    for telid, dl0 in example_event.dl0.tel.items():
+        assert dl0.waveform is example_event.r1.tel[telid].waveform
+        assert dl0.selected_pixels is None
+
+
+def test_sparse_dl0(example_event, example_subarray):
+    """ only the pixels kept by the data volume reduction are extracted """
+    config = Config(
+        {
+            "CameraCalibrator": {
+                "data_volume_reducer_type": "TailCutsDataVolumeReducer",
+                "image_extractor_type": "LocalPeakWindowSum",
+            }
+        }
+    )
+    event = deepcopy(example_event)
+    calibrator = CameraCalibrator(subarray=example_subarray, config=config)
+    calibrator(event)
+
+    # reference: extract all pixels of the zero-suppressed waveforms
+    expected = deepcopy(example_event)
+    calibrator.image_extractor.pixel_independent = False
+    calibrator(expected)
+
+    for telid, dl0 in event.dl0.tel.items():
+        mask = np.zeros(dl0.waveform.shape[0], dtype=bool)
+        mask[dl0.selected_pixels] = True
+        assert np.all(dl0.waveform[~mask] == 0)
+
+        dl1 = event.dl1.tel[telid]
+        expected_dl1 = expected.dl1.tel[telid]
+        assert dl1.image.shape == expected_dl1.image.shape
+        np.testing.assert_allclose(dl1.image[mask], expected_dl1.image[mask])
+        np.testing.assert_allclose(
+            dl1.peak_time[mask], expected_dl1.peak_time[mask]
+        )
+        assert np.all(dl1.image[~mask] == 0)
+
+
 def test_manual_extractor(example_subarray):
     calibrator = CameraCalibrator(
         subarray=example_subarray,
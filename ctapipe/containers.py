@@ -359,6 +359,15 @@ class DL0CameraContainer(Container):
         ),
     )
 
+    selected_pixels = Field(
+        None,
+        (
+            "Numpy array containing the indices of the pixels kept by the data "
+            "volume reduction, the waveforms of all other pixels are zero. "
+            "None if no pixels were removed."
+        ),
+    )
+
 
 class DL0Container(Container):
     """
@@ -10,7 +10,12 @@ from astropy.coordinates import (
 import warnings
 from .telescope_frame import TelescopeFrame
 from .nominal_frame import NominalFrame
-from .ground_frames import GroundFrame, TiltedGroundFrame, project_to_ground
+from .ground_frames import (
+    GroundFrame,
+    TiltedGroundFrame,
+    project_to_ground,
+    project_tilted_to_ground,
+)
 from .camera_frame import CameraFrame, EngineeringCameraFrame
 
 
@@ -22,6 +27,7 @@ __all__ = [
     "GroundFrame",
     "TiltedGroundFrame",
     "project_to_ground",
+    "project_tilted_to_ground",
     "MissingFrameAttributeWarning",
 ]
 
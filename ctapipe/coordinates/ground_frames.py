@@ -31,6 +31,7 @@ __all__ = [
     "GroundFrame",
     "TiltedGroundFrame",
     "project_to_ground",
+    "project_tilted_to_ground",
 ]
 
 
@@ -78,35 +79,34 @@ def get_shower_trans_matrix(azimuth, altitude):
 
     Parameters
     ----------
-    azimuth: float
-        Azimuth angle of the tilted system used
-    altitude: float
-        Altitude angle of the tilted system used
+    azimuth: float, ndarray or u.Quantity
+        Azimuth angle of the tilted system used, in rad if not a Quantity
+    altitude: float, ndarray or u.Quantity
+        Altitude angle of the tilted system used, in rad if not a Quantity
 
     Returns
     -------
-    trans: 3x3 ndarray transformation matrix
+    trans: 3x3 ndarray transformation matrix, shape (..., 3, 3) for array input
     """
+    altitude, azimuth = np.broadcast_arrays(
+        u.Quantity(altitude, u.rad).to_value(u.rad),
+        u.Quantity(azimuth, u.rad).to_value(u.rad),
+    )
 
     cos_z = sin(altitude)
     sin_z = cos(altitude)
     cos_az = cos(azimuth)
     sin_az = sin(azimuth)
-
-    trans = np.zeros([3, 3])
-    trans[0][0] = cos_z * cos_az
-    trans[1][0] = sin_az
-    trans[2][0] = sin_z * cos_az
-
-    trans[0][1] = -cos_z * sin_az
-    trans[1][1] = cos_az
-    trans[2][1] = -sin_z * sin_az
-
-    trans[0][2] = -sin_z
-    trans[1][2] = 0.0
-    trans[2][2] = cos_z
-
-    return trans
+    zero = np.zeros_like(cos_z)
+
+    return np.stack(
+        [
+            np.stack([cos_z * cos_az, -cos_z * sin_az, -sin_z], axis=-1),
+            np.stack([sin_az, cos_az, zero], axis=-1),
+            np.stack([sin_z * cos_az, -sin_z * sin_az, cos_z], axis=-1),
+        ],
+        axis=-2,
+    )
 
 
 @frame_transform_graph.transform(FunctionTransform, GroundFrame, TiltedGroundFrame)
@@ -192,18 +192,41 @@ def project_to_ground(tilt_system):
     Projection of tilted system onto the ground (GroundSystem)
 
     """
-    ground_system = tilt_system.transform_to(GroundFrame)
-
-    unit = ground_system.x.unit
-    x_initial = ground_system.x.value
-    y_initial = ground_system.y.value
-    z_initial = ground_system.z.value
-
     trans = get_shower_trans_matrix(
         tilt_system.pointing_direction.az, tilt_system.pointing_direction.alt
     )
 
-    x_projected = x_initial - trans[2][0] * z_initial / trans[2][2]
-    y_projected = y_initial - trans[2][1] * z_initial / trans[2][2]
+    unit = tilt_system.x.unit
+    x_projected, y_projected = project_tilted_to_ground(
+        trans, tilt_system.x.to_value(unit), tilt_system.y.to_value(unit)
+    )
 
     return GroundFrame(x=x_projected * unit, y=y_projected * unit, z=0 * unit)
+
+
+def project_tilted_to_ground(trans, x_tilt, y_tilt):
+    """Array version of `project_to_ground`: project positions in the
+    tilted system onto the ground.
+
+    Parameters
+    ----------
+    trans: ndarray
+        transformation matrix of `get_shower_trans_matrix` of the tilted
+        system, shape (3, 3) or (n, 3, 3) for one tilted system per position
+    x_tilt: float or ndarray
+        x positions in the tilted system
+    y_tilt: float or ndarray
+        y positions in the tilted system
+
+    Returns
+    -------
+    x_projected, y_projected: ndarray
+        positions of the projection onto the ground, in the unit of the input
+    """
+    x_grd = trans[..., 0, 0] * x_tilt + trans[..., 1, 0] * y_tilt
+    y_grd = trans[..., 0, 1] * x_tilt + trans[..., 1, 1] * y_tilt
+    z_grd = trans[..., 0, 2] * x_tilt + trans[..., 1, 2] * y_tilt
+
+    x_projected = x_grd - trans[..., 2, 0] * z_grd / trans[..., 2, 2]
+    y_projected = y_grd - trans[..., 2, 1] * z_grd / trans[..., 2, 2]
+    return x_projected, y_projected
@@ -173,3 +173,45 @@ def test_ground_to_tilt():
         TiltedGroundFrame(pointing_direction=pointing_direction)
     )
     assert np.abs(tilt_coord.x) < 1e-5 * u.m
+
+
+def test_project_tilted_to_ground():
+    from ctapipe.coordinates import (
+        GroundFrame,
+        TiltedGroundFrame,
+        project_tilted_to_ground,
+    )
+    from ctapipe.coordinates.ground_frames import get_shower_trans_matrix
+
+    altitude = np.deg2rad([90.0, 70.0, 45.0])
+    azimuth = np.deg2rad([0.0, 180.0, 30.0])
+    x_tilt = np.array([1.0, -20.0, 100.0])
+    y_tilt = np.array([2.0, 30.0, -50.0])
+
+    trans = get_shower_trans_matrix(azimuth, altitude)
+    assert trans.shape == (3, 3, 3)
+
+    x_projected, y_projected = project_tilted_to_ground(trans, x_tilt, y_tilt)
+    for i in range(3):
+        assert np.allclose(trans[i], get_shower_trans_matrix(azimuth[i], altitude[i]))
+
+        # the projection lies on the line of sight through the tilted position
+        pointing = SkyCoord(
+            alt=altitude[i] * u.rad, az=azimuth[i] * u.rad, frame=AltAz()
+        )
+        tilted = TiltedGroundFrame(
+            x=x_tilt[i] * u.m, y=y_tilt[i] * u.m, pointing_direction=pointing
+        )
+        ground = tilted.transform_to(GroundFrame())
+        offset = np.array(
+            [
+                x_projected[i] - ground.x.to_value(u.m),
+                y_projected[i] - ground.y.to_value(u.m),
+                -ground.z.to_value(u.m),
+            ]
+        )
+        assert np.allclose(np.cross(offset, trans[i, 2]), 0, atol=1e-9)
+
+    # pointing at zenith, the tilted frame is the ground frame
+    assert np.isclose(x_projected[0], 1.0)
+    assert np.isclose(y_projected[0], 2.0)
@@ -3,9 +3,13 @@ from copy import deepcopy
 from pprint import pformat
 from textwrap import wrap
 import warnings
+from enum import Enum
 import numpy as np
 from astropy.units import UnitConversionError, Quantity, Unit
 
+# field defaults of these types are not copied when resetting a container
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, Enum)
+
 
 class FieldValidationError(ValueError):
     pass
@@ -285,13 +289,21 @@ class Container(metaclass=ContainerMeta):
             return d
 
     def reset(self, recursive=True):
-        """ set all values back to their default values"""
-        for name, value in self.fields.items():
-            if isinstance(value, Container):
+        """
+        set all values back to their default values, sub-containers are
+        reset in place if ``recursive`` and kept as they are otherwise
+        """
+        for name, field in self.fields.items():
+            default = field.default
+            value = getattr(self, name)
+            if isinstance(default, Container) and isinstance(value, Container):
                 if recursive:
-                    getattr(self, name).reset()
+                    value.reset()
+            elif isinstance(default, _IMMUTABLE_TYPES):
+                # no need to copy defaults that cannot be modified
+                setattr(self, name, default)
             else:
-                setattr(self, name, deepcopy(self.fields[name].default))
+                setattr(self, name, deepcopy(default))
 
     def update(self, **values):
         """
@@ -83,6 +83,46 @@ class QualityQuery(Component):
         """ return number of events processed"""
         return self._counts[0]
 
+    def reset_counts(self):
+        """ set the counts and cumulative counts of all criteria to zero """
+        self._counts[:] = 0
+        self._cumulative_counts[:] = 0
+
+    def get_counts(self):
+        """
+        Return copies of the counts and cumulative counts of all criteria,
+        including the TOTAL criterion, e.g. to merge them into another
+        instance using `merge_counts`.
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray):
+            counts and cumulative counts
+        """
+        return self._counts.copy(), self._cumulative_counts.copy()
+
+    def merge_counts(self, counts, cumulative_counts):
+        """
+        Add counts recorded by another instance with the same criteria,
+        as returned by its `get_counts`, to the counts of this instance.
+
+        Parameters
+        ----------
+        counts: np.ndarray
+            counts of each criterion, including the TOTAL criterion
+        cumulative_counts: np.ndarray
+            cumulative counts of each criterion, including the TOTAL criterion
+        """
+        if len(counts) != len(self._counts) or len(cumulative_counts) != len(
+            self._cumulative_counts
+        ):
+            raise ValueError(
+                f"Expected counts for {len(self._counts)} criteria, "
+                f"got {len(counts)} and {len(cumulative_counts)}"
+            )
+        self._counts += counts
+        self._cumulative_counts += cumulative_counts
+
     def to_table(self, functions=False):
         """
         Return a tabular view of the latest quality summary
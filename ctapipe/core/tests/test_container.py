@@ -132,6 +132,35 @@ def test_child_containers():
     assert cont.child.z == 1
 
 
+def test_reset_child_containers():
+    class ChildContainer(Container):
+        z = Field(1, "sub-item")
+        history = Field([], "mutable item")
+
+    class ParentContainer(Container):
+        x = Field(0, "some value")
+        child = Field(ChildContainer(), "a child")
+
+    cont = ParentContainer()
+    child = cont.child
+    cont.x = 5
+    child.z = 99
+    child.history.append(1)
+
+    cont.reset()
+    assert cont.x == 0
+    # sub-containers are reset in place
+    assert cont.child is child
+    assert child.z == 1
+    # mutable defaults are copied
+    assert child.history == []
+    assert child.history is not ChildContainer.fields["history"].default
+
+    child.z = 99
+    cont.reset(recursive=False)
+    assert child.z == 99
+
+
 def test_map_containers():
     class ChildContainer(Container):
         z = Field(1, "sub-item")
@@ -96,3 +96,40 @@ def test_bad_selector():
     with pytest.raises(NameError):
         s = QualityQuery(quality_criteria=[("dangerous", "lambda x: Component()")])
         s(10)
+
+
+def test_merge_counts():
+    """ test resetting the counts and merging the counts of another query """
+    def make_query():
+        return QualityQuery(
+            quality_criteria=[
+                ("high_enough", "lambda x: x > 3"),
+                ("smallish", "lambda x: x < 10"),
+            ]
+        )
+
+    query = make_query()
+    other = make_query()
+
+    for value in (0, 5, 20):
+        query(value)
+    for value in (5, 8):
+        other(value)
+
+    query.merge_counts(*other.get_counts())
+    tab = query.to_table()
+    assert list(tab["counts"]) == [5, 4, 4]
+    assert list(tab["cumulative_counts"]) == [5, 4, 2]
+    assert len(query) == 5
+
+    # returned counts are copies
+    counts, _ = other.get_counts()
+    counts[:] = 100
+    assert len(other) == 2
+
+    other.reset_counts()
+    assert len(other) == 0
+    assert list(other.to_table()["cumulative_counts"]) == [0, 0, 0]
+
+    with pytest.raises(ValueError):
+        query.merge_counts([1, 1], [1, 1])
@@ -1,5 +1,6 @@
 from .hillas import (
     hillas_parameters,
+    hillas_parameters_batch,
     HillasParameterizationError,
     camera_to_shower_coordinates,
 )
@@ -13,6 +14,12 @@ from .morphology import (
     morphology_parameters,
     largest_island,
 )
+from .parameters import (
+    IMAGE_PARAMETERS_DTYPE,
+    empty_image_parameters,
+    image_parameters,
+    image_parameters_to_container,
+)
 
 from .cleaning import *
 from .pixel_likelihood import *
@@ -8,6 +8,11 @@ __all__ = [
     "mars_cleaning_1st_pass",
     "fact_image_cleaning",
     "apply_time_delta_cleaning",
+    "tailcuts_clean_batch",
+    "dilate_batch",
+    "mars_cleaning_1st_pass_batch",
+    "fact_image_cleaning_batch",
+    "apply_time_delta_cleaning_batch",
     "ImageCleaner",
     "TailcutsImageCleaner",
 ]
@@ -15,6 +20,7 @@ __all__ = [
 from abc import abstractmethod
 
 import numpy as np
+from numba import njit, prange
 
 from ..core.component import TelescopeComponent
 from ..core.traits import (
@@ -103,6 +109,72 @@ def tailcuts_clean(
         )
 
 
+@njit
+def _tailcuts_clean_sparse(
+    indices,
+    indptr,
+    image,
+    picture_thresh,
+    boundary_thresh,
+    keep_isolated_pixels,
+    min_number_picture_neighbors,
+):
+    """
+    Compiled version of `tailcuts_clean` working directly on the
+    ``indices`` and ``indptr`` arrays of the sparse neighbor matrix.
+    """
+    n_pixels = len(image)
+    pixels_above_picture = image >= picture_thresh
+    pixels_above_boundary = image >= boundary_thresh
+
+    if keep_isolated_pixels or min_number_picture_neighbors == 0:
+        pixels_in_picture = pixels_above_picture
+    else:
+        pixels_in_picture = np.zeros(n_pixels, dtype=np.bool_)
+        for pixel in range(n_pixels):
+            if not pixels_above_picture[pixel]:
+                continue
+
+            n_neighbors = 0
+            for i in range(indptr[pixel], indptr[pixel + 1]):
+                if pixels_above_picture[indices[i]]:
+                    n_neighbors += 1
+            pixels_in_picture[pixel] = n_neighbors >= min_number_picture_neighbors
+
+    return _add_boundary_pixels(
+        indices, indptr, pixels_in_picture, pixels_above_boundary, keep_isolated_pixels
+    )
+
+
+@njit
+def _add_boundary_pixels(indices, indptr, core, above_boundary, keep_isolated_pixels):
+    """
+    Common last step of `tailcuts_clean` and `mars_cleaning_1st_pass`:
+    select pixels above the boundary threshold with a core neighbor and
+    core pixels with a neighbor above the boundary threshold (or all
+    core pixels if ``keep_isolated_pixels``).
+    """
+    n_pixels = len(core)
+    mask = np.zeros(n_pixels, dtype=np.bool_)
+    for pixel in range(n_pixels):
+        if keep_isolated_pixels and core[pixel]:
+            mask[pixel] = True
+            continue
+
+        if not (above_boundary[pixel] or core[pixel]):
+            continue
+
+        for i in range(indptr[pixel], indptr[pixel + 1]):
+            neighbor = indices[i]
+            if (above_boundary[pixel] and core[neighbor]) or (
+                not keep_isolated_pixels and core[pixel] and above_boundary[neighbor]
+            ):
+                mask[pixel] = True
+                break
+
+    return mask
+
+
 def mars_cleaning_1st_pass(
     geom,
     image,
@@ -149,14 +221,42 @@ def mars_cleaning_1st_pass(
 
     """
 
-    pixels_from_tailcuts_clean = tailcuts_clean(
-        geom,
+    neighbors = geom.neighbor_matrix_sparse
+    return _mars_cleaning_1st_pass_sparse(
+        neighbors.indices,
+        neighbors.indptr,
         image,
         picture_thresh,
         boundary_thresh,
         keep_isolated_pixels,
         min_number_picture_neighbors,
-    )  # this selects any core pixel and any of its first neighbors
+    )
+
+
+@njit
+def _mars_cleaning_1st_pass_sparse(
+    indices,
+    indptr,
+    image,
+    picture_thresh,
+    boundary_thresh,
+    keep_isolated_pixels,
+    min_number_picture_neighbors,
+):
+    """
+    Compiled version of `mars_cleaning_1st_pass` working directly on the
+    ``indices`` and ``indptr`` arrays of the sparse neighbor matrix.
+    """
+    # this selects any core pixel and any of its first neighbors
+    pixels_from_tailcuts_clean = _tailcuts_clean_sparse(
+        indices,
+        indptr,
+        image,
+        picture_thresh,
+        boundary_thresh,
+        keep_isolated_pixels,
+        min_number_picture_neighbors,
+    )
 
     # At this point we don't know yet which ones should be kept.
     # In principle, the pixel thresholds should be hierarchical from core to
@@ -164,25 +264,17 @@ def mars_cleaning_1st_pass(
     # the image), so we can just check which pixels have more than
     # boundary_thresh photo-electrons in the same image, but starting from
     # the mask we got from 'tailcuts_clean'.
-
     pixels_above_2nd_boundary = image >= boundary_thresh
 
     # and now it's the same as the last part of 'tailcuts_clean', but without
     # the core pixels, i.e. we start from the neighbors of the core pixels.
-    pixels_with_previous_neighbors = geom.neighbor_matrix_sparse.dot(
-        pixels_from_tailcuts_clean
+    return _add_boundary_pixels(
+        indices,
+        indptr,
+        pixels_from_tailcuts_clean,
+        pixels_above_2nd_boundary,
+        keep_isolated_pixels,
     )
-    if keep_isolated_pixels:
-        return (
-            pixels_above_2nd_boundary & pixels_with_previous_neighbors
-        ) | pixels_from_tailcuts_clean
-    else:
-        pixels_with_2ndboundary_neighbors = geom.neighbor_matrix_sparse.dot(
-            pixels_above_2nd_boundary
-        )
-        return (pixels_above_2nd_boundary & pixels_with_previous_neighbors) | (
-            pixels_from_tailcuts_clean & pixels_with_2ndboundary_neighbors
-        )
 
 
 def dilate(geom, mask):
@@ -232,15 +324,36 @@ def apply_time_delta_cleaning(
     `image[~mask] = 0`
 
     """
-    pixels_to_remove = []
-    mask = mask.copy()  # Create copy so orginal is unchanged
+    neighbors = geom.neighbor_matrix_sparse
+    return _apply_time_delta_cleaning_sparse(
+        neighbors.indices,
+        neighbors.indptr,
+        mask,
+        arrival_times,
+        min_number_neighbors,
+        time_limit,
+    )
+
+
+@njit
+def _apply_time_delta_cleaning_sparse(
+    indices, indptr, mask, arrival_times, min_number_neighbors, time_limit
+):
+    """
+    Compiled version of `apply_time_delta_cleaning` working directly on the
+    ``indices`` and ``indptr`` arrays of the sparse neighbor matrix.
+    """
+    new_mask = mask.copy()  # Create copy so orginal is unchanged
     for pixel in np.where(mask)[0]:
-        neighbors = geom.neighbor_matrix_sparse[pixel].indices
-        time_diff = np.abs(arrival_times[neighbors] - arrival_times[pixel])
-        if sum(time_diff < time_limit) < min_number_neighbors:
-            pixels_to_remove.append(pixel)
-    mask[pixels_to_remove] = False
-    return mask
+        n_neighbors_in_time = 0
+        for i in range(indptr[pixel], indptr[pixel + 1]):
+            time_diff = np.abs(arrival_times[indices[i]] - arrival_times[pixel])
+            if time_diff < time_limit:
+                n_neighbors_in_time += 1
+
+        if n_neighbors_in_time < min_number_neighbors:
+            new_mask[pixel] = False
+    return new_mask
 
 
 def fact_image_cleaning(
@@ -331,6 +444,223 @@ def fact_image_cleaning(
     return pixels_to_keep
 
 
+def _neighbor_counts_batch(geom, masks):
+    """
+    Number of neighbors of each pixel that are True in ``masks``,
+    for a stack of masks of shape (n_images, n_pixels)
+    """
+    return geom.neighbor_matrix_sparse.dot(masks.T.astype(np.int32)).T
+
+
+def tailcuts_clean_batch(
+    geom,
+    images,
+    picture_thresh=7,
+    boundary_thresh=5,
+    keep_isolated_pixels=False,
+    min_number_picture_neighbors=0,
+):
+    """
+    `tailcuts_clean` for a stack of images of the same camera,
+    using sparse matrix products against the whole stack.
+
+    Parameters
+    ----------
+    geom: `ctapipe.instrument.CameraGeometry`
+        Camera geometry information
+    images: array
+        pixel values, shape (n_images, n_pixels)
+    picture_thresh: float or array
+        threshold above which all pixels are retained.
+        Thresholds are broadcast against ``images``, so they can be given
+        per pixel with shape (n_pixels,), per image with shape (n_images, 1)
+        or for each pixel of each image with shape (n_images, n_pixels).
+    boundary_thresh: float or array
+        threshold above which pixels are retained if they have a neighbor
+        already above the picture_thresh, broadcast like ``picture_thresh``
+    keep_isolated_pixels: bool
+        If True, pixels above the picture threshold will be included always,
+        if not they are only included if a neighbor is in the picture or
+        boundary
+    min_number_picture_neighbors: int
+        A picture pixel survives cleaning only if it has at least this number
+        of picture neighbors. This has no effect in case keep_isolated_pixels is True
+
+    Returns
+    -------
+    Boolean masks of *clean* pixels, shape (n_images, n_pixels)
+    """
+    images = np.asanyarray(images)
+    pixels_above_picture = images >= picture_thresh
+
+    if keep_isolated_pixels or min_number_picture_neighbors == 0:
+        pixels_in_picture = pixels_above_picture
+    else:
+        number_of_neighbors_above_picture = _neighbor_counts_batch(
+            geom, pixels_above_picture
+        )
+        pixels_in_picture = pixels_above_picture & (
+            number_of_neighbors_above_picture >= min_number_picture_neighbors
+        )
+
+    pixels_above_boundary = images >= boundary_thresh
+    pixels_with_picture_neighbors = _neighbor_counts_batch(geom, pixels_in_picture) > 0
+    if keep_isolated_pixels:
+        return (
+            pixels_above_boundary & pixels_with_picture_neighbors
+        ) | pixels_in_picture
+    else:
+        pixels_with_boundary_neighbors = (
+            _neighbor_counts_batch(geom, pixels_above_boundary) > 0
+        )
+        return (pixels_above_boundary & pixels_with_picture_neighbors) | (
+            pixels_in_picture & pixels_with_boundary_neighbors
+        )
+
+
+def mars_cleaning_1st_pass_batch(
+    geom,
+    images,
+    picture_thresh=7,
+    boundary_thresh=5,
+    keep_isolated_pixels=False,
+    min_number_picture_neighbors=0,
+):
+    """
+    `mars_cleaning_1st_pass` for a stack of images of the same camera,
+    using sparse matrix products against the whole stack.
+    See `tailcuts_clean_batch` for the parameters.
+
+    Returns
+    -------
+    Boolean masks of *clean* pixels, shape (n_images, n_pixels)
+    """
+    images = np.asanyarray(images)
+    pixels_from_tailcuts_clean = tailcuts_clean_batch(
+        geom,
+        images,
+        picture_thresh,
+        boundary_thresh,
+        keep_isolated_pixels,
+        min_number_picture_neighbors,
+    )
+
+    pixels_above_2nd_boundary = images >= boundary_thresh
+    pixels_with_previous_neighbors = (
+        _neighbor_counts_batch(geom, pixels_from_tailcuts_clean) > 0
+    )
+    if keep_isolated_pixels:
+        return (
+            pixels_above_2nd_boundary & pixels_with_previous_neighbors
+        ) | pixels_from_tailcuts_clean
+    else:
+        pixels_with_2ndboundary_neighbors = (
+            _neighbor_counts_batch(geom, pixels_above_2nd_boundary) > 0
+        )
+        return (pixels_above_2nd_boundary & pixels_with_previous_neighbors) | (
+            pixels_from_tailcuts_clean & pixels_with_2ndboundary_neighbors
+        )
+
+
+def dilate_batch(geom, masks):
+    """
+    `dilate` for a stack of masks of shape (n_images, n_pixels)
+    """
+    return masks | (_neighbor_counts_batch(geom, masks) > 0)
+
+
+@njit(parallel=True)
+def _apply_time_delta_cleaning_batch(
+    indices, indptr, masks, arrival_times, min_number_neighbors, time_limit
+):
+    new_masks = np.empty_like(masks)
+    for image in prange(masks.shape[0]):
+        new_masks[image] = _apply_time_delta_cleaning_sparse(
+            indices,
+            indptr,
+            masks[image],
+            arrival_times[image],
+            min_number_neighbors,
+            time_limit,
+        )
+    return new_masks
+
+
+def apply_time_delta_cleaning_batch(
+    geom, masks, arrival_times, min_number_neighbors, time_limit
+):
+    """
+    `apply_time_delta_cleaning` for a stack of masks and arrival times
+    of shape (n_images, n_pixels), processing the images in parallel.
+
+    Returns
+    -------
+    Boolean masks of *clean* pixels, shape (n_images, n_pixels)
+    """
+    neighbors = geom.neighbor_matrix_sparse
+    return _apply_time_delta_cleaning_batch(
+        neighbors.indices,
+        neighbors.indptr,
+        np.asanyarray(masks, dtype=np.bool_),
+        np.asanyarray(arrival_times),
+        min_number_neighbors,
+        time_limit,
+    )
+
+
+def fact_image_cleaning_batch(
+    geom,
+    images,
+    arrival_times,
+    picture_threshold=4,
+    boundary_threshold=2,
+    min_number_neighbors=2,
+    time_limit=5,
+):
+    """
+    `fact_image_cleaning` for a stack of images and arrival times of the
+    same camera, shape (n_images, n_pixels).
+    Thresholds are broadcast against ``images``, see `tailcuts_clean_batch`.
+
+    Returns
+    -------
+    Boolean masks of *clean* pixels, shape (n_images, n_pixels)
+    """
+    images = np.asanyarray(images)
+
+    # Step 1
+    pixels_to_keep = images >= picture_threshold
+
+    # Step 2
+    number_of_neighbors_above_picture = _neighbor_counts_batch(geom, pixels_to_keep)
+    pixels_to_keep = pixels_to_keep & (
+        number_of_neighbors_above_picture >= min_number_neighbors
+    )
+
+    # Step 3
+    pixels_above_boundary = images >= boundary_threshold
+    pixels_to_keep = dilate_batch(geom, pixels_to_keep) & pixels_above_boundary
+
+    # nothing else to do if min_number_neighbors <= 0
+    if min_number_neighbors <= 0:
+        return pixels_to_keep
+
+    # Step 4
+    pixels_to_keep = apply_time_delta_cleaning_batch(
+        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
+    )
+
+    # Step 5
+    number_of_neighbors = _neighbor_counts_batch(geom, pixels_to_keep)
+    pixels_to_keep = pixels_to_keep & (number_of_neighbors >= min_number_neighbors)
+
+    # Step 6
+    pixels_to_keep = apply_time_delta_cleaning_batch(
+        geom, pixels_to_keep, arrival_times, min_number_neighbors, time_limit
+    )
+    return pixels_to_keep
+
+
 class ImageCleaner(TelescopeComponent):
     """
     Abstract class for all configurable Image Cleaning algorithms.   Use
@@ -361,6 +691,41 @@ class ImageCleaner(TelescopeComponent):
         """
         pass
 
+    def clean_batch(
+        self, tel_id: int, images: np.ndarray, arrival_times: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Clean a stack of images of the same telescope at once.
+
+        The default implementation calls the cleaner for each image,
+        subclasses override it with vectorized implementations.
+
+        Parameters
+        ----------
+        tel_id: int
+            which telescope id in the subarray is being used (determines
+            which cut is used)
+        images : np.ndarray
+            image pixel data, shape (n_images, n_pixels)
+        arrival_times: np.ndarray
+            arrival times with the same shape as ``images``
+            (not used by all cleaners)
+
+        Returns
+        -------
+        np.ndarray
+            boolean masks of pixels passing cleaning, shape (n_images, n_pixels)
+        """
+        if arrival_times is None:
+            arrival_times = [None] * len(images)
+
+        masks = [
+            self(tel_id, image, arrival_times=times)
+            for image, times in zip(images, arrival_times)
+        ]
+        n_pixels = self.subarray.tel[tel_id].camera.geometry.n_pixels
+        return np.array(masks, dtype=bool).reshape(len(images), n_pixels)
+
 
 class TailcutsImageCleaner(ImageCleaner):
     """
@@ -402,6 +767,22 @@ class TailcutsImageCleaner(ImageCleaner):
             keep_isolated_pixels=self.keep_isolated_pixels.tel[tel_id],
         )
 
+    def clean_batch(
+        self, tel_id: int, images: np.ndarray, arrival_times=None
+    ) -> np.ndarray:
+        """
+        Apply standard picture-boundary cleaning to a stack of images.
+        See `ImageCleaner.clean_batch()`
+        """
+        return tailcuts_clean_batch(
+            self.subarray.tel[tel_id].camera.geometry,
+            images,
+            picture_thresh=self.picture_threshold_pe.tel[tel_id],
+            boundary_thresh=self.boundary_threshold_pe.tel[tel_id],
+            min_number_picture_neighbors=self.min_picture_neighbors.tel[tel_id],
+            keep_isolated_pixels=self.keep_isolated_pixels.tel[tel_id],
+        )
+
 
 class MARSImageCleaner(TailcutsImageCleaner):
     """
@@ -424,6 +805,22 @@ class MARSImageCleaner(TailcutsImageCleaner):
             keep_isolated_pixels=False,
         )
 
+    def clean_batch(
+        self, tel_id: int, images: np.ndarray, arrival_times=None
+    ) -> np.ndarray:
+        """
+        Apply MARS-style image cleaning to a stack of images.
+        See `ImageCleaner.clean_batch()`
+        """
+        return mars_cleaning_1st_pass_batch(
+            self.subarray.tel[tel_id].camera.geometry,
+            images,
+            picture_thresh=self.picture_threshold_pe.tel[tel_id],
+            boundary_thresh=self.boundary_threshold_pe.tel[tel_id],
+            min_number_picture_neighbors=self.min_picture_neighbors.tel[tel_id],
+            keep_isolated_pixels=False,
+        )
+
 
 class FACTImageCleaner(TailcutsImageCleaner):
     """
@@ -448,3 +845,20 @@ class FACTImageCleaner(TailcutsImageCleaner):
             min_number_neighbors=self.min_picture_neighbors.tel[tel_id],
             time_limit=self.time_limit_ns.tel[tel_id],
         )
+
+    def clean_batch(
+        self, tel_id: int, images: np.ndarray, arrival_times=None
+    ) -> np.ndarray:
+        """
+        Apply FACT-style image cleaning to a stack of images.
+        See `ImageCleaner.clean_batch()`
+        """
+        return fact_image_cleaning_batch(
+            geom=self.subarray.tel[tel_id].camera.geometry,
+            images=images,
+            arrival_times=arrival_times,
+            picture_threshold=self.picture_threshold_pe.tel[tel_id],
+            boundary_threshold=self.boundary_threshold_pe.tel[tel_id],
+            min_number_neighbors=self.min_picture_neighbors.tel[tel_id],
+            time_limit=self.time_limit_ns.tel[tel_id],
+        )
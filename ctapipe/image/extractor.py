@@ -32,9 +32,10 @@ from numba import njit, prange, guvectorize, float64, float32, int64
 from scipy.ndimage.filters import convolve1d
 from typing import Tuple
 
-from . import number_of_islands, largest_island, tailcuts_clean
-from .timing import timing_parameters
-from .hillas import hillas_parameters, camera_to_shower_coordinates
+from .cleaning import _tailcuts_clean_sparse
+from .morphology import _num_islands_sparse_indices
+from .hillas import HILLAS_ATOL
+from ..fitting import lts_linear_regression
 
 
 @guvectorize(
@@ -259,6 +260,11 @@ def integration_correction(
 
 
 class ImageExtractor(TelescopeComponent):
+
+    # True if the charge and peak time of a pixel only depend on its own
+    # waveform, the extractor can then be called for a subset of the pixels
+    pixel_independent = False
+
     def __init__(self, subarray, config=None, parent=None, **kwargs):
         """
         Base component to handle the extraction of charge and pulse time
@@ -321,24 +327,73 @@ class ImageExtractor(TelescopeComponent):
             Shape: (n_pix)
         """
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        """
+        Extract the charge and time for a stack of events of the same telescope.
+
+        The default implementation calls the extractor for each event.
+        Subclasses that can process the whole stack at once override this.
+
+        Parameters
+        ----------
+        waveforms : ndarray
+            Waveforms of all events stored in a numpy array of shape
+            (n_events, n_pix, n_samples).
+        telid : int
+            The telescope id. Used to obtain to correct traitlet configuration
+            and instrument properties
+        selected_gain_channel : ndarray
+            The channel selected in the gain selection, per event and pixel.
+            Shape: (n_events, n_pix)
+
+        Returns
+        -------
+        charge : ndarray
+            Charge extracted from the waveform in "waveform_units * ns"
+            Shape: (n_events, n_pix)
+        peak_time : ndarray
+            Floating point pulse time in each pixel in units "ns"
+            Shape: (n_events, n_pix)
+        """
+        results = [
+            self(event_waveforms, telid, event_selected_gain_channel)
+            for event_waveforms, event_selected_gain_channel in zip(
+                waveforms, selected_gain_channel
+            )
+        ]
+        if len(results) == 0:
+            empty = np.empty(waveforms.shape[:-1], dtype=np.float32)
+            return empty, empty.copy()
+
+        charge, peak_time = zip(*results)
+        return np.stack(charge), np.stack(peak_time)
+
 
 class FullWaveformSum(ImageExtractor):
     """
     Extractor that sums the entire waveform.
     """
 
+    pixel_independent = True
+
     def __call__(self, waveforms, telid, selected_gain_channel):
         charge, peak_time = extract_around_peak(
             waveforms, 0, waveforms.shape[-1], 0, self.sampling_rate[telid]
         )
         return charge, peak_time
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        # extract_around_peak broadcasts over the event axis
+        return self(waveforms, telid, selected_gain_channel)
+
 
 class FixedWindowSum(ImageExtractor):
     """
     Extractor that sums within a fixed window defined by the user.
     """
 
+    pixel_independent = True
+
     peak_index = IntTelescopeParameter(
         default_value=0, help="Manually select index where the peak is located"
     ).tag(config=True)
@@ -396,6 +451,10 @@ class FixedWindowSum(ImageExtractor):
             charge *= self._calculate_correction(telid=telid)[selected_gain_channel]
         return charge, peak_time
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        # extract_around_peak broadcasts over the event axis
+        return self(waveforms, telid, selected_gain_channel)
+
 
 class GlobalPeakWindowSum(ImageExtractor):
     """
@@ -447,7 +506,8 @@ class GlobalPeakWindowSum(ImageExtractor):
         )
 
     def __call__(self, waveforms, telid, selected_gain_channel):
-        peak_index = waveforms.mean(axis=-2).argmax(axis=-1)
+        # one peak index per event, same for all pixels
+        peak_index = waveforms.mean(axis=-2).argmax(axis=-1)[..., np.newaxis]
         charge, peak_time = extract_around_peak(
             waveforms,
             peak_index,
@@ -459,6 +519,10 @@ class GlobalPeakWindowSum(ImageExtractor):
             charge *= self._calculate_correction(telid=telid)[selected_gain_channel]
         return charge, peak_time
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        # the peak search and extract_around_peak broadcast over the event axis
+        return self(waveforms, telid, selected_gain_channel)
+
 
 class LocalPeakWindowSum(ImageExtractor):
     """
@@ -466,6 +530,8 @@ class LocalPeakWindowSum(ImageExtractor):
     peak in each pixel's waveform.
     """
 
+    pixel_independent = True
+
     window_width = IntTelescopeParameter(
         default_value=7, help="Define the width of the integration window"
     ).tag(config=True)
@@ -522,6 +588,10 @@ class LocalPeakWindowSum(ImageExtractor):
             charge *= self._calculate_correction(telid=telid)[selected_gain_channel]
         return charge, peak_time
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        # the peak search and extract_around_peak broadcast over the event axis
+        return self(waveforms, telid, selected_gain_channel)
+
 
 class NeighborPeakWindowSum(ImageExtractor):
     """
@@ -580,13 +650,16 @@ class NeighborPeakWindowSum(ImageExtractor):
 
     def __call__(self, waveforms, telid, selected_gain_channel):
         neighbors = self.subarray.tel[telid].camera.geometry.neighbor_matrix_sparse
+        # neighbor_average_waveform expects the pixel axis first,
+        # for stacks of events the event axis is moved behind it
+        pixel_axis = waveforms.ndim - 2
         average_wfs = neighbor_average_waveform(
-            waveforms,
+            np.moveaxis(waveforms, pixel_axis, 0),
             neighbors_indices=neighbors.indices,
             neighbors_indptr=neighbors.indptr,
             lwt=self.lwt.tel[telid],
         )
-        peak_index = average_wfs.argmax(axis=-1)
+        peak_index = np.moveaxis(average_wfs, 0, pixel_axis).argmax(axis=-1)
         charge, peak_time = extract_around_peak(
             waveforms,
             peak_index,
@@ -598,6 +671,10 @@ class NeighborPeakWindowSum(ImageExtractor):
             charge *= self._calculate_correction(telid=telid)[selected_gain_channel]
         return charge, peak_time
 
+    def extract_batch(self, waveforms, telid, selected_gain_channel):
+        # all steps broadcast over the event axis
+        return self(waveforms, telid, selected_gain_channel)
+
 
 class BaselineSubtractedNeighborPeakWindowSum(NeighborPeakWindowSum):
     """
@@ -617,6 +694,99 @@ class BaselineSubtractedNeighborPeakWindowSum(NeighborPeakWindowSum):
         return super().__call__(baseline_corrected, telid, selected_gain_channel)
 
 
+@njit
+def _two_pass_time_fit(
+    indices, indptr, pix_x, pix_y, charge, peak_time, core_threshold
+):
+    """
+    Steps 2 to 5 of `TwoPassWindowSum` on plain arrays:
+    tailcuts cleaning, selection of the main island, orientation of the
+    main axis from the image moments and fit of the pulse time vs. the
+    position along the main axis.
+
+    Gives the same results as `~ctapipe.image.tailcuts_clean`,
+    `~ctapipe.image.largest_island`, `~ctapipe.image.hillas_parameters` and
+    `~ctapipe.image.timing_parameters`, without creating any containers
+    or quantities.
+
+    Parameters
+    ----------
+    indices, indptr : ndarray
+        Sparse neighbor matrix of the camera in CSR format
+    pix_x, pix_y : ndarray
+        Pixel positions, the slope is returned in units of time per unit of these
+    charge : ndarray
+        Corrected charges of the 1st pass
+    peak_time : ndarray
+        Pulse times of the 1st pass as float64
+    core_threshold : float
+        Picture threshold of the cleaning, the boundary threshold is half of it
+
+    Returns
+    -------
+    image : ndarray
+        Charges of the pixels in the main island, 0 elsewhere
+    longitudinal : ndarray
+        Position of all pixels along the main axis
+    slope, intercept : float
+        Parameters of the time fit, NaN if the 2nd pass must be skipped
+    """
+    n_pixels = len(charge)
+    longitudinal = np.full(n_pixels, np.nan)
+
+    mask = _tailcuts_clean_sparse(
+        indices, indptr, charge, core_threshold, core_threshold / 2, False, 1
+    )
+    image = np.where(mask, charge, 0.0)
+
+    # keep only the biggest island, the first one in case of equal sizes
+    num_islands, labels = _num_islands_sparse_indices(indices, indptr, mask)
+    if num_islands > 0:
+        island_sizes = np.zeros(num_islands + 1, dtype=np.int64)
+        for pixel in range(n_pixels):
+            if labels[pixel] > 0:
+                island_sizes[labels[pixel]] += 1
+
+        biggest = np.argmax(island_sizes)
+        for pixel in range(n_pixels):
+            if labels[pixel] != biggest:
+                image[pixel] = 0
+
+    # too few pixels or no non-core pixels, the 1st pass is kept
+    if np.count_nonzero(image) < 3 or np.all(image >= core_threshold):
+        return image, longitudinal, np.nan, np.nan
+
+    size = np.sum(image)
+    cog_x = np.sum(image * pix_x) / size
+    cog_y = np.sum(image * pix_y) / size
+    delta_x = pix_x - cog_x
+    delta_y = pix_y - cog_y
+
+    # weighted covariance, as np.cov(delta_x, delta_y, aweights=image, ddof=0)
+    dx = delta_x - np.sum(image * delta_x) / size
+    dy = delta_y - np.sum(image * delta_y) / size
+    cov = np.empty((2, 2))
+    cov[0, 0] = np.sum(image * dx * dx) / size
+    cov[1, 1] = np.sum(image * dy * dy) / size
+    cov[0, 1] = cov[1, 0] = np.sum(image * dx * dy) / size
+    eig_vals, eig_vecs = np.linalg.eigh(cov)
+
+    # zero length, the main axis is undefined
+    if abs(eig_vals[1]) <= HILLAS_ATOL:
+        return image, longitudinal, np.nan, np.nan
+
+    vx, vy = eig_vecs[0, 1], eig_vecs[1, 1]
+    if vx != 0:
+        psi = np.arctan(vy / vx)
+    else:
+        psi = np.pi / 2
+
+    longitudinal = delta_x * np.cos(psi) + delta_y * np.sin(psi)
+    beta, _ = lts_linear_regression(longitudinal, peak_time, samples=5)
+
+    return image, longitudinal, beta[0], beta[1]
+
+
 class TwoPassWindowSum(ImageExtractor):
     """Extractor based on [1]_ which integrates the waveform a second time using
     a time-gradient linear fit. This is in particular the version implemented
@@ -832,76 +1002,36 @@ class TwoPassWindowSum(ImageExtractor):
         core_th = self.core_threshold.tel[telid]
         # Boundary thresholds will be half of core thresholds.
 
-        # Preliminary image cleaning with simple two-level tail-cut
-        camera_geometry = self.subarray.tel[telid].camera.geometry
-        mask_1 = tailcuts_clean(
-            camera_geometry,
+        # STEPS 2 to 5
+
+        # Preliminary image cleaning with simple two-level tail-cut,
+        # selection of the biggest island, parametrization of the image
+        # and linear fit of pulse time vs. distance along major image axis,
+        # all compiled and working on plain arrays.
+        # If the resulting image has less than 3 pixels, all its pixels are
+        # above the core threshold or the fit fails, the slope is NaN and
+        # we return the 1st pass information.
+        # NOTE: In the first case, the image was not bright enough and should
+        # not be used, in the second case, it is actually very bright.
+        camera = self.subarray.compiled_geometry(telid)
+        image_2, long, slope, intercept = _two_pass_time_fit(
+            camera.indices,
+            camera.indptr,
+            camera.pix_x,
+            camera.pix_y,
             charge_1stpass,
-            picture_thresh=core_th,
-            boundary_thresh=core_th / 2,
-            keep_isolated_pixels=False,
-            min_number_picture_neighbors=1,
+            pulse_time_1stpass.astype(np.float64),
+            core_th,
         )
-        image_1 = charge_1stpass.copy()
-        image_1[~mask_1] = 0
-
-        # STEP 3
-
-        # find all islands using this cleaning
-        num_islands, labels = number_of_islands(camera_geometry, mask_1)
-        if num_islands == 0:
-            image_2 = image_1.copy()  # no islands = image unchanged
-        else:
-            # ...find the biggest one
-            mask_biggest = largest_island(labels)
-            image_2 = image_1.copy()
-            image_2[~mask_biggest] = 0
+        if np.isnan(slope):
+            return charge_1stpass, pulse_time_1stpass
 
         # Indexes of pixels that will need the 2nd pass
         non_core_pixels_ids = np.where(image_2 < core_th)[0]
         non_core_pixels_mask = image_2 < core_th
 
-        # STEP 4
-
-        # if the resulting image has less then 3 pixels
-        # or there are more than 3 pixels but all contain a number of
-        # photoelectrons above the core threshold
-        if np.count_nonzero(image_2) < 3:
-            # we return the 1st pass information
-            # NOTE: In this case, the image was not bright enough!
-            # We should label it as "bad and NOT use it"
-            return charge_1stpass, pulse_time_1stpass
-        elif len(non_core_pixels_ids) == 0:
-            # Since all reconstructed charges are above the core threshold,
-            # there is no need to perform the 2nd pass.
-            # We return the 1st pass information.
-            # NOTE: In this case, even if this is 1st pass information,
-            # the image is actually very bright! We should label it as "good"!
-            return charge_1stpass, pulse_time_1stpass
-
-        # otherwise we proceed by parametrizing the image
-        hillas = hillas_parameters(camera_geometry, image_2)
-
-        # STEP 5
-
-        # linear fit of pulse time vs. distance along major image axis
-        # using only the main island surviving the preliminary
-        # image cleaning
-        timing = timing_parameters(camera_geometry, image_2, pulse_time_1stpass, hillas)
-
-        # If the fit returns nan
-        if np.isnan(timing.slope):
-            return charge_1stpass, pulse_time_1stpass
-
-        # get projected distances along main image axis
-        long, _ = camera_to_shower_coordinates(
-            camera_geometry.pix_x, camera_geometry.pix_y, hillas.x, hillas.y, hillas.psi
-        )
-
         # get the predicted times as a linear relation
-        predicted_pulse_times = (
-            timing.slope * long[non_core_pixels_ids] + timing.intercept
-        )
+        predicted_pulse_times = slope * long[non_core_pixels_ids] + intercept
 
         predicted_peaks = np.zeros(len(predicted_pulse_times))
 
@@ -910,7 +1040,7 @@ class TwoPassWindowSum(ImageExtractor):
         # Approximate the value obtained to nearest integer, then cast to
         # int64 otherwise 'extract_around_peak' complains.
         sampling_rate = self.sampling_rate[telid]
-        np.rint(predicted_pulse_times.value * sampling_rate, predicted_peaks)
+        np.rint(predicted_pulse_times * sampling_rate, predicted_peaks)
         predicted_peaks = predicted_peaks.astype(np.int64)
 
         # Due to the fit these peak indexes can now be also outside of the
@@ -8,14 +8,34 @@ import astropy.units as u
 import numpy as np
 from astropy.coordinates import Angle
 from astropy.units import Quantity
+from scipy.special import binom
 from ..containers import HillasParametersContainer
 
 
 HILLAS_ATOL = np.finfo(np.float64).eps
 
+# powers (p, q) of x^p * y^q for the rows of CameraGeometry.pixel_moment_matrix
+MOMENT_POWERS = [
+    (1, 0),
+    (0, 1),
+    (2, 0),
+    (1, 1),
+    (0, 2),
+    (3, 0),
+    (2, 1),
+    (1, 2),
+    (0, 3),
+    (4, 0),
+    (3, 1),
+    (2, 2),
+    (1, 3),
+    (0, 4),
+]
+
 
 __all__ = [
     "hillas_parameters",
+    "hillas_parameters_batch",
     "HillasParameterizationError",
 ]
 
@@ -211,3 +231,143 @@ def hillas_parameters(geom, image):
         skewness=skewness_long,
         kurtosis=kurtosis_long,
     )
+
+
+def _central_moments(raw_moments, cog_x, cog_y):
+    """
+    Convert the raw moments E[x^p y^q] (columns ordered as `MOMENT_POWERS`)
+    of many images into central moments E[(x - cog_x)^p (y - cog_y)^q]
+    using the binomial expansion. Returns a dict (p, q) -> array.
+    """
+    raw = {(0, 0): 1.0}
+    raw.update(zip(MOMENT_POWERS, raw_moments.T))
+
+    central = {}
+    for p, q in MOMENT_POWERS:
+        moment = 0.0
+        for i in range(p + 1):
+            for j in range(q + 1):
+                coefficient = binom(p, i) * binom(q, j)
+                shift = (-cog_x) ** (p - i) * (-cog_y) ** (q - j)
+                moment = moment + coefficient * shift * raw[i, j]
+        central[p, q] = moment
+    return central
+
+
+def hillas_parameters_batch(geom, images, masks=None):
+    """
+    Compute the Hillas parameters of many images of the same camera at once.
+
+    Instead of looping over the images, all raw moments up to 4th order
+    of all images are obtained by a single product with
+    `~ctapipe.instrument.CameraGeometry.pixel_moment_matrix`
+    and converted into the Hillas parameters with vectorized operations.
+    The results agree with `hillas_parameters` up to floating point rounding.
+
+    Parameters
+    ----------
+    geom: ctapipe.instrument.CameraGeometry
+        Camera geometry
+    images: array_like
+        Charge in each pixel, shape (n_images, n_pixels)
+    masks: array_like or None
+        Pixels used for each image, e.g. the cleaning masks,
+        shape (n_images, n_pixels). If None, all pixels are used.
+
+    Returns
+    -------
+    dict
+        Mapping of the fields of `~ctapipe.containers.HillasParametersContainer`
+        to arrays of length n_images, with units for lengths and angles.
+        All values are NaN for images with an intensity of 0.
+    """
+    unit = geom.pix_x.unit
+    images = np.asanyarray(images, dtype=np.float64)
+    if masks is not None:
+        images = np.where(masks, images, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        size = images.sum(axis=1)
+        size = np.where(size == 0, np.nan, size)
+
+        raw_moments = (images @ geom.pixel_moment_matrix.T) / size[:, np.newaxis]
+        cog_x = raw_moments[:, 0]
+        cog_y = raw_moments[:, 1]
+        moments = _central_moments(raw_moments, cog_x, cog_y)
+
+        cov = np.empty((len(images), 2, 2))
+        cov[:, 0, 0] = moments[2, 0]
+        cov[:, 1, 1] = moments[0, 2]
+        cov[:, 0, 1] = cov[:, 1, 0] = moments[1, 1]
+
+        # images with size 0 are excluded, eigh does not accept nans
+        valid = np.isfinite(size)
+        eig_vals = np.full((len(images), 2), np.nan)
+        eig_vecs = np.full((len(images), 2, 2), np.nan)
+        eig_vals[valid], eig_vecs[valid] = np.linalg.eigh(cov[valid])
+
+        eig_vals[np.isclose(eig_vals, 0, atol=HILLAS_ATOL)] = 0
+        width = np.sqrt(eig_vals[:, 0])
+        length = np.sqrt(eig_vals[:, 1])
+
+        vx, vy = eig_vecs[:, 0, 1], eig_vecs[:, 1, 1]
+        psi = np.where(vx != 0, np.arctan(vy / vx), np.pi / 2)
+        psi[(length == 0) | ~valid] = np.nan
+
+        # higher order moments along the shower axis
+        cos_psi = np.cos(psi)
+        sin_psi = np.sin(psi)
+        m3_long = (
+            cos_psi ** 3 * moments[3, 0]
+            + 3 * cos_psi ** 2 * sin_psi * moments[2, 1]
+            + 3 * cos_psi * sin_psi ** 2 * moments[1, 2]
+            + sin_psi ** 3 * moments[0, 3]
+        )
+        m4_long = (
+            cos_psi ** 4 * moments[4, 0]
+            + 4 * cos_psi ** 3 * sin_psi * moments[3, 1]
+            + 6 * cos_psi ** 2 * sin_psi ** 2 * moments[2, 2]
+            + 4 * cos_psi * sin_psi ** 3 * moments[1, 3]
+            + sin_psi ** 4 * moments[0, 4]
+        )
+        skewness_long = m3_long / length ** 3
+        kurtosis_long = m4_long / length ** 4
+
+        # uncertainties as in hillas_parameters, where the sums over the
+        # pixels are written as variances of quadratic forms of the moments
+        cos_2psi = np.cos(2 * psi)
+        a = (1 + cos_2psi) / 2
+        b = (1 - cos_2psi) / 2
+        c = np.sin(2 * psi)
+
+        def variance(a, b, c):
+            """ weighted variance of a * dx^2 + b * dy^2 + c * dx * dy """
+            mean = a * moments[2, 0] + b * moments[0, 2] + c * moments[1, 1]
+            mean_squared = (
+                a ** 2 * moments[4, 0]
+                + b ** 2 * moments[0, 4]
+                + (c ** 2 + 2 * a * b) * moments[2, 2]
+                + 2 * a * c * moments[3, 1]
+                + 2 * b * c * moments[1, 3]
+            )
+            return np.maximum(mean_squared - mean ** 2, 0)
+
+        length_uncertainty = np.sqrt(variance(a, b, c) / size) / (2 * length)
+        width_uncertainty = np.sqrt(variance(b, a, -c) / size) / (2 * width)
+        length_uncertainty[length == 0] = np.nan
+        width_uncertainty[width == 0] = np.nan
+
+    return {
+        "intensity": size,
+        "x": u.Quantity(cog_x, unit),
+        "y": u.Quantity(cog_y, unit),
+        "r": u.Quantity(np.hypot(cog_x, cog_y), unit),
+        "phi": Angle(np.arctan2(cog_y, cog_x), unit=u.rad),
+        "length": u.Quantity(length, unit),
+        "length_uncertainty": u.Quantity(length_uncertainty, unit),
+        "width": u.Quantity(width, unit),
+        "width_uncertainty": u.Quantity(width_uncertainty, unit),
+        "psi": Angle(psi, unit=u.rad),
+        "skewness": skewness_long,
+        "kurtosis": kurtosis_long,
+    }
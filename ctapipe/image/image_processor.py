@@ -1,27 +1,12 @@
 """
 High level image processing  (ImageProcessor Component)
 """
-
-
-from ..containers import (
-    ArrayEventContainer,
-    ImageParametersContainer,
-    IntensityStatisticsContainer,
-    PeakTimeStatisticsContainer,
-    TimingParametersContainer,
-)
+from ..containers import ArrayEventContainer, ImageParametersContainer
 from ..core import QualityQuery, TelescopeComponent
 from ..core.traits import List, create_class_enum_trait
 from ..instrument import SubarrayDescription
-from . import (
-    ImageCleaner,
-    concentration_parameters,
-    descriptive_statistics,
-    hillas_parameters,
-    leakage_parameters,
-    morphology_parameters,
-    timing_parameters,
-)
+from . import ImageCleaner
+from .parameters import image_parameters, image_parameters_to_container
 
 
 class ImageQualityQuery(QualityQuery):
@@ -104,8 +89,6 @@ class ImageProcessor(TelescopeComponent):
             cleaning mask, parameters
         """
 
-        tel = self.subarray.tel[tel_id]
-        geometry = tel.camera.geometry
         image_selected = image[signal_pixels]
 
         # check if image can be parameterized:
@@ -117,44 +100,9 @@ class ImageProcessor(TelescopeComponent):
 
         # parameterize the event if all criteria pass:
         if all(image_criteria):
-            geom_selected = geometry[signal_pixels]
-
-            hillas = hillas_parameters(geom=geom_selected, image=image_selected)
-            leakage = leakage_parameters(
-                geom=geometry, image=image, cleaning_mask=signal_pixels
-            )
-            concentration = concentration_parameters(
-                geom=geom_selected, image=image_selected, hillas_parameters=hillas
-            )
-            morphology = morphology_parameters(geom=geometry, image_mask=signal_pixels)
-            intensity_statistics = descriptive_statistics(
-                image_selected, container_class=IntensityStatisticsContainer
-            )
-
-            if peak_time is not None:
-                timing = timing_parameters(
-                    geom=geom_selected,
-                    image=image_selected,
-                    peak_time=peak_time[signal_pixels],
-                    hillas_parameters=hillas,
-                )
-                peak_time_statistics = descriptive_statistics(
-                    peak_time[signal_pixels],
-                    container_class=PeakTimeStatisticsContainer,
-                )
-            else:
-                timing = TimingParametersContainer()
-                peak_time_statistics = PeakTimeStatisticsContainer()
-
-            return ImageParametersContainer(
-                hillas=hillas,
-                timing=timing,
-                leakage=leakage,
-                morphology=morphology,
-                concentration=concentration,
-                intensity_statistics=intensity_statistics,
-                peak_time_statistics=peak_time_statistics,
-            )
+            camera = self.subarray.compiled_geometry(tel_id)
+            parameters = image_parameters(camera, image, signal_pixels, peak_time)
+            return image_parameters_to_container(parameters, unit=camera.unit)
 
         # return the default container (containing nan values) for no
         # parameterization
@@ -0,0 +1,377 @@
+"""
+Compiled computation of all DL1 image parameters of an image at once.
+
+`hillas_parameters`, `leakage_parameters`, `concentration_parameters`,
+`morphology_parameters`, `timing_parameters` and `descriptive_statistics`
+each build a sliced camera geometry, quantities and a container per image,
+which costs more than the actual computation.
+
+The functions in this module instead work on plain arrays: the camera
+is described by a `~ctapipe.instrument.CompiledCameraGeometry`, the
+parameters of an image are computed in a single compiled function and
+written into a record of
+`IMAGE_PARAMETERS_DTYPE`, lengths in the unit of the camera geometry
+and angles in radians. Units are only attached when converting
+a record into an `~ctapipe.containers.ImageParametersContainer`
+with `image_parameters_to_container`.
+"""
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import Angle
+from numba import njit
+
+from ..containers import ImageParametersContainer, StatisticsContainer
+from ..fitting import lts_linear_regression
+from .hillas import HILLAS_ATOL
+from .morphology import _num_islands_sparse_indices
+from .statistics import kurtosis, skewness
+from .timing import rmse
+
+__all__ = [
+    "IMAGE_PARAMETERS_DTYPE",
+    "empty_image_parameters",
+    "image_parameters",
+    "image_parameters_to_container",
+]
+
+
+def _parameter_fields():
+    """
+    (group, container class, [(column, field name, field), ...]) for each
+    group of parameters of `~ctapipe.containers.ImageParametersContainer`,
+    columns are named as in the written DL1 parameter tables
+    """
+    groups = []
+    for group, group_field in ImageParametersContainer.fields.items():
+        container_class = type(group_field.default)
+        prefix = container_class.container_prefix
+        fields = [
+            (f"{prefix}_{name}", name, field)
+            for name, field in container_class.fields.items()
+        ]
+        groups.append((group, container_class, fields))
+    return groups
+
+
+_PARAMETER_GROUPS = _parameter_fields()
+
+
+#: columns computed in float32 from the float32 images and peak times by the
+#: functions like `~ctapipe.image.descriptive_statistics`, kept as float32 to
+#: keep the dtypes of the DL1 parameter tables
+_FLOAT32_COLUMNS = {"leakage_intensity_width_1", "leakage_intensity_width_2"}
+
+
+def _column_dtype(column, container_class, field):
+    if isinstance(field.default, int):
+        return np.int64
+    if column in _FLOAT32_COLUMNS or issubclass(container_class, StatisticsContainer):
+        return np.float32
+    return np.float64
+
+
+#: dtype of the image parameter records, one column per parameter
+#: of `~ctapipe.containers.ImageParametersContainer`, named like the
+#: columns of the DL1 parameter tables, e.g. ``hillas_intensity``
+IMAGE_PARAMETERS_DTYPE = np.dtype(
+    [
+        (column, _column_dtype(column, container_class, field))
+        for _, container_class, fields in _PARAMETER_GROUPS
+        for column, _, field in fields
+    ]
+)
+
+
+def empty_image_parameters(n_images=None):
+    """
+    Image parameter records filled with the default values of the containers,
+    a single record if ``n_images`` is None, otherwise an array of records.
+    """
+    parameters = np.empty(1 if n_images is None else n_images, IMAGE_PARAMETERS_DTYPE)
+    for _, _, fields in _PARAMETER_GROUPS:
+        for column, _, field in fields:
+            parameters[column] = getattr(field.default, "value", field.default)
+
+    if n_images is None:
+        return parameters[0]
+    return parameters
+
+
+@njit
+def _fill_image_parameters(
+    out,
+    index,
+    pix_x,
+    pix_y,
+    border_1,
+    border_2,
+    indices,
+    indptr,
+    image,
+    mask,
+    peak_time,
+):
+    """
+    Compute all image parameters of ``image[mask]`` and store them in ``out[index]``.
+    Timing and peak time parameters are only computed if ``peak_time``
+    is not empty. Nothing is written if the intensity of the image is 0.
+    """
+    params = out[index]
+    selected = np.where(mask)[0]
+    x = pix_x[selected]
+    y = pix_y[selected]
+    weights = image[selected].astype(np.float64)
+
+    size = np.sum(weights)
+    if size == 0:
+        return
+
+    # hillas parameters
+    cog_x = np.sum(weights * x) / size
+    cog_y = np.sum(weights * y) / size
+    delta_x = x - cog_x
+    delta_y = y - cog_y
+
+    # weighted covariance, as np.cov(delta_x, delta_y, aweights=weights, ddof=0)
+    dx = delta_x - np.sum(weights * delta_x) / size
+    dy = delta_y - np.sum(weights * delta_y) / size
+    cov = np.empty((2, 2))
+    cov[0, 0] = np.sum(weights * dx * dx) / size
+    cov[1, 1] = np.sum(weights * dy * dy) / size
+    cov[0, 1] = cov[1, 0] = np.sum(weights * dx * dy) / size
+
+    eig_vals, eig_vecs = np.linalg.eigh(cov)
+    for i in range(2):
+        if abs(eig_vals[i]) <= HILLAS_ATOL:
+            eig_vals[i] = 0
+    width = np.sqrt(eig_vals[0])
+    length = np.sqrt(eig_vals[1])
+
+    if length == 0:
+        psi = skewness_long = kurtosis_long = np.nan
+        longitudinal = np.full(len(selected), np.nan)
+        transverse = np.full(len(selected), np.nan)
+    else:
+        vx, vy = eig_vecs[0, 1], eig_vecs[1, 1]
+        if vx != 0:
+            psi = np.arctan(vy / vx)
+        else:
+            psi = np.pi / 2
+
+        cos_psi = np.cos(psi)
+        sin_psi = np.sin(psi)
+        longitudinal = delta_x * cos_psi + delta_y * sin_psi
+        transverse = -delta_x * sin_psi + delta_y * cos_psi
+
+        skewness_long = np.sum(weights * longitudinal ** 3) / size / length ** 3
+        kurtosis_long = np.sum(weights * longitudinal ** 4) / size / length ** 4
+
+    cos_2psi = np.cos(2 * psi)
+    a = (1 + cos_2psi) / 2
+    b = (1 - cos_2psi) / 2
+    c = np.sin(2 * psi)
+    A = (delta_x ** 2 - cov[0, 0]) / size
+    B = (delta_y ** 2 - cov[1, 1]) / size
+    C = (delta_x * delta_y - cov[0, 1]) / size
+
+    params.hillas_intensity = size
+    params.hillas_x = cog_x
+    params.hillas_y = cog_y
+    params.hillas_r = np.sqrt(cog_x ** 2 + cog_y ** 2)
+    params.hillas_phi = np.arctan2(cog_y, cog_x)
+    params.hillas_length = length
+    params.hillas_width = width
+    params.hillas_psi = psi
+    params.hillas_skewness = skewness_long
+    params.hillas_kurtosis = kurtosis_long
+
+    if length == 0:
+        params.hillas_length_uncertainty = np.nan
+    else:
+        params.hillas_length_uncertainty = np.sqrt(
+            np.sum((a * A + b * B + c * C) ** 2 * weights)
+        ) / (2 * length)
+
+    if width == 0:
+        params.hillas_width_uncertainty = np.nan
+    else:
+        params.hillas_width_uncertainty = np.sqrt(
+            np.sum((b * A + a * B - c * C) ** 2 * weights)
+        ) / (2 * width)
+
+    # leakage
+    n_pixels = len(image)
+    n_border_1 = 0
+    n_border_2 = 0
+    intensity_border_1 = 0.0
+    intensity_border_2 = 0.0
+    for i in range(len(selected)):
+        if border_1[selected[i]]:
+            n_border_1 += 1
+            intensity_border_1 += weights[i]
+        if border_2[selected[i]]:
+            n_border_2 += 1
+            intensity_border_2 += weights[i]
+
+    params.leakage_pixels_width_1 = n_border_1 / n_pixels
+    params.leakage_pixels_width_2 = n_border_2 / n_pixels
+    params.leakage_intensity_width_1 = intensity_border_1 / size
+    params.leakage_intensity_width_2 = intensity_border_2 / size
+
+    # concentration
+    cog_pixels = np.argsort(delta_x ** 2 + delta_y ** 2)
+    params.concentration_cog = np.sum(weights[cog_pixels[:3]]) / size
+    if width != 0:
+        in_ellipse = (longitudinal ** 2 / length ** 2) + (
+            transverse ** 2 / width ** 2
+        ) <= 1.0
+        params.concentration_core = np.sum(weights[in_ellipse]) / size
+    else:
+        params.concentration_core = 0.0
+    params.concentration_pixel = np.max(weights) / size
+
+    # morphology
+    num_islands, labels = _num_islands_sparse_indices(indices, indptr, mask)
+    island_sizes = np.zeros(num_islands + 1, dtype=np.int64)
+    for label in labels:
+        if label > 0:
+            island_sizes[label] += 1
+
+    n_small = n_medium = n_large = 0
+    for island_size in island_sizes[1:]:
+        if island_size <= 2:
+            n_small += 1
+        elif island_size > 50:
+            n_large += 1
+        else:
+            n_medium += 1
+
+    params.morphology_num_pixels = len(selected)
+    params.morphology_num_islands = num_islands
+    params.morphology_num_small_islands = n_small
+    params.morphology_num_medium_islands = n_medium
+    params.morphology_num_large_islands = n_large
+
+    # intensity statistics
+    mean = np.mean(weights)
+    std = np.std(weights)
+    params.intensity_max = np.max(weights)
+    params.intensity_min = np.min(weights)
+    params.intensity_mean = mean
+    params.intensity_std = std
+    params.intensity_skewness = skewness(weights, mean, std)
+    params.intensity_kurtosis = kurtosis(weights, mean, std)
+
+    if len(peak_time) == 0:
+        return
+
+    # timing parameters
+    if np.any(weights < 0):
+        raise ValueError("The non-masked pixels must verify signal >= 0")
+
+    times = peak_time[selected].astype(np.float64)
+    if length != 0:
+        beta, _ = lts_linear_regression(longitudinal, times, samples=5)
+        params.timing_slope = beta[0]
+        params.timing_intercept = beta[1]
+        params.timing_deviation = rmse(longitudinal * beta[0] + beta[1], times)
+
+    # peak time statistics
+    mean = np.mean(times)
+    std = np.std(times)
+    params.peak_time_max = np.max(times)
+    params.peak_time_min = np.min(times)
+    params.peak_time_mean = mean
+    params.peak_time_std = std
+    params.peak_time_skewness = skewness(times, mean, std)
+    params.peak_time_kurtosis = kurtosis(times, mean, std)
+
+
+def image_parameters(camera, image, mask, peak_time=None, out=None, index=0):
+    """
+    Compute all DL1 image parameters of the pixels of ``image`` selected by
+    ``mask``, the unit-free equivalent of calling `hillas_parameters`,
+    `leakage_parameters`, `concentration_parameters`, `morphology_parameters`,
+    `timing_parameters` and `descriptive_statistics`.
+
+    Parameters
+    ----------
+    camera: ctapipe.instrument.CompiledCameraGeometry
+        Camera description, e.g. from
+        `~ctapipe.instrument.SubarrayDescription.compiled_geometry`
+    image: np.ndarray
+        Pixel values
+    mask: np.ndarray[bool]
+        Pixels surviving the cleaning
+    peak_time: np.ndarray or None
+        Pulse times of the pixels. If None, the timing and peak time
+        parameters keep their default values.
+    out: np.ndarray or None
+        Preallocated array of records of `IMAGE_PARAMETERS_DTYPE`
+        to store the parameters in, e.g. from `empty_image_parameters`
+    index: int
+        Index of the record in ``out`` to store the parameters in
+
+    Returns
+    -------
+    np.void
+        Record with the parameters. Lengths are in ``camera.unit``, angles in
+        radians. If the intensity of the image is 0, the default values are kept.
+    """
+    if out is None:
+        out = empty_image_parameters(1)
+        index = 0
+
+    if peak_time is None:
+        peak_time = np.empty(0)
+
+    _fill_image_parameters(
+        out,
+        index,
+        camera.pix_x,
+        camera.pix_y,
+        camera.border_1,
+        camera.border_2,
+        camera.indices,
+        camera.indptr,
+        image,
+        np.asanyarray(mask, dtype=np.bool_),
+        peak_time,
+    )
+    return out[index]
+
+
+def _with_unit(value, field_unit, unit):
+    if field_unit is None:
+        return value
+
+    if field_unit.is_equivalent(u.rad):
+        return Angle(value, u.rad)
+
+    # lengths and inverse lengths are stored in the unit of the camera
+    return u.Quantity(value, unit ** field_unit.powers[0])
+
+
+def image_parameters_to_container(parameters, unit=u.m):
+    """
+    Convert an image parameter record into an
+    `~ctapipe.containers.ImageParametersContainer`, attaching units.
+
+    Parameters
+    ----------
+    parameters: np.void
+        Record of `IMAGE_PARAMETERS_DTYPE`, e.g. returned by `image_parameters`
+    unit: astropy.units.Unit
+        Length unit of the record, ``CompiledCameraGeometry.unit``
+    """
+    return ImageParametersContainer(
+        **{
+            group: container_class(
+                **{
+                    name: _with_unit(parameters[column], field.unit, unit)
+                    for column, name, field in fields
+                }
+            )
+            for group, container_class, fields in _PARAMETER_GROUPS
+        }
+    )
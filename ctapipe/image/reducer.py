@@ -3,6 +3,7 @@ Algorithms for the data volume reduction.
 """
 from abc import abstractmethod
 import numpy as np
+from numba import njit
 from ctapipe.image import TailcutsImageCleaner
 from ctapipe.core import TelescopeComponent
 from ctapipe.core.traits import IntTelescopeParameter, BoolTelescopeParameter, Unicode
@@ -12,11 +13,43 @@ from ctapipe.image.cleaning import dilate
 __all__ = ["DataVolumeReducer", "NullDataVolumeReducer", "TailCutsDataVolumeReducer"]
 
 
+@njit
+def _dilate_within(indices, indptr, mask, allowed):
+    """
+    Add all ``allowed`` pixels connected to ``mask`` through ``allowed`` pixels,
+    the same as repeating ``mask = dilate(geom, mask) & allowed``
+    until no pixels are added.
+    """
+    n_pixels = len(mask)
+    reached = mask.copy()
+    stack = np.empty(n_pixels, dtype=np.int64)
+    n_stack = 0
+    for pixel in range(n_pixels):
+        if mask[pixel]:
+            stack[n_stack] = pixel
+            n_stack += 1
+
+    while n_stack > 0:
+        n_stack -= 1
+        pixel = stack[n_stack]
+        for neighbor in indices[indptr[pixel] : indptr[pixel + 1]]:
+            if allowed[neighbor] and not reached[neighbor]:
+                reached[neighbor] = True
+                stack[n_stack] = neighbor
+                n_stack += 1
+
+    return reached & allowed
+
+
 class DataVolumeReducer(TelescopeComponent):
     """
     Base component for data volume reducers.
     """
 
+    # False if the reducer never removes any data, the waveforms
+    # can then be used as DL0 data without applying the mask
+    reduces_data_volume = True
+
     def __init__(self, subarray, config=None, parent=None, **kwargs):
         """
         Parameters
@@ -90,6 +123,8 @@ class NullDataVolumeReducer(DataVolumeReducer):
     Perform no data volume reduction
     """
 
+    reduces_data_volume = False
+
     def select_pixels(self, waveforms, telid=None, selected_gain_channel=None):
         mask = waveforms != 0
         return mask
@@ -176,16 +211,14 @@ class TailCutsDataVolumeReducer(DataVolumeReducer):
         pixels_above_boundary_thresh = (
             charge >= self.cleaner.boundary_threshold_pe.tel[telid]
         )
-        mask_in_loop = np.array([])
         # 2) Step: Add iteratively all pixels with Signal
         #          S > boundary_thresh with ctapipe module
         #          'dilate' until no new pixels were added.
-        while (
-            not np.array_equal(mask, mask_in_loop)
-            and self.do_boundary_dilation.tel[telid]
-        ):
-            mask_in_loop = mask
-            mask = dilate(camera_geom, mask) & pixels_above_boundary_thresh
+        if self.do_boundary_dilation.tel[telid]:
+            camera = self.subarray.compiled_geometry(telid)
+            mask = _dilate_within(
+                camera.indices, camera.indptr, mask, pixels_above_boundary_thresh
+            )
 
         # 3) Step: Adding Pixels with 'dilate' to get more conservative.
         for _ in range(self.n_end_dilates.tel[telid]):
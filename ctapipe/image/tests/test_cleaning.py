@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 from ctapipe.image import cleaning
 from ctapipe.instrument import CameraGeometry
@@ -153,6 +154,38 @@ def test_tailcuts_clean_min_neighbors_1():
         assert (result == mask).all()
 
 
+@pytest.mark.parametrize("keep_isolated_pixels", [False, True])
+@pytest.mark.parametrize("min_number_picture_neighbors", [0, 1, 2])
+def test_tailcuts_clean_sparse(keep_isolated_pixels, min_number_picture_neighbors):
+    """ the compiled version gives the same masks as tailcuts_clean """
+    geom = CameraGeometry.from_name("LSTCam")
+    neighbors = geom.neighbor_matrix_sparse
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        image = rng.exponential(3, geom.n_pixels)
+
+        mask = cleaning._tailcuts_clean_sparse(
+            neighbors.indices,
+            neighbors.indptr,
+            image,
+            8.0,
+            4.0,
+            keep_isolated_pixels,
+            min_number_picture_neighbors,
+        )
+        expected = cleaning.tailcuts_clean(
+            geom,
+            image,
+            picture_thresh=8.0,
+            boundary_thresh=4.0,
+            keep_isolated_pixels=keep_isolated_pixels,
+            min_number_picture_neighbors=min_number_picture_neighbors,
+        )
+        assert np.count_nonzero(expected) > 0
+        assert (mask == expected).all()
+
+
 def test_tailcuts_clean_min_neighbors_2():
     """ requiring that picture pixels have at least two neighbors above
     picture_thresh"""
@@ -277,3 +310,66 @@ def test_apply_time_delta_cleaning():
     test_mask = mask.copy()
     test_mask[neighbours] = 0
     assert (test_mask == td_mask).all()
+
+
+def test_compiled_cleanings_match_sparse_products():
+    """ the compiled cleanings agree with their sparse matrix formulation """
+    geom = CameraGeometry.from_name("LSTCam")
+    neighbors = geom.neighbor_matrix_sparse
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        image = rng.exponential(3, geom.n_pixels)
+        peak_time = rng.normal(20, 4, geom.n_pixels)
+
+        # mars: tailcuts followed by one more row of boundary pixels
+        tailcuts = cleaning.tailcuts_clean(geom, image, 8, 4)
+        above_boundary = image >= 4
+        expected = (above_boundary & neighbors.dot(tailcuts)) | (
+            tailcuts & neighbors.dot(above_boundary)
+        )
+        mask = cleaning.mars_cleaning_1st_pass(geom, image, 8, 4)
+        assert (mask == expected).all()
+
+        # time delta: remove pixels with too few neighbors in time
+        expected = mask.copy()
+        for pixel in np.where(mask)[0]:
+            time_diff = np.abs(peak_time[neighbors[pixel].indices] - peak_time[pixel])
+            if np.count_nonzero(time_diff < 3) < 2:
+                expected[pixel] = False
+
+        result = cleaning.apply_time_delta_cleaning(geom, mask, peak_time, 2, 3)
+        assert (result == expected).all()
+        assert np.count_nonzero(result) < np.count_nonzero(mask)
+
+
+def test_batch_cleaning():
+    """ batch cleanings agree with cleaning each image """
+    geom = CameraGeometry.from_name("LSTCam")
+    rng = np.random.default_rng(0)
+    images = rng.exponential(3, (5, geom.n_pixels))
+    times = rng.normal(20, 4, (5, geom.n_pixels))
+
+    # one picture threshold per image
+    picture = np.array([6, 7, 8, 9, 10])[:, np.newaxis]
+
+    masks = cleaning.tailcuts_clean_batch(
+        geom, images, picture, 4, min_number_picture_neighbors=2
+    )
+    mars = cleaning.mars_cleaning_1st_pass_batch(geom, images, picture, 4)
+    fact = cleaning.fact_image_cleaning_batch(geom, images, times, picture, 4)
+    dilated = cleaning.dilate_batch(geom, masks)
+    assert masks.shape == images.shape
+
+    for i, (image, time) in enumerate(zip(images, times)):
+        mask = cleaning.tailcuts_clean(
+            geom, image, picture[i, 0], 4, min_number_picture_neighbors=2
+        )
+        assert (masks[i] == mask).all()
+        assert (dilated[i] == cleaning.dilate(geom, mask)).all()
+
+        mask = cleaning.mars_cleaning_1st_pass(geom, image, picture[i, 0], 4)
+        assert (mars[i] == mask).all()
+
+        mask = cleaning.fact_image_cleaning(geom, image, time, picture[i, 0], 4)
+        assert (fact[i] == mask).all()
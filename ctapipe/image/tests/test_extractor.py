@@ -16,6 +16,14 @@ from ctapipe.image.extractor import (
     NeighborPeakWindowSum,
     TwoPassWindowSum,
     FullWaveformSum,
+    _two_pass_time_fit,
+)
+from ctapipe.image import (
+    tailcuts_clean,
+    number_of_islands,
+    largest_island,
+    hillas_parameters,
+    timing_parameters,
 )
 from ctapipe.image.toymodel import WaveformModel
 from ctapipe.instrument import SubarrayDescription, TelescopeDescription
@@ -264,6 +272,25 @@ def test_extractors(Extractor, toymodel):
     assert_allclose(peak_time, true_time, rtol=0.1)
 
 
+@pytest.mark.parametrize("Extractor", non_abstract_children(ImageExtractor))
+def test_extract_batch(Extractor, toymodel):
+    waveforms, subarray, telid, selected_gain_channel, _, _ = toymodel
+    extractor = Extractor(subarray=subarray)
+
+    # different events, by scaling and shifting the toy waveforms
+    stack = np.stack([waveforms, 0.5 * waveforms, np.roll(waveforms, 5, axis=-1)])
+    gains = np.stack([selected_gain_channel] * len(stack))
+    charge, peak_time = extractor.extract_batch(stack, telid, gains)
+
+    assert charge.shape == peak_time.shape == stack.shape[:-1]
+    for i, event_waveforms in enumerate(stack):
+        expected_charge, expected_peak_time = extractor(
+            event_waveforms, telid, selected_gain_channel
+        )
+        assert_allclose(charge[i], expected_charge)
+        assert_allclose(peak_time[i], expected_peak_time)
+
+
 @pytest.mark.parametrize("Extractor", extractors)
 def test_integration_correction_off(Extractor, toymodel):
     # full waveform extractor does not have an integration correction
@@ -317,6 +344,51 @@ def test_two_pass_window_sum(subarray):
         assert_allclose(pulse_time, true_time, rtol=0.1)
 
 
+def test_two_pass_time_fit(subarray):
+    """ the compiled steps 2-5 agree with the python image functions """
+    telid = 1
+    geometry = subarray.tel[telid].camera.geometry
+    neighbors = geometry.neighbor_matrix_sparse
+    pix_x = geometry.pix_x.to_value(u.m)
+    pix_y = geometry.pix_y.to_value(u.m)
+
+    # elongated shower with a time gradient along its main axis
+    rng = np.random.default_rng(0)
+    long = (pix_x - 0.02) * np.cos(0.5) + (pix_y + 0.01) * np.sin(0.5)
+    trans = -(pix_x - 0.02) * np.sin(0.5) + (pix_y + 0.01) * np.cos(0.5)
+    charge = 200 * np.exp(-0.5 * ((long / 0.03) ** 2 + (trans / 0.008) ** 2))
+    charge += rng.normal(0, 1, geometry.n_pixels)
+    peak_time = 20 + 300 * long + rng.normal(0, 0.5, geometry.n_pixels)
+
+    image, longitudinal, slope, intercept = _two_pass_time_fit(
+        neighbors.indices, neighbors.indptr, pix_x, pix_y, charge, peak_time, 8.0
+    )
+
+    mask = tailcuts_clean(
+        geometry,
+        charge,
+        picture_thresh=8.0,
+        boundary_thresh=4.0,
+        keep_isolated_pixels=False,
+        min_number_picture_neighbors=1,
+    )
+    _, labels = number_of_islands(geometry, mask)
+    expected_image = np.where(largest_island(labels), charge, 0)
+    assert_equal(image, expected_image)
+    assert np.count_nonzero(image < 8) > 0
+
+    hillas = hillas_parameters(geometry, expected_image)
+    timing = timing_parameters(geometry, expected_image, peak_time, hillas)
+    assert_allclose(slope, timing.slope.to_value(1 / u.m), rtol=1e-6)
+    assert_allclose(intercept, timing.intercept, rtol=1e-6)
+
+    # too few pixels survive the cleaning, the 1st pass is kept
+    _, _, slope, _ = _two_pass_time_fit(
+        neighbors.indices, neighbors.indptr, pix_x, pix_y, charge, peak_time, 1e4
+    )
+    assert np.isnan(slope)
+
+
 def test_waveform_extractor_factory(toymodel):
     waveforms, subarray, telid, selected_gain_channel, true_charge, true_time = toymodel
     extractor = ImageExtractor.from_name("LocalPeakWindowSum", subarray=subarray)
@@ -1,6 +1,10 @@
 from ctapipe.instrument import CameraGeometry
 from ctapipe.image import tailcuts_clean, toymodel
-from ctapipe.image.hillas import hillas_parameters, HillasParameterizationError
+from ctapipe.image.hillas import (
+    hillas_parameters,
+    hillas_parameters_batch,
+    HillasParameterizationError,
+)
 from ctapipe.containers import HillasParametersContainer
 from astropy.coordinates import Angle
 from astropy import units as u
@@ -268,3 +272,30 @@ def test_single_pixel():
     assert hillas.length.value == 0
     assert hillas.width.value == 0
     assert np.isnan(hillas.psi)
+
+
+def test_hillas_batch():
+    """ batch parameters agree with hillas_parameters applied to each image """
+    images = []
+    masks = []
+    for psi in ("-30d", "0d", "45d", "90d", "120d"):
+        geom, image, clean_mask = create_sample_image(psi)
+        images.append(image)
+        masks.append(clean_mask)
+
+    # an empty image
+    images.append(np.zeros_like(image))
+    masks.append(np.zeros_like(clean_mask))
+
+    result = hillas_parameters_batch(geom, np.array(images), np.array(masks))
+
+    for i, (image, mask) in enumerate(zip(images[:-1], masks[:-1])):
+        expected = hillas_parameters(geom[mask], image[mask])
+        for key, value in expected.items():
+            assert u.Quantity(result[key][i]).unit == u.Quantity(value).unit
+            assert u.Quantity(result[key][i]).value == approx(
+                u.Quantity(value).value, rel=1e-6
+            ), key
+
+    for key, values in result.items():
+        assert np.isnan(u.Quantity(values[-1]).value), key
@@ -46,6 +46,15 @@ def test_image_cleaner(method):
     # algorithm tests, see test_cleaning.py
     assert np.count_nonzero(mask) > 0
 
+    # cleaning a stack of images gives the same masks
+    masks = clean.clean_batch(
+        tel_id=1, images=np.array([image, image[::-1]]), arrival_times=[times, times]
+    )
+    assert (masks[0] == mask).all()
+    assert (
+        masks[1] == clean(tel_id=1, image=image[::-1], arrival_times=times)
+    ).all()
+
 
 @pytest.mark.parametrize("method", ImageCleaner.non_abstract_subclasses().keys())
 def test_image_cleaner_no_subarray(method):
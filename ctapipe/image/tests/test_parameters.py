@@ -0,0 +1,103 @@
+import astropy.units as u
+import numpy as np
+from numpy.testing import assert_allclose
+
+from ctapipe.containers import (
+    ImageParametersContainer,
+    IntensityStatisticsContainer,
+    PeakTimeStatisticsContainer,
+)
+from ctapipe.image import (
+    IMAGE_PARAMETERS_DTYPE,
+    concentration_parameters,
+    descriptive_statistics,
+    empty_image_parameters,
+    hillas_parameters,
+    image_parameters,
+    image_parameters_to_container,
+    leakage_parameters,
+    morphology_parameters,
+    tailcuts_clean,
+    timing_parameters,
+    toymodel,
+)
+from ctapipe.instrument import CameraGeometry, CompiledCameraGeometry
+
+
+def test_dtype_matches_containers():
+    params = ImageParametersContainer()
+    columns = []
+    for container in params.values():
+        columns.extend(container.as_dict(add_prefix=True).keys())
+
+    assert list(IMAGE_PARAMETERS_DTYPE.names) == columns
+    # same dtypes as the parameters computed from float32 images
+    assert IMAGE_PARAMETERS_DTYPE["intensity_mean"] == np.float32
+    assert IMAGE_PARAMETERS_DTYPE["peak_time_std"] == np.float32
+    assert IMAGE_PARAMETERS_DTYPE["leakage_intensity_width_1"] == np.float32
+    assert IMAGE_PARAMETERS_DTYPE["hillas_intensity"] == np.float64
+
+    defaults = empty_image_parameters()
+    assert np.isnan(defaults["hillas_intensity"])
+    assert defaults["morphology_num_pixels"] == -1
+    assert empty_image_parameters(5).shape == (5,)
+
+
+def test_image_parameters():
+    """ compiled parameters agree with the python functions """
+    geom = CameraGeometry.from_name("LSTCam")
+    rng = np.random.default_rng(0)
+
+    model = toymodel.Gaussian(
+        x=0.2 * u.m, y=0.3 * u.m, width=0.05 * u.m, length=0.15 * u.m, psi="-30d"
+    )
+    np.random.seed(10)
+    image, _, _ = model.generate_image(geom, intensity=1500, nsb_level_pe=3)
+    mask = tailcuts_clean(geom, image, 10, 5)
+
+    longitudinal = (geom.pix_x - 0.2 * u.m) * np.cos(-30 * u.deg) + (
+        geom.pix_y - 0.3 * u.m
+    ) * np.sin(-30 * u.deg)
+    peak_time = 20 + 10 * longitudinal.to_value(u.m) + rng.normal(0, 0.5, len(image))
+
+    camera = CompiledCameraGeometry.from_geometry(geom)
+    parameters = image_parameters(camera, image, mask, peak_time)
+    result = image_parameters_to_container(parameters, unit=camera.unit)
+
+    hillas = hillas_parameters(geom[mask], image[mask])
+    expected = ImageParametersContainer(
+        hillas=hillas,
+        timing=timing_parameters(geom[mask], image[mask], peak_time[mask], hillas),
+        leakage=leakage_parameters(geom, image, mask),
+        concentration=concentration_parameters(geom[mask], image[mask], hillas),
+        morphology=morphology_parameters(geom, mask),
+        intensity_statistics=descriptive_statistics(
+            image[mask], container_class=IntensityStatisticsContainer
+        ),
+        peak_time_statistics=descriptive_statistics(
+            peak_time[mask], container_class=PeakTimeStatisticsContainer
+        ),
+    )
+
+    for group, container in expected.items():
+        for name, value in container.items():
+            assert_allclose(
+                u.Quantity(result[group][name]).si.value,
+                u.Quantity(value).si.value,
+                rtol=1e-5,
+                atol=1e-10,
+                err_msg=f"{group}.{name}",
+            )
+
+    # without peak times, the timing parameters keep their defaults
+    parameters = image_parameters(camera, image, mask)
+    assert np.isnan(parameters["timing_slope"])
+    assert np.isnan(parameters["peak_time_mean"])
+    assert parameters["hillas_intensity"] == result.hillas.intensity
+
+    # filling preallocated records
+    out = empty_image_parameters(3)
+    image_parameters(camera, image, mask, peak_time, out=out, index=1)
+    assert np.isnan(out["hillas_intensity"][[0, 2]]).all()
+    assert out["hillas_intensity"][1] == result.hillas.intensity
+    assert out["timing_slope"][1] == result.timing.slope.value
@@ -2,6 +2,7 @@ import numpy as np
 from ctapipe.image import (
     neg_log_likelihood,
     neg_log_likelihood_approx,
+    neg_log_likelihood_pixels,
     mean_poisson_likelihood_gaussian,
     chi_squared,
     mean_poisson_likelihood_full,
@@ -80,3 +81,22 @@ def test_full_likelihood():
     # Check thats in large signal case the full expectation is equal to the
     # gaussian approximation (to 5%)
     assert np.all(np.abs((full_like_large - gaus_like_large) / full_like_large) < 0.05)
+
+
+def test_neg_log_likelihood_pixels():
+    """ compiled per-pixel likelihood agrees with the numpy implementation """
+    spe = 0.5
+    pedestal = 1
+
+    image = np.array([0.0, 1.0, 2.0, 40.0, 50.0, 60.0])
+    expectation = np.array([1.0, 1.0, 1.0, 50.0, 50.0, 50.0])
+    like = neg_log_likelihood_pixels(
+        image, expectation, spe, np.full(len(image), pedestal)
+    )
+
+    assert like.shape == image.shape
+    assert np.isclose(like.sum(), neg_log_likelihood(image, expectation, spe, pedestal))
+    assert np.isclose(
+        like[3:].sum(),
+        neg_log_likelihood_approx(image[3:], expectation[3:], spe, pedestal),
+    )
@@ -1,4 +1,10 @@
-from .camera import CameraDescription, CameraGeometry, CameraReadout, PixelShape
+from .camera import (
+    CameraDescription,
+    CameraGeometry,
+    CameraReadout,
+    CompiledCameraGeometry,
+    PixelShape,
+)
 from .atmosphere import get_atmosphere_profile_functions
 from .telescope import TelescopeDescription
 from .optics import OpticsDescription
@@ -10,6 +16,7 @@ __all__ = [
     "CameraDescription",
     "CameraGeometry",
     "CameraReadout",
+    "CompiledCameraGeometry",
     "get_atmosphere_profile_functions",
     "TelescopeDescription",
     "OpticsDescription",
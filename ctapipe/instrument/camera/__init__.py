@@ -1,10 +1,16 @@
 from .description import CameraDescription
-from .geometry import CameraGeometry, UnknownPixelShapeWarning, PixelShape
+from .geometry import (
+    CameraGeometry,
+    CompiledCameraGeometry,
+    UnknownPixelShapeWarning,
+    PixelShape,
+)
 from .readout import CameraReadout
 
 __all__ = [
     "CameraDescription",
     "CameraGeometry",
+    "CompiledCameraGeometry",
     "PixelShape",
     "UnknownPixelShapeWarning",
     "CameraReadout",
@@ -4,6 +4,7 @@ Utilities for reading or working with Camera geometry files
 """
 import logging
 import warnings
+from collections import namedtuple
 from typing import TypeVar
 
 import numpy as np
@@ -20,7 +21,7 @@ from ctapipe.utils import get_table_dataset
 from ctapipe.utils.linalg import rotation_matrix_2d
 from enum import Enum, unique
 
-__all__ = ["CameraGeometry", "UnknownPixelShapeWarning"]
+__all__ = ["CameraGeometry", "CompiledCameraGeometry", "UnknownPixelShapeWarning"]
 
 logger = logging.getLogger(__name__)
 CG = TypeVar("CG", bound="CameraGeometry")  # for forward-referencing type hints
@@ -805,5 +806,62 @@ class CameraGeometry:
             raise ValueError(f"Unknown pixel_shape {pixel_shape}") from None
 
 
+class CompiledCameraGeometry(
+    namedtuple(
+        "CompiledCameraGeometry",
+        [
+            "pix_x",
+            "pix_y",
+            "pix_area",
+            "pixel_width",
+            "border_1",
+            "border_2",
+            "indices",
+            "indptr",
+            "unit",
+        ],
+    )
+):
+    """
+    Unit-free, precomputed description of a `CameraGeometry` for
+    compiled image processing code.
+
+    Pixel positions, areas and widths are plain float64 arrays in ``unit``
+    (areas in ``unit**2``), ``border_1`` and ``border_2`` are the masks of
+    `CameraGeometry.get_border_pixel_mask` for widths 1 and 2, and
+    ``indices``, ``indptr`` describe the sparse neighbor matrix in CSR format.
+
+    Use `~ctapipe.instrument.SubarrayDescription.compiled_geometry` to get
+    the cached instance of a telescope.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_geometry(cls, geometry):
+        """ Precompute the arrays of a `CameraGeometry` """
+        unit = geometry.pix_x.unit
+        neighbors = geometry.neighbor_matrix_sparse
+
+        def to_array(quantity, unit):
+            return np.asanyarray(quantity.to_value(unit), dtype=np.float64)
+
+        return cls(
+            pix_x=to_array(geometry.pix_x, unit),
+            pix_y=to_array(geometry.pix_y, unit),
+            pix_area=to_array(geometry.pix_area, unit ** 2),
+            pixel_width=to_array(geometry.pixel_width, unit),
+            border_1=geometry.get_border_pixel_mask(1),
+            border_2=geometry.get_border_pixel_mask(2),
+            indices=neighbors.indices,
+            indptr=neighbors.indptr,
+            unit=unit,
+        )
+
+    @property
+    def n_pixels(self):
+        return len(self.pix_x)
+
+
 class UnknownPixelShapeWarning(UserWarning):
     pass
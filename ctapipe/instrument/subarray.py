@@ -4,7 +4,7 @@ Description of Arrays or Subarrays of telescopes
 
 __all__ = ["SubarrayDescription"]
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 
 import numpy as np
@@ -18,8 +18,14 @@ from copy import copy
 import ctapipe
 
 from ..coordinates import GroundFrame, CameraFrame
+from ..coordinates.ground_frames import get_shower_trans_matrix
 from .telescope import TelescopeDescription
-from .camera import CameraDescription, CameraReadout, CameraGeometry
+from .camera import (
+    CameraDescription,
+    CameraReadout,
+    CameraGeometry,
+    CompiledCameraGeometry,
+)
 from .optics import OpticsDescription
 
 
@@ -52,6 +58,11 @@ class SubarrayDescription:
         dict mapping tel_id to index in array attributes
     """
 
+    #: number of pointings for which `tilted_positions` are cached
+    tilted_cache_size = 32
+    #: pointings closer than this (in rad) share the cached `tilted_positions`
+    tilted_cache_tolerance = 1e-6
+
     def __init__(self, name, tel_positions=None, tel_descriptions=None):
         self.name = name
         self.positions = tel_positions or dict()
@@ -105,6 +116,91 @@ class SubarrayDescription:
                 )
             )
 
+    @lazyproperty
+    def _compiled_geometries(self):
+        # by tel_id and by CameraGeometry, to share them between telescopes
+        return {}, {}
+
+    def compiled_geometry(self, tel_id):
+        """
+        Unit-free, precomputed arrays of the camera geometry of a telescope,
+        see `~ctapipe.instrument.CompiledCameraGeometry`.
+        They are computed on first access and shared by all telescopes
+        with the same camera geometry.
+
+        Parameters
+        ----------
+        tel_id: int
+            telescope id
+
+        Returns
+        -------
+        CompiledCameraGeometry
+        """
+        by_tel_id, by_geometry = self._compiled_geometries
+        if tel_id not in by_tel_id:
+            geometry = self.tel[tel_id].camera.geometry
+            if geometry not in by_geometry:
+                by_geometry[geometry] = CompiledCameraGeometry.from_geometry(geometry)
+            by_tel_id[tel_id] = by_geometry[geometry]
+
+        return by_tel_id[tel_id]
+
+    @lazyproperty
+    def _tilted_cache(self):
+        return OrderedDict()
+
+    def tilted_positions(self, altitude, azimuth):
+        """
+        Positions of all telescopes in the
+        `~ctapipe.coordinates.TiltedGroundFrame` of a pointing direction,
+        together with the transformation matrix of
+        `~ctapipe.coordinates.ground_frames.get_shower_trans_matrix`.
+
+        As the pointing changes rarely, the results of the last
+        ``tilted_cache_size`` pointings are cached. Pointings closer than
+        ``tilted_cache_tolerance`` share the same cache entry.
+
+        Parameters
+        ----------
+        altitude: u.Quantity[angle]
+            altitude of the pointing direction of the tilted frame
+        azimuth: u.Quantity[angle]
+            azimuth of the pointing direction of the tilted frame
+
+        Returns
+        -------
+        trans: np.ndarray
+            read-only 3x3 transformation matrix from the ground into the tilted frame
+        positions: np.ndarray
+            read-only x and y in m of the telescopes in the tilted frame,
+            shape (n_tels, 2), in the order of `tel_ids`
+        """
+        altitude = u.Quantity(altitude, u.rad).to_value(u.rad)
+        azimuth = u.Quantity(azimuth, u.rad).to_value(u.rad) % (2 * np.pi)
+        key = (
+            round(altitude / self.tilted_cache_tolerance),
+            round(azimuth / self.tilted_cache_tolerance),
+        )
+
+        cache = self._tilted_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        trans = get_shower_trans_matrix(azimuth, altitude)
+        ground = u.Quantity([self.positions[tel_id] for tel_id in self.tel]).to_value(
+            u.m
+        )
+        positions = ground @ trans[:2].T
+        trans.setflags(write=False)
+        positions.setflags(write=False)
+
+        cache[key] = trans, positions
+        if len(cache) > self.tilted_cache_size:
+            cache.popitem(last=False)
+        return trans, positions
+
     @lazyproperty
     def tel_coords(self):
         """ returns telescope positions as astropy.coordinates.SkyCoord"""
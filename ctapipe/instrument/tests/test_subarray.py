@@ -2,11 +2,12 @@
 import tempfile
 import numpy as np
 from astropy import units as u
-from astropy.coordinates import SkyCoord
-from ctapipe.coordinates import TelescopeFrame
+from astropy.coordinates import AltAz, SkyCoord
+from ctapipe.coordinates import TelescopeFrame, TiltedGroundFrame
 
 from ctapipe.instrument import (
     CameraDescription,
+    CompiledCameraGeometry,
     OpticsDescription,
     SubarrayDescription,
     TelescopeDescription,
@@ -62,6 +63,53 @@ def test_subarray_description():
     assert sub.telescope_types[0] == sub.tel[1]
 
 
+def test_compiled_geometry():
+    """ compiled geometries are cached and shared between equal cameras """
+    sub = example_subarray(3)
+    compiled = sub.compiled_geometry(1)
+    geometry = sub.tel[1].camera.geometry
+
+    assert isinstance(compiled, CompiledCameraGeometry)
+    assert sub.compiled_geometry(1) is compiled
+    assert sub.compiled_geometry(2) is compiled
+
+    assert compiled.n_pixels == geometry.n_pixels
+    assert compiled.unit == geometry.pix_x.unit
+    assert np.all(compiled.pix_x == geometry.pix_x.value)
+    assert np.all(compiled.pix_area == geometry.pix_area.to_value(compiled.unit ** 2))
+    assert np.all(compiled.border_2 == geometry.get_border_pixel_mask(2))
+    assert np.all(compiled.indptr == geometry.neighbor_matrix_sparse.indptr)
+
+
+def test_tilted_positions():
+    """ tilted positions agree with the frame transformation and are cached """
+    sub = example_subarray(4)
+    altitude, azimuth = 70 * u.deg, 20 * u.deg
+
+    trans, positions = sub.tilted_positions(altitude, azimuth)
+    tilted = sub.tel_coords.transform_to(
+        TiltedGroundFrame(
+            pointing_direction=SkyCoord(alt=altitude, az=azimuth, frame=AltAz())
+        )
+    )
+    assert positions.shape == (4, 2)
+    assert np.allclose(positions[:, 0], tilted.x.to_value(u.m))
+    assert np.allclose(positions[:, 1], tilted.y.to_value(u.m))
+    assert not positions.flags.writeable
+
+    # same pointing within the tolerance and azimuth wrapped
+    assert sub.tilted_positions(altitude, azimuth)[1] is positions
+    close, _ = sub.tilted_positions(altitude + 1e-8 * u.rad, azimuth - 360 * u.deg)
+    assert close is trans
+    assert sub.tilted_positions(71 * u.deg, azimuth)[1] is not positions
+
+    # bounded cache, least recently used entries are dropped
+    sub.tilted_cache_size = 2
+    sub.tilted_positions(72 * u.deg, azimuth)
+    assert len(sub._tilted_cache) == 2
+    assert sub.tilted_positions(altitude, azimuth)[1] is not positions
+
+
 def test_to_table(example_subarray):
     """ Check that we can generate astropy Tables from the SubarrayDescription """
     sub = example_subarray
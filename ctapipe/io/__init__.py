@@ -6,6 +6,8 @@ from .tableio import TableWriter, TableReader
 from .datalevels import DataLevel
 from .astropy_helpers import h5_table_to_astropy as read_table
 from .dl1writer import DL1Writer
+from .dl1reader import read_dl1_parameters
+from .sharedmemory import SharedMemoryEventTransport
 
 from ..core.plugins import detect_and_import_io_plugins
 
@@ -30,4 +32,6 @@ __all__ = [
     "DataLevel",
     "read_table",
     "DL1Writer",
+    "read_dl1_parameters",
+    "SharedMemoryEventTransport",
 ]
@@ -6,6 +6,7 @@ from ctapipe.instrument import SubarrayDescription
 from ctapipe.io.eventsource import EventSource
 from ctapipe.io import HDF5TableReader
 from ctapipe.io.datalevels import DataLevel
+from ctapipe.io.dl1index import read_event_index
 from ctapipe.containers import (
     ConcentrationContainer,
     ArrayEventContainer,
@@ -29,6 +30,22 @@ logger = logging.getLogger(__name__)
 COMPATIBLE_DL1_VERSIONS = ["v1.0.0", "v1.0.1", "v1.0.2"]
 
 
+def _event_row_ranges(table):
+    """
+    Build a mapping of (obs_id, event_id) to the (start, stop) range of
+    rows belonging to that event in a table written in event order,
+    e.g. the telescope trigger table.
+
+    Uses the event index stored in the sidecar file if available,
+    see `ctapipe.io.dl1index`.
+    """
+    index = read_event_index(table)
+    return {
+        (obs_id, event_id): (start, stop)
+        for obs_id, event_id, start, stop in index.tolist()
+    }
+
+
 class DL1EventSource(EventSource):
     """
     Event source for files in the ctapipe DL1 format.
@@ -66,8 +83,12 @@ class DL1EventSource(EventSource):
         Whether the file contains simulated camera images and/or
         image parameters evaluated on these.
 
+    Prefetching events in a background thread is not supported,
+    as PyTables is not thread-safe.
     """
 
+    supports_prefetch = False
+
     def __init__(self, input_url, config=None, parent=None, **kwargs):
         """
         EventSource for dl1 files in the standard DL1 data format
@@ -94,6 +115,14 @@ class DL1EventSource(EventSource):
             "CTA PRODUCT DATA MODEL VERSION"
         ]
 
+        # lookup tables, created on first use
+        self._array_pointing_finder = None
+        self._tel_pointing_finder = None
+        self._tel_trigger_ranges = None
+        self._telescope_row_ranges = {}
+        self._event_id_rows = None
+        self._row_reader = None
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
@@ -189,16 +218,43 @@ class DL1EventSource(EventSource):
                 mc_headers[row["obs_id"]] = next(reader)
         return mc_headers
 
-    def _generate_events(self):
-        """
-        Yield ArrayEventContainer to iterate through events.
-        """
+    def _new_event_container(self):
+        """ create an ArrayEventContainer with the metadata of this source """
         data = ArrayEventContainer()
         # Maybe take some other metadata, but there are still some 'unknown'
         # written out by the stage1 tool
         data.meta["origin"] = self.file_.root._v_attrs["CTA PROCESS TYPE"]
         data.meta["input_url"] = self.input_url
         data.meta["max_events"] = self.max_events
+        return data
+
+    @staticmethod
+    def _parameter_containers():
+        return [
+            HillasParametersContainer(),
+            TimingParametersContainer(),
+            LeakageContainer(),
+            ConcentrationContainer(),
+            MorphologyContainer(),
+            IntensityStatisticsContainer(),
+            PeakTimeStatisticsContainer(),
+        ]
+
+    @staticmethod
+    def _simulated_parameter_containers():
+        return [
+            HillasParametersContainer(),
+            LeakageContainer(),
+            ConcentrationContainer(),
+            MorphologyContainer(),
+            IntensityStatisticsContainer(),
+        ]
+
+    def _generate_events(self):
+        """
+        Yield ArrayEventContainer to iterate through events.
+        """
+        data = self._new_event_container()
 
         if DataLevel.DL1_IMAGES in self.datalevels:
             image_iterators = {
@@ -219,15 +275,7 @@ class DL1EventSource(EventSource):
             param_readers = {
                 tel.name: HDF5TableReader(self.file_).read(
                     f"/dl1/event/telescope/parameters/{tel.name}",
-                    containers=[
-                        HillasParametersContainer(),
-                        TimingParametersContainer(),
-                        LeakageContainer(),
-                        ConcentrationContainer(),
-                        MorphologyContainer(),
-                        IntensityStatisticsContainer(),
-                        PeakTimeStatisticsContainer(),
-                    ],
+                    containers=self._parameter_containers(),
                     prefixes=True,
                 )
                 for tel in self.file_.root.dl1.event.telescope.parameters
@@ -236,13 +284,7 @@ class DL1EventSource(EventSource):
                 simulated_param_readers = {
                     tel.name: HDF5TableReader(self.file_).read(
                         f"/simulation/event/telescope/parameters/{tel.name}",
-                        containers=[
-                            HillasParametersContainer(),
-                            LeakageContainer(),
-                            ConcentrationContainer(),
-                            MorphologyContainer(),
-                            IntensityStatisticsContainer(),
-                        ],
+                        containers=self._simulated_parameter_containers(),
                         prefixes=True,
                     )
                     for tel in self.file_.root.dl1.event.telescope.parameters
@@ -261,43 +303,17 @@ class DL1EventSource(EventSource):
             "/dl1/event/subarray/trigger", [TriggerContainer(), EventIndexContainer()]
         )
 
-        array_pointing_finder = IndexFinder(
-            self.file_.root.dl1.monitoring.subarray.pointing.col("time")
-        )
-
-        tel_pointing_finder = {
-            tel.name: IndexFinder(tel.col("time"))
-            for tel in self.file_.root.dl1.monitoring.telescope.pointing
-        }
-
-        for counter, array_event in enumerate(events):
+        for counter, (trigger, index) in enumerate(events):
             data.dl1.tel.clear()
             data.simulation.tel.clear()
             data.pointing.tel.clear()
             data.trigger.tel.clear()
 
             data.count = counter
-            data.trigger, data.index = next(events)
-            data.trigger.tels_with_trigger = (
-                np.where(data.trigger.tels_with_trigger)[0] + 1
-            )  # +1 to match array index to telescope id
-
-            # Maybe there is a simpler way  to do this
-            # Beware: tels_with_trigger contains all triggered telescopes whereas
-            # the telescope trigger table contains only the subset of
-            # allowed_tels given during the creation of the dl1 file
-            for i in self.file_.root.dl1.event.telescope.trigger.where(
-                f"(obs_id=={data.index.obs_id}) & (event_id=={data.index.event_id})"
-            ):
-                if self.allowed_tels and i["tel_id"] not in self.allowed_tels:
-                    continue
-                if self.datamodel_version == "v1.0.0":
-                    data.trigger.tel[i["tel_id"]].time = i["telescopetrigger_time"]
-                else:
-                    data.trigger.tel[i["tel_id"]].time = i["time"]
-
-            self._fill_array_pointing(data, array_pointing_finder)
-            self._fill_telescope_pointing(data, tel_pointing_finder)
+            data.trigger, data.index = trigger, index
+            self._fill_trigger(data)
+            self._fill_array_pointing(data)
+            self._fill_telescope_pointing(data)
 
             if self.is_simulation:
                 data.simulation.shower = next(mc_shower_reader)
@@ -316,9 +332,7 @@ class DL1EventSource(EventSource):
                         )
                         continue
                     image_row = next(image_iterators[f"tel_{tel:03d}"])
-                    dl1.image = image_row["image"]
-                    dl1.peak_time = image_row["peak_time"]
-                    dl1.image_mask = image_row["image_mask"]
+                    self._fill_image(dl1, image_row)
 
                     if self.has_simulated_dl1:
                         if f"tel_{tel:03d}" not in simulated_image_iterators.keys():
@@ -340,17 +354,8 @@ class DL1EventSource(EventSource):
                             "from the parameters table."
                         )
                         continue
-                    # Is there a smarter way to unpack this?
-                    # Best would probbaly be if we could directly read
-                    # into the ImageParametersContainer
                     params = next(param_readers[f"tel_{tel:03d}"])
-                    dl1.parameters.hillas = params[0]
-                    dl1.parameters.timing = params[1]
-                    dl1.parameters.leakage = params[2]
-                    dl1.parameters.concentration = params[3]
-                    dl1.parameters.morphology = params[4]
-                    dl1.parameters.intensity_statistics = params[5]
-                    dl1.parameters.peak_time_statistics = params[6]
+                    self._fill_parameters(dl1, params)
 
                     if self.has_simulated_dl1:
                         if f"tel_{tel:03d}" not in param_readers.keys():
@@ -363,23 +368,202 @@ class DL1EventSource(EventSource):
                         simulated_params = next(
                             simulated_param_readers[f"tel_{tel:03d}"]
                         )
-                        simulated.true_parameters.hillas = simulated_params[0]
-                        simulated.true_parameters.leakage = simulated_params[1]
-                        simulated.true_parameters.concentration = simulated_params[2]
-                        simulated.true_parameters.morphology = simulated_params[3]
-                        simulated.true_parameters.intensity_statistics = simulated_params[
-                            4
-                        ]
+                        self._fill_simulated_parameters(simulated, simulated_params)
 
             yield data
 
-    def _fill_array_pointing(self, data, array_pointing_finder):
+    def _get_event_by_index(self, index):
+        """
+        Read the event at the given position in the file directly,
+        without iterating through the preceding events.
+        Used by `~ctapipe.io.EventSeeker`.
+
+        Returns a new `~ctapipe.containers.ArrayEventContainer` on each call.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Event index {index} not found in file")
+        return self._read_event(index)
+
+    def _get_event_by_id(self, event_id):
+        """
+        Read the (first) event with the given event_id directly.
+        Used by `~ctapipe.io.EventSeeker`.
+
+        Returns a new `~ctapipe.containers.ArrayEventContainer` on each call.
+        """
+        if self._event_id_rows is None:
+            event_ids = self.file_.root.dl1.event.subarray.trigger.col("event_id")
+            # return_index gives the first occurrence of each event_id
+            unique_ids, rows = np.unique(event_ids, return_index=True)
+            self._event_id_rows = dict(zip(unique_ids.tolist(), rows.tolist()))
+
+        if event_id not in self._event_id_rows:
+            raise IndexError(f"Event id {event_id} not found in file")
+        return self._read_event(self._event_id_rows[event_id])
+
+    def _read_event(self, row):
+        """
+        Read the array event in the given row of the subarray trigger table
+        and look up the rows of the triggered telescopes in the per-telescope
+        tables using their (obs_id, event_id) row index.
+        """
+        data = self._new_event_container()
+        data.count = row
+        data.trigger, data.index = self._read_row(
+            "/dl1/event/subarray/trigger",
+            [TriggerContainer(), EventIndexContainer()],
+            row,
+        )
+        self._fill_trigger(data)
+        self._fill_array_pointing(data)
+        self._fill_telescope_pointing(data)
+
+        if self.is_simulation:
+            data.simulation.shower = self._read_row(
+                "/simulation/event/subarray/shower",
+                SimulatedShowerContainer(),
+                row,
+                prefixes="true",
+            )
+
+        key = (int(data.index.obs_id), int(data.index.event_id))
+        for tel in data.trigger.tel.keys():
+            if self.allowed_tels and tel not in self.allowed_tels:
+                continue
+
+            table_name = f"tel_{tel:03d}"
+            dl1 = data.dl1.tel[tel]
+
+            if DataLevel.DL1_IMAGES in self.datalevels:
+                path = f"/dl1/event/telescope/images/{table_name}"
+                tel_row = self._find_telescope_event_row(path, key)
+                if tel_row is not None:
+                    self._fill_image(dl1, self.file_.get_node(path)[tel_row])
+
+                path = f"/simulation/event/telescope/images/{table_name}"
+                tel_row = self._find_telescope_event_row(path, key)
+                if tel_row is not None:
+                    image_row = self.file_.get_node(path)[tel_row]
+                    data.simulation.tel[tel].true_image = image_row["true_image"]
+
+            if DataLevel.DL1_PARAMETERS in self.datalevels:
+                path = f"/dl1/event/telescope/parameters/{table_name}"
+                tel_row = self._find_telescope_event_row(path, key)
+                if tel_row is not None:
+                    params = self._read_row(
+                        path, self._parameter_containers(), tel_row, prefixes=True
+                    )
+                    self._fill_parameters(dl1, params)
+
+                path = f"/simulation/event/telescope/parameters/{table_name}"
+                tel_row = self._find_telescope_event_row(path, key)
+                if tel_row is not None:
+                    params = self._read_row(
+                        path,
+                        self._simulated_parameter_containers(),
+                        tel_row,
+                        prefixes=True,
+                    )
+                    self._fill_simulated_parameters(data.simulation.tel[tel], params)
+
+        return data
+
+    def _read_row(self, table_name, containers, row, prefixes=False):
+        """ read a single row of a table into new containers """
+        if self._row_reader is None:
+            self._row_reader = HDF5TableReader(self.file_)
+
+        return next(
+            self._row_reader.read(
+                table_name, containers, prefixes=prefixes, start=row, stop=row + 1
+            )
+        )
+
+    def _find_telescope_event_row(self, path, key):
+        """
+        Find the row of the event given by key=(obs_id, event_id) in the
+        telescope table at path. Returns None if the table does not exist
+        or has no row for the event.
+
+        The (obs_id, event_id) index of each table is built on first access.
+        """
+        if path not in self._telescope_row_ranges:
+            if path not in self.file_:
+                self._telescope_row_ranges[path] = {}
+            else:
+                table = self.file_.get_node(path)
+                self._telescope_row_ranges[path] = _event_row_ranges(table)
+
+        start, _ = self._telescope_row_ranges[path].get(key, (None, None))
+        return start
+
+    def _fill_trigger(self, data):
+        """
+        Convert the tels_with_trigger mask into telescope ids and fill the
+        telescope trigger information of the event
+        """
+        data.trigger.tels_with_trigger = (
+            np.where(data.trigger.tels_with_trigger)[0] + 1
+        )  # +1 to match array index to telescope id
+
+        tel_trigger_table = self.file_.root.dl1.event.telescope.trigger
+        if self._tel_trigger_ranges is None:
+            self._tel_trigger_ranges = _event_row_ranges(tel_trigger_table)
+
+        if self.datamodel_version == "v1.0.0":
+            time_col = "telescopetrigger_time"
+        else:
+            time_col = "time"
+
+        # Beware: tels_with_trigger contains all triggered telescopes whereas
+        # the telescope trigger table contains only the subset of
+        # allowed_tels given during the creation of the dl1 file
+        start, stop = self._tel_trigger_ranges.get(
+            (int(data.index.obs_id), int(data.index.event_id)), (0, 0)
+        )
+        for i in tel_trigger_table.read(start, stop):
+            if self.allowed_tels and i["tel_id"] not in self.allowed_tels:
+                continue
+            data.trigger.tel[i["tel_id"]].time = i[time_col]
+
+    @staticmethod
+    def _fill_image(dl1, image_row):
+        dl1.image = image_row["image"]
+        dl1.peak_time = image_row["peak_time"]
+        dl1.image_mask = image_row["image_mask"]
+
+    @staticmethod
+    def _fill_parameters(dl1, params):
+        # Is there a smarter way to unpack this?
+        # Best would probbaly be if we could directly read
+        # into the ImageParametersContainer
+        dl1.parameters.hillas = params[0]
+        dl1.parameters.timing = params[1]
+        dl1.parameters.leakage = params[2]
+        dl1.parameters.concentration = params[3]
+        dl1.parameters.morphology = params[4]
+        dl1.parameters.intensity_statistics = params[5]
+        dl1.parameters.peak_time_statistics = params[6]
+
+    @staticmethod
+    def _fill_simulated_parameters(simulated, params):
+        simulated.true_parameters.hillas = params[0]
+        simulated.true_parameters.leakage = params[1]
+        simulated.true_parameters.concentration = params[2]
+        simulated.true_parameters.morphology = params[3]
+        simulated.true_parameters.intensity_statistics = params[4]
+
+    def _fill_array_pointing(self, data):
         """
         Fill the array pointing information of a given event
         """
         # Only unique pointings are stored, so reader.read() wont work as easily
         # Thats why we match the pointings based on trigger time
-        closest_time_index = array_pointing_finder.closest(data.trigger.time)
+        if self._array_pointing_finder is None:
+            self._array_pointing_finder = IndexFinder(
+                self.file_.root.dl1.monitoring.subarray.pointing.col("time")
+            )
+        closest_time_index = self._array_pointing_finder.closest(data.trigger.time)
         array_pointing = self.file_.root.dl1.monitoring.subarray.pointing
         data.pointing.array_azimuth = u.Quantity(
             array_pointing[closest_time_index]["array_azimuth"],
@@ -398,18 +582,23 @@ class DL1EventSource(EventSource):
             array_pointing.attrs["array_dec_UNIT"],
         )
 
-    def _fill_telescope_pointing(self, data, tel_pointing_finder):
+    def _fill_telescope_pointing(self, data):
         """
         Fill the telescope pointing information of a given event
         """
         # Same comments as to _fill_array_pointing apply
+        if self._tel_pointing_finder is None:
+            self._tel_pointing_finder = {
+                tel.name: IndexFinder(tel.col("time"))
+                for tel in self.file_.root.dl1.monitoring.telescope.pointing
+            }
         for tel in data.trigger.tel.keys():
             if self.allowed_tels and tel not in self.allowed_tels:
                 continue
             tel_pointing_table = self.file_.root.dl1.monitoring.telescope.pointing[
                 f"tel_{tel:03d}"
             ]
-            closest_time_index = tel_pointing_finder[f"tel_{tel:03d}"].closest(
+            closest_time_index = self._tel_pointing_finder[f"tel_{tel:03d}"].closest(
                 data.trigger.tel[tel].time
             )
             pointing_telescope = tel_pointing_table
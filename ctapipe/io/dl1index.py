@@ -0,0 +1,208 @@
+"""
+Index tables for ctapipe DL1 files.
+
+Two kinds of indices are supported:
+
+- PyTables column indices (see `create_table_indices`), which speed up
+  in-kernel queries like ``table.where("event_id == 42")``
+- lightweight event indices (see `write_event_index`), which store the range
+  of rows belonging to each (obs_id, event_id) of a table written in
+  event order. They are stored in a sidecar file next to the DL1 file
+  (see `event_index_filename`), so the DL1 file itself is not modified,
+  and can be read without PyTables' indexing machinery,
+  e.g. by `~ctapipe.io.DL1EventSource`.
+
+Both can be created when writing a file with `~ctapipe.io.DL1Writer`
+or afterwards with the ``ctapipe-index-dl1`` tool.
+"""
+from pathlib import Path
+
+import numpy as np
+import tables
+
+__all__ = [
+    "DEFAULT_INDEX_KINDS",
+    "EVENT_INDEX_SUFFIX",
+    "event_index_filename",
+    "iter_tables",
+    "create_table_indices",
+    "compute_event_index",
+    "write_event_index",
+    "read_event_index",
+]
+
+# PyTables index kind for each indexed column
+DEFAULT_INDEX_KINDS = {"obs_id": "ultralight", "event_id": "medium", "tel_id": "medium"}
+
+# the event indices of <file> are stored in <file> + EVENT_INDEX_SUFFIX,
+# the index of the table at <path> at the same <path> in that file
+EVENT_INDEX_SUFFIX = ".index.h5"
+
+EVENT_INDEX_DTYPE = np.dtype(
+    [
+        ("obs_id", np.int64),
+        ("event_id", np.int64),
+        ("start", np.int64),
+        ("stop", np.int64),
+    ]
+)
+
+# number of rows read at once when computing event indices
+INDEX_CHUNK_SIZE = 100000
+
+
+def iter_tables(h5file, path):
+    """ Yield all tables at or below ``path`` in ``h5file``. """
+    node = h5file.get_node(path)
+    if isinstance(node, tables.Table):
+        yield node
+        return
+
+    yield from h5file.walk_nodes(node, classname="Table")
+
+
+def create_table_indices(table, kinds=None, optlevel=6):
+    """
+    Create PyTables indices for the columns of ``table``.
+    Existing indices of these columns are replaced.
+
+    Parameters
+    ----------
+    table: tables.Table
+        Table opened in a writable file
+    kinds: Dict[str, str]
+        Mapping of column name to PyTables index kind
+        ("ultralight", "light", "medium" or "full").
+        Columns not present in the table are ignored.
+        Defaults to `DEFAULT_INDEX_KINDS`.
+    optlevel: int
+        PyTables index optimization level (0-9)
+
+    Returns
+    -------
+    list[str]
+        names of the indexed columns
+    """
+    kinds = DEFAULT_INDEX_KINDS if kinds is None else kinds
+    indexed = []
+
+    for colname, kind in kinds.items():
+        if colname not in table.colnames:
+            continue
+
+        column = table.cols._f_col(colname)
+        if column.is_indexed:
+            column.remove_index()
+        column.create_index(kind=kind, optlevel=optlevel)
+        indexed.append(colname)
+
+    return indexed
+
+
+def compute_event_index(table, chunk_size=INDEX_CHUNK_SIZE):
+    """
+    Compute the range of rows belonging to each event in a table
+    written in event order, e.g. the telescope trigger or parameter tables.
+
+    Only the ``obs_id`` and ``event_id`` columns are read,
+    ``chunk_size`` rows at a time.
+
+    Returns
+    -------
+    np.ndarray
+        structured array with columns obs_id, event_id, start and stop,
+        one row per block of consecutive rows with the same (obs_id, event_id)
+    """
+    obs_ids = []
+    event_ids = []
+    starts = []
+    last_key = None
+
+    for chunk_start in range(0, table.nrows, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, table.nrows)
+        obs_id = table.read(chunk_start, chunk_stop, field="obs_id")
+        event_id = table.read(chunk_start, chunk_stop, field="event_id")
+
+        # rows where a new event starts
+        new_event = np.ones(len(obs_id), dtype=bool)
+        new_event[1:] = (obs_id[1:] != obs_id[:-1]) | (event_id[1:] != event_id[:-1])
+        if last_key == (obs_id[0], event_id[0]):
+            # event continues from the previous chunk
+            new_event[0] = False
+
+        rows = np.flatnonzero(new_event)
+        obs_ids.append(obs_id[rows])
+        event_ids.append(event_id[rows])
+        starts.append(rows + chunk_start)
+        last_key = (obs_id[-1], event_id[-1])
+
+    index = np.empty(sum(len(s) for s in starts), dtype=EVENT_INDEX_DTYPE)
+    if len(index) == 0:
+        return index
+
+    index["obs_id"] = np.concatenate(obs_ids)
+    index["event_id"] = np.concatenate(event_ids)
+    index["start"] = np.concatenate(starts)
+    index["stop"][:-1] = index["start"][1:]
+    index["stop"][-1] = table.nrows
+    return index
+
+
+def event_index_filename(filename):
+    """ Path of the sidecar file storing the event indices of ``filename`` """
+    filename = Path(filename)
+    return filename.with_name(filename.name + EVENT_INDEX_SUFFIX)
+
+
+def write_event_index(table, index=None, filters=None):
+    """
+    Store the event index of ``table`` in the sidecar file of its file,
+    replacing an existing one. The file of ``table`` is not modified,
+    so it may be opened read-only.
+
+    Parameters
+    ----------
+    table: tables.Table
+        Table to index
+    index: np.ndarray or None
+        Event index as returned by `compute_event_index`.
+        If None, it is computed from the table.
+    filters: tables.Filters or None
+        Compression of the index table, by default that of ``table``
+    """
+    if index is None:
+        index = compute_event_index(table)
+
+    path = table._v_pathname
+    with tables.open_file(event_index_filename(table._v_file.filename), "a") as f:
+        if path in f:
+            f.remove_node(path)
+
+        group, name = path.rsplit("/", 1)
+        index_table = f.create_table(
+            group or "/",
+            name,
+            obj=index,
+            filters=filters if filters is not None else table.filters,
+            createparents=True,
+        )
+        # to detect outdated indices, e.g. if rows were appended to the table
+        index_table.attrs.table_nrows = table.nrows
+
+
+def read_event_index(table):
+    """
+    Read the event index of ``table`` if it was stored with `write_event_index`,
+    otherwise compute it. See `compute_event_index` for the format.
+    """
+    path = table._v_pathname
+    filename = event_index_filename(table._v_file.filename)
+
+    if filename.exists():
+        with tables.open_file(filename, "r") as f:
+            if path in f:
+                index_table = f.get_node(path)
+                if getattr(index_table.attrs, "table_nrows", None) == table.nrows:
+                    return index_table.read()
+
+    return compute_event_index(table)
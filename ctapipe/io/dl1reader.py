@@ -0,0 +1,250 @@
+"""
+Columnar readers for tables in ctapipe DL1 files.
+
+In contrast to `~ctapipe.io.HDF5TableReader` and `~ctapipe.io.DL1EventSource`,
+which fill one `~ctapipe.core.Container` per row, the functions in this module
+read whole columns at once (in chunks of rows) and return them as
+`astropy.table.QTable` or numpy structured arrays.
+This is much faster when only the tabular data is needed, e.g.
+for training machine learning models or producing IRFs.
+"""
+from pathlib import Path
+
+import numpy as np
+import tables
+from astropy.table import QTable, vstack
+from astropy.units import Unit
+from numpy.lib.recfunctions import repack_fields
+
+__all__ = ["read_dl1_parameters"]
+
+PARAMETERS_GROUP = "/dl1/event/telescope/parameters"
+SHOWER_TABLE = "/simulation/event/subarray/shower"
+EVENT_KEYS = ["obs_id", "event_id"]
+
+# default number of rows read at once
+DEFAULT_CHUNK_SIZE = 100000
+
+
+def _read_columns(
+    table, columns=None, condition=None, start=None, stop=None, chunk_size=None
+):
+    """
+    Read the given columns of the rows in [start, stop) of a PyTables table
+    fulfilling the (optional) condition, ``chunk_size`` rows at a time,
+    into a single numpy structured array.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    start, stop, _ = slice(start, stop).indices(table.nrows)
+
+    if columns is not None:
+        missing = set(columns) - set(table.colnames)
+        if missing:
+            raise KeyError(f"Table {table._v_pathname} has no columns {missing}")
+        # keep the on-disk column order
+        columns = [col for col in table.colnames if col in columns]
+
+    chunks = []
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        if condition is None:
+            chunks.append(table.read(chunk_start, chunk_stop))
+        else:
+            chunks.append(
+                table.read_where(condition, start=chunk_start, stop=chunk_stop)
+            )
+
+        if columns is not None:
+            # only keep the selected columns, so the memory can be freed
+            chunks[-1] = repack_fields(chunks[-1][columns])
+
+    if len(chunks) == 0:
+        empty = np.empty(0, dtype=table.dtype)
+        return empty if columns is None else repack_fields(empty[columns])
+
+    return np.concatenate(chunks)
+
+
+def _event_keys(obs_id, event_id):
+    """ structured array of (obs_id, event_id), ordered like a lexsort """
+    keys = np.empty(len(obs_id), dtype=[("obs_id", np.int64), ("event_id", np.int64)])
+    keys["obs_id"] = obs_id
+    keys["event_id"] = event_id
+    return keys
+
+
+def _join_indices(left_obs_id, left_event_id, right_obs_id, right_event_id):
+    """
+    For each (obs_id, event_id) on the left, find the index of the row with the
+    same (obs_id, event_id) on the right. Rows without a match get -1.
+    """
+    if len(right_obs_id) == 0:
+        return np.full(len(left_obs_id), -1, dtype=np.int64)
+
+    # sort the right side once, then binary search all left rows
+    order = np.lexsort((right_event_id, right_obs_id))
+    right_keys = _event_keys(right_obs_id, right_event_id)[order]
+    left_keys = _event_keys(left_obs_id, left_event_id)
+
+    pos = np.searchsorted(right_keys, left_keys)
+    pos[pos == len(right_keys)] = 0
+    found = right_keys[pos] == left_keys
+    return np.where(found, order[pos], -1).astype(np.int64)
+
+
+def _join_on_event(params, showers):
+    """
+    Inner join of the telescope-wise parameters with the subarray-wise
+    shower table on (obs_id, event_id), keeping the order of ``params``.
+    """
+    indices = _join_indices(
+        params["obs_id"], params["event_id"], showers["obs_id"], showers["event_id"]
+    )
+    has_match = indices >= 0
+    params = params[has_match]
+    showers = showers[indices[has_match]]
+
+    shower_columns = [col for col in showers.dtype.names if col not in EVENT_KEYS]
+    dtype = [(col, params.dtype[col]) for col in params.dtype.names]
+    dtype += [(col, showers.dtype[col]) for col in shower_columns]
+    joined = np.empty(len(params), dtype=dtype)
+    for col in params.dtype.names:
+        joined[col] = params[col]
+    for col in shower_columns:
+        joined[col] = showers[col]
+
+    return joined
+
+
+def _column_units(*tables_):
+    """ collect the units of all columns from the `<colname>_UNIT` attributes """
+    units = {}
+    for table in tables_:
+        for attr in table.attrs._f_list():  # pylint: disable=W0212
+            if attr.endswith("_UNIT"):
+                units[attr[:-5]] = Unit(table.attrs[attr])
+    return units
+
+
+def _to_qtable(array, units):
+    """ convert a structured array to a QTable with the given column units """
+    table = QTable(array)
+    for column, unit in units.items():
+        if column in table.colnames:
+            table[column].unit = unit
+    return table
+
+
+def read_dl1_parameters(
+    h5file,
+    telescopes=None,
+    columns=None,
+    condition=None,
+    start=None,
+    stop=None,
+    simulation=True,
+    simulation_columns=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    stack=False,
+    as_table=True,
+):
+    """
+    Read the image parameter tables of a DL1 file column-wise,
+    optionally joined with the true shower information.
+
+    Parameters
+    ----------
+    h5file: Union[str, Path, tables.file.File]
+        input filename or PyTables file handle
+    telescopes: Iterable[str] or None
+        names of the tables in ``/dl1/event/telescope/parameters`` to read,
+        e.g. ``["tel_001", "tel_002"]``. If None, all tables are read.
+    columns: Iterable[str] or None
+        parameter columns to read. ``obs_id``, ``event_id`` and ``tel_id``
+        are always included. If None, all columns are read.
+    condition: str or None
+        PyTables condition to select rows of the parameter tables,
+        e.g. ``"hillas_intensity > 100"``
+    start: int or None
+        first row of each parameter table to read
+    stop: int or None
+        stop reading the parameter tables at this row
+    simulation: bool
+        If True and the file contains simulated showers, join the rows of
+        ``/simulation/event/subarray/shower`` to the parameters on
+        (obs_id, event_id). Parameter rows without matching shower are dropped.
+    simulation_columns: Iterable[str] or None
+        shower columns to read, if None, all columns are read.
+    chunk_size: int
+        number of rows to read at once
+    stack: bool
+        If True, stack the tables of all telescopes into a single table
+    as_table: bool
+        If True, return `astropy.table.QTable` with units attached,
+        otherwise numpy structured arrays
+
+    Returns
+    -------
+    Dict[str, Union[astropy.table.QTable, np.ndarray]] or
+    Union[astropy.table.QTable, np.ndarray]:
+        mapping of table name to table, or a single table if ``stack=True``
+    """
+    should_close_file = False
+    if isinstance(h5file, (str, Path)):
+        h5file = tables.open_file(h5file)
+        should_close_file = True
+    elif not isinstance(h5file, tables.file.File):
+        raise ValueError(
+            f"expected a string, Path, or PyTables "
+            f"filehandle for argument 'h5file', got {h5file}"
+        )
+
+    try:
+        parameters_group = h5file.get_node(PARAMETERS_GROUP)
+        if telescopes is None:
+            telescopes = [table._v_name for table in parameters_group]
+
+        if columns is not None:
+            columns = set(columns) | {"obs_id", "event_id", "tel_id"}
+
+        showers = None
+        shower_table = None
+        if simulation and SHOWER_TABLE in h5file:
+            shower_table = h5file.get_node(SHOWER_TABLE)
+            if simulation_columns is not None:
+                simulation_columns = set(simulation_columns) | set(EVENT_KEYS)
+            showers = _read_columns(
+                shower_table, columns=simulation_columns, chunk_size=chunk_size
+            )
+
+        result = {}
+        for name in telescopes:
+            table = parameters_group[name]
+            params = _read_columns(
+                table,
+                columns=columns,
+                condition=condition,
+                start=start,
+                stop=stop,
+                chunk_size=chunk_size,
+            )
+
+            units_from = [table]
+            if showers is not None:
+                params = _join_on_event(params, showers)
+                units_from.append(shower_table)
+
+            if as_table:
+                params = _to_qtable(params, _column_units(*units_from))
+            result[name] = params
+
+    finally:
+        if should_close_file:
+            h5file.close()
+
+    if stack:
+        if as_table:
+            return vstack(list(result.values()))
+        return np.concatenate(list(result.values()))
+
+    return result
@@ -21,6 +21,7 @@ from ..core import Component, Container, Field, Provenance, ToolConfigurationErr
 from ..core.traits import Bool, CaselessStrEnum, Int, Path
 from ..io import EventSource, HDF5TableWriter, TableWriter
 from ..io.simteleventsource import SimTelEventSource
+from ..io.dl1index import create_table_indices, event_index_filename, iter_tables
 from ..io import metadata as meta
 from ..instrument import SubarrayDescription
 
@@ -222,6 +223,7 @@ class DL1Writer(Component):
         """ called after all events are done """
         self.log.info("Finishing DL1 output")
         if self._writer:
+            self._writer.flush()
             if self.write_index_tables:
                 self._generate_indices()
             write_reference_metadata_headers(
@@ -249,6 +251,10 @@ class DL1Writer(Component):
             if self.overwrite:
                 self.log.warning(f"Overwriting {self.output_path}")
                 self.output_path.unlink()
+                # event indices of the old file would be outdated
+                index_path = event_index_filename(self.output_path)
+                if index_path.exists():
+                    index_path.unlink()
             else:
                 raise ToolConfigurationError(
                     f"Output file {self.output_path} exists"
@@ -506,21 +512,10 @@ class DL1Writer(Component):
 
     def _generate_table_indices(self, h5file, start_node):
         """ helper to generate PyTables index tabnles for common columns """
-        for node in h5file.iter_nodes(start_node):
-            if not isinstance(node, tables.group.Group):
-                self.log.debug(f"gen indices for: {node}")
-                if "event_id" in node.colnames:
-                    node.cols.event_id.create_index()
-                    self.log.debug("generated event_id index")
-                if "tel_id" in node.colnames:
-                    node.cols.tel_id.create_index()
-                    self.log.debug("generated tel_id index")
-                if "obs_id" in node.colnames:
-                    self.log.debug("generated obs_id index")
-                    node.cols.obs_id.create_index(kind="ultralight")
-            else:
-                # recurse
-                self._generate_table_indices(h5file, node)
+        for table in iter_tables(h5file, start_node):
+            self.log.debug(f"gen indices for: {table}")
+            indexed = create_table_indices(table)
+            self.log.debug(f"generated indices for columns {indexed}")
 
     def _generate_indices(self):
         """ generate PyTables index tables for common columns """
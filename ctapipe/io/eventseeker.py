@@ -18,9 +18,12 @@ class EventSeeker(Component):
     By default, this will loop through events from the start of the file
     (unless the requested event is the same as the previous requested event,
     or occurs later in the file). However if the
-    `ctapipe.io.eventfilereader.EventSource` has defined a `__getitem__`
-    method itself, then it will use that method, thereby taking advantage of
-    the random event access some file formats provide.
+    `ctapipe.io.eventfilereader.EventSource` has defined the
+    ``_get_event_by_index`` and ``_get_event_by_id`` methods itself, then it
+    will use these methods, thereby taking advantage of the random event
+    access some file formats provide (e.g. `ctapipe.io.DL1EventSource`).
+    These methods return a new event container on each call, so the events
+    are not copied in this case.
 
     To create an instance of an EventSeeker you must provide it a sub-class of
     `ctapipe.io.eventfilereader.EventSource` (such as
@@ -81,7 +84,11 @@ class EventSeeker(Component):
         self._num_events = None
         self._source = self._event_source.__iter__()
         self._current_event = None
-        self._has_fast_seek = False  # By default seeking iterates through
+        # By default seeking iterates through the source, unless it
+        # provides random access to its events
+        self._has_fast_seek = hasattr(
+            event_source, "_get_event_by_index"
+        ) and hasattr(event_source, "_get_event_by_id")
         self._getevent_warn = True
 
     def _reset(self):
@@ -114,19 +121,21 @@ class EventSeeker(Component):
         event : ctapipe.io.container
             The event container filled with the requested event's information
         """
-        if self._current_event and event_index == self._current_event.count:
-            return deepcopy(self._current_event)
-
         # Check we are within max_events range
         max_events = self._event_source.max_events
         if max_events and event_index >= max_events:
             msg = f"Event index {event_index} is beyond max_events {max_events}"
             raise IndexError(msg)
 
-        try:
-            event = self._event_source._get_event_by_index(event_index)
-        except AttributeError:
-            event = self._get_event_by_index(event_index)
+        if self._has_fast_seek:
+            # random access sources return a new container for every call,
+            # so there is no need to copy
+            return self._event_source._get_event_by_index(event_index)
+
+        if self._current_event and event_index == self._current_event.count:
+            return deepcopy(self._current_event)
+
+        event = self._get_event_by_index(event_index)
 
         self._current_event = event
         return deepcopy(event)
@@ -146,13 +155,13 @@ class EventSeeker(Component):
             The event container filled with the requested event's information
 
         """
+        if self._has_fast_seek:
+            return self._event_source._get_event_by_id(event_id)
+
         if self._current_event and event_id == self._current_event.index.event_id:
             return deepcopy(self._current_event)
 
-        try:
-            event = self._event_source._get_event_by_id(event_id)
-        except AttributeError:
-            event = self._get_event_by_id(event_id)
+        event = self._get_event_by_id(event_id)
 
         self._current_event = event
         return deepcopy(event)
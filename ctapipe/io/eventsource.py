@@ -1,7 +1,12 @@
 """
 Handles reading of different event/waveform containing files
 """
+import queue
+import threading
 from abc import abstractmethod
+from copy import deepcopy
+
+from traitlets import validate
 from traitlets.config.loader import LazyConfigValue
 
 from ctapipe.core import ToolConfigurationError, Provenance
@@ -10,12 +15,19 @@ from ctapipe.core.component import (
     non_abstract_children,
     find_config_in_hierarchy,
 )
-from ctapipe.core.traits import Path, Int, Set
+from ctapipe.core.traits import Path, Int, Set, TraitError
 
 
 __all__ = ["EventSource"]
 
 
+class _EndOfEvents:
+    """ marks the end of the events produced by the prefetching thread """
+
+    def __init__(self, exception=None):
+        self.exception = exception
+
+
 class EventSource(Component):
     """
     Parent class for EventSources.
@@ -67,6 +79,13 @@ class EventSource(Component):
     To keep an event and prevent its data from being overwritten with the next event's data,
     perform a deepcopy: ``some_special_event = copy.deepcopy(event)``.
 
+    To overlap reading and decoding the input with processing the events,
+    set ``prefetch`` to read up to that many events ahead in a background thread.
+    Each prefetched event is a separate container instance.
+    Sources reading HDF5 files (e.g. `DL1EventSource`) do not support
+    prefetching, as PyTables is not thread-safe and the main thread might
+    write HDF5 files at the same time.
+
 
     Attributes
     ----------
@@ -102,6 +121,24 @@ class EventSource(Component):
         ),
     ).tag(config=True)
 
+    prefetch = Int(
+        default_value=0,
+        min=0,
+        help=(
+            "Number of events read ahead in a background thread while the "
+            "current event is processed. If 0, events are read on demand. "
+            "Not supported by sources reading HDF5 files."
+        ),
+    ).tag(config=True)
+
+    # True if ``_generator`` creates a new container for each event,
+    # otherwise prefetched events are copied, as the container is reused
+    yields_new_containers = False
+
+    # False if the events cannot be read in a background thread,
+    # e.g. for HDF5 files, as PyTables is not thread-safe
+    supports_prefetch = True
+
     def __new__(cls, input_url=None, config=None, parent=None, **kwargs):
         """
         Returns a compatible subclass for given input url, either
@@ -157,6 +194,14 @@ class EventSource(Component):
 
         Provenance().add_input_file(str(self.input_url), role="DL0/Event")
 
+    @validate("prefetch")
+    def _validate_prefetch(self, proposal):
+        if proposal["value"] > 0 and not self.supports_prefetch:
+            raise TraitError(
+                f"{self.__class__.__name__} does not support prefetching events"
+            )
+        return proposal["value"]
+
     @staticmethod
     @abstractmethod
     def is_compatible(file_path):
@@ -260,11 +305,66 @@ class EventSource(Component):
         -------
         generator
         """
+        if self.prefetch > 0:
+            yield from self._prefetch_events()
+        else:
+            yield from self._iter_events()
+
+    def _iter_events(self):
         for event in self._generator():
             yield event
             if self.max_events and event.count >= self.max_events - 1:
                 break
 
+    def _prefetch_events(self):
+        """
+        Yield the events produced by a background thread,
+        which reads up to ``prefetch`` events ahead.
+        """
+        events = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            # don't block forever if the consumer stopped iterating
+            while not stop.is_set():
+                try:
+                    events.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            generator = self._iter_events()
+            try:
+                for event in generator:
+                    if not self.yields_new_containers:
+                        event = deepcopy(event)
+                    if not put(event):
+                        return
+                put(_EndOfEvents())
+            except Exception as e:
+                put(_EndOfEvents(exception=e))
+            finally:
+                generator.close()
+
+        thread = threading.Thread(
+            target=produce, name=f"{self.__class__.__name__}Prefetch", daemon=True
+        )
+        thread.start()
+
+        try:
+            while True:
+                event = events.get()
+                if isinstance(event, _EndOfEvents):
+                    if event.exception is not None:
+                        raise event.exception
+                    break
+                yield event
+        finally:
+            stop.set()
+            thread.join()
+
     def __enter__(self):
         return self
 
@@ -1,5 +1,6 @@
 """Implementations of TableWriter and -Reader for HDF5 files"""
 import enum
+from collections import defaultdict
 from functools import partial
 from pathlib import PurePath
 import re
@@ -68,6 +69,13 @@ class HDF5TableWriter(TableWriter):
     To append to existing files, pass the `mode='a'`  option to the
     constructor.
 
+    Rows are not written to the file one by one, but collected in an
+    in-memory buffer (a numpy structured array with the dtype of the table)
+    for each table and appended in a single operation once the buffer is
+    full, when `flush()` is called or when the writer is closed.
+    The mapping from container fields to table columns, including the
+    column transforms, is computed once when a table is set up.
+
     Parameters
     ----------
     filename: str
@@ -85,6 +93,10 @@ class HDF5TableWriter(TableWriter):
     filters: pytables.Filters
         A set of filters (compression settings) to be used for
         all datasets created by this writer.
+    buffer_size: int or None
+        Number of rows to buffer per table before appending them to the file.
+        If None, the number of rows that fit into the PyTables I/O buffer
+        (``table.nrowsinbuf``) is used.
     kwargs:
         any other arguments that will be passed through to `pytables.open()`.
     """
@@ -97,6 +109,7 @@ class HDF5TableWriter(TableWriter):
         mode="w",
         root_uep="/",
         filters=DEFAULT_FILTERS,
+        buffer_size=None,
         parent=None,
         config=None,
         **kwargs,
@@ -105,6 +118,13 @@ class HDF5TableWriter(TableWriter):
         super().__init__(add_prefix=add_prefix, parent=parent, config=config)
         self._schemas = {}
         self._tables = {}
+        self._column_maps = {}
+        self._buffers = {}
+        self._n_buffered = {}
+
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+        self.buffer_size = buffer_size
 
         if mode not in ["a", "w", "r+"]:
             raise IOError(f"The mode '{mode}' is not supported for writing")
@@ -122,8 +142,27 @@ class HDF5TableWriter(TableWriter):
         self._h5file = tables.open_file(filename, **kwargs)
 
     def close(self):
+        self.flush()
         self._h5file.close()
 
+    def flush(self):
+        """ append all buffered rows to their tables and flush the file """
+        if not self._h5file.isopen:
+            return
+
+        for table_name in self._tables:
+            self._flush_table(table_name)
+        self._h5file.flush()
+
+    def _flush_table(self, table_name):
+        """ append the buffered rows of a table to the file """
+        n_rows = self._n_buffered[table_name]
+        if n_rows == 0:
+            return
+
+        self._tables[table_name].append(self._buffers[table_name][:n_rows])
+        self._n_buffered[table_name] = 0
+
     def _create_hdf5_table_schema(self, table_name, containers):
         """
         Creates a pytables description class for the given containers
@@ -266,32 +305,70 @@ class HDF5TableWriter(TableWriter):
             table.attrs[key] = val
 
         self._tables[table_name] = table
+        self._column_maps[table_name] = self._create_column_map(table_name, containers)
+        buffer_size = self.buffer_size or table.nrowsinbuf
+        self._buffers[table_name] = np.zeros(buffer_size, dtype=table.dtype)
+        self._n_buffered[table_name] = 0
+
+    def _create_column_map(self, table_name, containers):
+        """
+        Create the list of (container index, field name, column name, transform)
+        tuples describing how to fill a row of the table from the containers.
+        Column names that are not part of the table are skipped.
+        """
+        colnames = set(self._tables[table_name].colnames)
+        transforms = self._transforms[table_name]
+
+        column_map = []
+        for index, container in enumerate(containers):
+            for key in container.keys():
+                if self.add_prefix and container.prefix:
+                    colname = f"{container.prefix}_{key}"
+                else:
+                    colname = key
+
+                if colname in colnames:
+                    column_map.append((index, key, colname, transforms.get(colname)))
+
+        return column_map
+
+    def add_column_transform(self, table_name, col_name, transform):
+        super().add_column_transform(table_name, col_name, transform)
+
+        # initialized tables cache their transforms in the column map
+        column_map = self._column_maps.get(table_name)
+        if column_map is not None:
+            self._column_maps[table_name] = [
+                (index, key, colname, transform if colname == col_name else tr)
+                for index, key, colname, tr in column_map
+            ]
 
     def _append_row(self, table_name, containers):
         """
         append a row to an already initialized table. This is called
         automatically by `write()`
         """
-        table = self._tables[table_name]
-        row = table.row
+        buffer = self._buffers[table_name]
+        n_rows = self._n_buffered[table_name]
+        # indexing a structured array returns a view into the buffer
+        row = buffer[n_rows]
 
-        for container in containers:
-            selected_fields = filter(
-                lambda kv: kv[0] in table.colnames,
-                container.items(add_prefix=self.add_prefix),
-            )
-            for colname, value in selected_fields:
-
-                try:
-                    value = self._apply_col_transform(table_name, colname, value)
-                    row[colname] = value
-                except Exception:
-                    self.log.error(
-                        f"Error writing col {colname} of "
-                        f"container {container.__class__.__name__}"
-                    )
-                    raise
-        row.append()
+        for index, key, colname, transform in self._column_maps[table_name]:
+            try:
+                value = getattr(containers[index], key)
+                if transform is not None:
+                    value = transform(value)
+                row[colname] = value
+            except Exception:
+                self.log.error(
+                    f"Error writing col {colname} of "
+                    f"container {containers[index].__class__.__name__}"
+                )
+                raise
+
+        self._n_buffered[table_name] = n_rows + 1
+        if self._n_buffered[table_name] == len(buffer):
+            self._flush_table(table_name)
 
     def write(self, table_name, containers):
         """
@@ -310,6 +387,8 @@ class HDF5TableWriter(TableWriter):
         """
         if isinstance(containers, Container):
             containers = (containers,)
+        else:
+            containers = tuple(containers)
 
         if table_name not in self._schemas:
             self._setup_new_table(table_name, containers)
@@ -355,6 +434,7 @@ class HDF5TableReader(TableReader):
 
         super().__init__()
         self._tables = {}
+        self._unit_transforms = defaultdict(dict)
         kwargs.update(mode="r")
 
         if isinstance(filename, str) or isinstance(filename, PurePath):
@@ -392,6 +472,8 @@ class HDF5TableReader(TableReader):
                 colname = attr[:-5]
                 tr = partial(tr_add_unit, unitname=tab.attrs[attr])
                 self.add_column_transform(table_name, colname, tr)
+                # unit transforms can be applied to a whole column at once
+                self._unit_transforms[table_name][colname] = tr
 
         for attr in tab.attrs._f_list():
             if attr.endswith("_ENUM"):
@@ -444,12 +526,23 @@ class HDF5TableReader(TableReader):
                     "that does not map to any of the specified containers"
                 )
 
-    def read(self, table_name, containers, prefixes=False):
+    def read(
+        self,
+        table_name,
+        containers,
+        prefixes=False,
+        chunk_size=None,
+        start=None,
+        stop=None,
+    ):
         """
         Returns a generator that reads the next row from the table into the
         given container. The generator returns the same container. Note that
         no containers are copied, the data are overwritten inside.
 
+        Rows are read from the file in blocks of ``chunk_size`` rows, and unit
+        transforms are applied to each block at once.
+
         Parameters
         ----------
         table_name: str
@@ -464,6 +557,14 @@ class HDF5TableReader(TableReader):
             If a string is provided, it is used as prefix for all containers.
             If a list is provided, the length needs to match th number
             of containers.
+        chunk_size: int or None
+            Number of rows to read from the file at once. If None, the number
+            of rows that fit into the PyTables I/O buffer
+            (``table.nrowsinbuf``) is used.
+        start: int or None
+            first row to read, by default the first row of the table
+        stop: int or None
+            stop reading at this row, by default read until the end of the table
         """
 
         return_iterable = True
@@ -484,29 +585,58 @@ class HDF5TableReader(TableReader):
         else:
             tab = self._tables[table_name]
 
-        row_count = 0
+        if chunk_size is None:
+            chunk_size = tab.nrowsinbuf
 
-        while 1:
-            try:
-                row = tab[row_count]
-            except IndexError:
-                return  # stop generator when done
-            for container, prefix in zip(containers, prefixes):
-                for fieldname in container.keys():
-                    if prefix:
-                        colname = f"{prefix}_{fieldname}"
-                    else:
-                        colname = fieldname
-                    if colname not in self._cols_to_read[table_name]:
-                        continue
-                    container[fieldname] = self._apply_col_transform(
-                        table_name, colname, row[colname]
-                    )
-            if return_iterable:
-                yield containers
-            else:
-                yield containers[0]
-            row_count += 1
+        # (container, field name, column name) for all fields filled from the table
+        fields_to_fill = []
+        for container, prefix in zip(containers, prefixes):
+            for fieldname in container.keys():
+                if prefix:
+                    colname = f"{prefix}_{fieldname}"
+                else:
+                    colname = fieldname
+                if colname in self._cols_to_read[table_name]:
+                    fields_to_fill.append((container, fieldname, colname))
+
+        colnames = {colname for _, _, colname in fields_to_fill}
+        transforms = self._transforms[table_name]
+        vectorized = {
+            colname
+            for colname in colnames
+            if transforms.get(colname) is not None
+            and transforms[colname] is self._unit_transforms[table_name].get(colname)
+        }
+        row_transforms = {
+            colname: transforms[colname]
+            for colname in colnames - vectorized
+            if colname in transforms
+        }
+
+        chunk_start = start or 0
+        stop = tab.nrows if stop is None else min(stop, tab.nrows)
+        while chunk_start < stop:
+            chunk = tab.read(chunk_start, min(chunk_start + chunk_size, stop))
+            chunk_start += len(chunk)
+
+            columns = {}
+            for colname in colnames:
+                if colname in vectorized:
+                    columns[colname] = transforms[colname](chunk[colname])
+                else:
+                    columns[colname] = chunk[colname]
+
+            for row_index in range(len(chunk)):
+                for container, fieldname, colname in fields_to_fill:
+                    value = columns[colname][row_index]
+                    if colname in row_transforms:
+                        value = row_transforms[colname](value)
+                    container[fieldname] = value
+
+                if return_iterable:
+                    yield containers
+                else:
+                    yield containers[0]
 
 
 def tr_convert_and_strip_unit(quantity, unit):
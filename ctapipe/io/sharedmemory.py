@@ -0,0 +1,300 @@
+"""
+Transport of events between processes through shared memory.
+
+Sending an `~ctapipe.containers.ArrayEventContainer` to another process
+normally means pickling all of its per-telescope arrays, which can cost more
+than processing the event. `SharedMemoryEventTransport` instead copies the
+large arrays (waveforms, images) into a `SharedMemoryRingBuffer` and replaces
+them in the event by small `SharedArray` descriptors, so only the container
+skeleton is pickled. The receiving process maps the arrays directly from the
+shared memory, without copying them.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+__all__ = ["SharedArray", "SharedMemoryRingBuffer", "SharedMemoryEventTransport"]
+
+# (data level, field) of the per-telescope arrays moved into shared memory
+DEFAULT_FIELDS = (
+    ("r0", "waveform"),
+    ("r1", "waveform"),
+    ("dl0", "waveform"),
+    ("dl1", "image"),
+    ("dl1", "peak_time"),
+    ("dl1", "image_mask"),
+)
+
+# the header of a ring buffer stores its write and read positions
+_HEADER_SIZE = 64
+_ALIGNMENT = 64
+
+
+def _aligned(n_bytes):
+    """ round up to the next multiple of _ALIGNMENT """
+    return -(-n_bytes // _ALIGNMENT) * _ALIGNMENT
+
+
+class SharedArray(
+    namedtuple("SharedArray", ["buffer_name", "offset", "shape", "dtype"])
+):
+    """
+    Descriptor of a numpy array stored in a `SharedMemoryRingBuffer`.
+    It is cheap to pickle and can be turned back into an array in any
+    process with `SharedMemoryRingBuffer.array`.
+    """
+
+    __slots__ = ()
+
+
+class SharedMemoryRingBuffer:
+    """
+    A ring buffer of numpy arrays in a block of shared memory,
+    with a single process writing and a single process consuming the arrays.
+
+    The write and read positions are stored in the shared memory itself,
+    so the consumer can release space from another process
+    by attaching to the buffer using its name.
+
+    Parameters
+    ----------
+    name: str or None
+        Name of the shared memory block. If None, a unique name is generated.
+    size: int or None
+        Capacity in bytes. If given, a new shared memory block is created,
+        otherwise the existing block ``name`` is attached.
+    """
+
+    def __init__(self, name=None, size=None):
+        if shared_memory is None:
+            raise RuntimeError("Shared memory transport requires python >= 3.8")
+
+        self.owner = size is not None
+        if self.owner:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_HEADER_SIZE + size
+            )
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        # logical write and read positions, only ever increasing
+        self._positions = np.ndarray(2, dtype=np.uint64, buffer=self._shm.buf)
+        if self.owner:
+            self._positions[:] = 0
+
+        self._address = self._positions.ctypes.data
+        self.capacity = self._shm.size - _HEADER_SIZE
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def position(self):
+        """ write position after the last array put into the buffer """
+        return int(self._positions[0])
+
+    def put(self, array):
+        """
+        Copy ``array`` into the buffer.
+
+        Returns
+        -------
+        SharedArray or None
+            Descriptor of the stored array, None if the array cannot be
+            stored because the buffer is full or it has an object dtype.
+        """
+        if array.dtype.hasobject:
+            return None
+
+        n_bytes = _aligned(array.nbytes)
+        if n_bytes > self.capacity:
+            return None
+
+        write, read = (int(p) for p in self._positions)
+
+        start = write
+        offset = start % self.capacity
+        if offset + n_bytes > self.capacity:
+            # arrays are stored contiguously, skip the rest of the buffer
+            start += self.capacity - offset
+            offset = 0
+
+        # check for overlap with arrays not released yet
+        if read < write and start + n_bytes - read > self.capacity:
+            return None
+
+        shared = SharedArray(self.name, _HEADER_SIZE + offset, array.shape, array.dtype)
+        self.array(shared)[...] = array
+        self._positions[0] = start + n_bytes
+        return shared
+
+    def array(self, shared):
+        """ numpy array stored at the position given by the descriptor ``shared`` """
+        return np.ndarray(
+            shared.shape, dtype=shared.dtype, buffer=self._shm.buf, offset=shared.offset
+        )
+
+    def describe(self, array):
+        """ `SharedArray` describing ``array`` if it lives in this buffer, else None """
+        if not array.flags.c_contiguous:
+            return None
+
+        offset = array.ctypes.data - self._address
+        if _HEADER_SIZE <= offset and offset + array.nbytes <= self._shm.size:
+            return SharedArray(self.name, offset, array.shape, array.dtype)
+        return None
+
+    def release(self, position):
+        """
+        Mark all arrays put into the buffer before ``position``
+        (see `SharedMemoryRingBuffer.position`) as consumed,
+        so their memory can be reused.
+        """
+        self._positions[1] = max(int(self._positions[1]), position)
+
+    def close(self):
+        """
+        Unmap the shared memory in this process.
+        Arrays obtained from the buffer must not be used afterwards.
+        """
+        self._positions = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # arrays pointing into the buffer are still alive,
+            # the memory is unmapped once they are garbage collected
+            pass
+
+    def unlink(self):
+        """ request the shared memory to be destroyed once no process maps it """
+        self._shm.unlink()
+
+
+class SharedMemoryEventTransport:
+    """
+    Move the large per-telescope arrays of events between processes
+    through shared memory.
+
+    `pack` copies the arrays into a `SharedMemoryRingBuffer` owned by
+    this transport and replaces them in the event by `SharedArray`
+    descriptors, so pickling the event only serializes the lightweight
+    container skeleton. Arrays already located in shared memory, e.g.
+    received from another process, are not copied again.
+    `unpack` replaces the descriptors by arrays pointing directly
+    into the shared memory.
+
+    Every process sending events uses its own transport, the ring buffer
+    is created on the first call to `pack`. When the receiver is done with
+    the events, it passes the `position` the sender had after packing them to
+    `release`, so the memory can be reused. Arrays that don't fit into the
+    buffer are left in the event and are pickled as usual.
+
+    Parameters
+    ----------
+    buffer_size: int
+        Size of the ring buffer in bytes
+    fields: Iterable[Tuple[str, str]]
+        (data level, field) of the per-telescope arrays to move
+        into shared memory, e.g. ``("dl1", "image")``
+    """
+
+    def __init__(self, buffer_size, fields=DEFAULT_FIELDS):
+        self.buffer_size = buffer_size
+        self.fields = tuple(fields)
+        self._buffer = None
+        self._attached = {}
+
+    @property
+    def position(self):
+        """ (buffer name, write position) after the last packed event, or None """
+        if self._buffer is None:
+            return None
+        return self._buffer.name, self._buffer.position
+
+    def _get_buffer(self, name):
+        if self._buffer is not None and name == self._buffer.name:
+            return self._buffer
+
+        if name not in self._attached:
+            self._attached[name] = SharedMemoryRingBuffer(name=name)
+        return self._attached[name]
+
+    def _tel_containers(self, event):
+        for data_level, field in self.fields:
+            for container in getattr(event, data_level).tel.values():
+                yield container, field
+
+    def pack(self, event):
+        """
+        Replace the arrays of ``event`` by `SharedArray` descriptors in place.
+        Returns the event.
+        """
+        if self._buffer is None:
+            self._buffer = SharedMemoryRingBuffer(size=self.buffer_size)
+        buffers = [self._buffer, *self._attached.values()]
+
+        for container, field in self._tel_containers(event):
+            value = getattr(container, field)
+            if not isinstance(value, np.ndarray):
+                continue
+
+            for buffer in buffers:
+                shared = buffer.describe(value)
+                if shared is not None:
+                    break
+            else:
+                shared = self._buffer.put(value)
+
+            if shared is not None:
+                setattr(container, field, shared)
+
+        return event
+
+    def unpack(self, event):
+        """
+        Replace the `SharedArray` descriptors of ``event`` by arrays
+        in shared memory in place. Returns the event.
+        """
+        for container, field in self._tel_containers(event):
+            value = getattr(container, field)
+            if isinstance(value, SharedArray):
+                setattr(
+                    container, field, self._get_buffer(value.buffer_name).array(value)
+                )
+        return event
+
+    def release(self, position):
+        """
+        Release the memory of all events packed before ``position``
+        (as returned by `SharedMemoryEventTransport.position` of the sender).
+        """
+        if position is not None:
+            name, position = position
+            self._get_buffer(name).release(position)
+
+    def close(self, unlink_attached=False):
+        """
+        Close all buffers and destroy the buffer owned by this transport.
+
+        Parameters
+        ----------
+        unlink_attached: bool
+            Also destroy the buffers of other processes this transport attached to,
+            e.g. when these processes have exited already.
+        """
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer.unlink()
+            self._buffer = None
+
+        for buffer in self._attached.values():
+            buffer.close()
+            if unlink_attached:
+                buffer.unlink()
+        self._attached.clear()
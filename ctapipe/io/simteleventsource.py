@@ -9,15 +9,22 @@ from astropy.coordinates import Angle
 from astropy.time import Time
 from eventio.file_types import is_eventio
 from eventio.simtel.simtelfile import SimTelFile
+from numba import njit
 from traitlets import observe
 
 from ..calib.camera.gainselection import GainSelector
 from ..containers import (
     ArrayEventContainer,
+    DL0CameraContainer,
+    DL1CameraContainer,
+    EventCameraCalibrationContainer,
     EventType,
+    R0CameraContainer,
+    R1CameraContainer,
     SimulationConfigContainer,
     SimulatedCameraContainer,
     SimulatedShowerContainer,
+    TelescopePointingContainer,
 )
 from ..coordinates import CameraFrame
 from ..core.traits import Bool, CaselessStrEnum, create_class_enum_trait
@@ -97,7 +104,29 @@ def build_camera(cam_settings, pixel_settings, telescope, frame):
     )
 
 
-def apply_simtel_r1_calibration(r0_waveforms, pedestal, dc_to_pe, gain_selector):
+def r1_waveform_dtype(r0_waveforms, pedestal, dc_to_pe):
+    """dtype of the R1 waveforms computed by `apply_simtel_r1_calibration`"""
+    return np.result_type(r0_waveforms, pedestal, dc_to_pe, np.float32)
+
+
+@njit
+def _apply_r1_calibration(r0_waveforms, pedestal, dc_to_pe, selected_gain_channel, out):
+    """
+    Pedestal subtraction and dc to pe conversion of the selected gain channel,
+    computed in a single pass into ``out``
+    """
+    n_pixels, n_samples = out.shape
+    for pixel in range(n_pixels):
+        channel = selected_gain_channel[pixel]
+        ped = pedestal[channel, pixel]
+        gain = dc_to_pe[channel, pixel]
+        for sample in range(n_samples):
+            out[pixel, sample] = (r0_waveforms[channel, pixel, sample] - ped) * gain
+
+
+def apply_simtel_r1_calibration(
+    r0_waveforms, pedestal, dc_to_pe, gain_selector, out=None
+):
     """
     Perform the R1 calibration for R0 simtel waveforms. This includes:
         - Gain selection
@@ -107,6 +136,8 @@ def apply_simtel_r1_calibration(r0_waveforms, pedestal, dc_to_pe, gain_selector)
           value would be in photoelectrons.)
           (Also applies flat-fielding)
 
+    Only the selected gain channel is calibrated, without temporary arrays.
+
     Parameters
     ----------
     r0_waveforms : ndarray
@@ -120,6 +151,9 @@ def apply_simtel_r1_calibration(r0_waveforms, pedestal, dc_to_pe, gain_selector)
         simtel file for each gain channel
         Shape: (n_channels, n_pixels)
     gain_selector : ctapipe.calib.camera.gainselection.GainSelector
+    out : ndarray or None
+        Array to store the calibrated waveforms in, e.g. reused between events.
+        Shape: (n_pixels, n_samples), dtype: see `r1_waveform_dtype`
 
     Returns
     -------
@@ -131,16 +165,70 @@ def apply_simtel_r1_calibration(r0_waveforms, pedestal, dc_to_pe, gain_selector)
         Shape: (n_pixels)
     """
     n_channels, n_pixels, n_samples = r0_waveforms.shape
-    ped = pedestal[..., np.newaxis]
-    gain = dc_to_pe[..., np.newaxis]
-    r1_waveforms = (r0_waveforms - ped) * gain
     if n_channels == 1:
         selected_gain_channel = np.zeros(n_pixels, dtype=np.int8)
-        r1_waveforms = r1_waveforms[0]
     else:
         selected_gain_channel = gain_selector(r0_waveforms)
-        r1_waveforms = r1_waveforms[selected_gain_channel, np.arange(n_pixels)]
-    return r1_waveforms, selected_gain_channel
+
+    if out is None:
+        out = np.empty(
+            (n_pixels, n_samples),
+            dtype=r1_waveform_dtype(r0_waveforms, pedestal, dc_to_pe),
+        )
+    elif out.shape != (n_pixels, n_samples):
+        raise ValueError(
+            f"out has shape {out.shape}, expected {(n_pixels, n_samples)}"
+        )
+
+    _apply_r1_calibration(
+        r0_waveforms,
+        np.asanyarray(pedestal),
+        np.asanyarray(dc_to_pe),
+        np.asanyarray(selected_gain_channel),
+        out,
+    )
+    return out, selected_gain_channel
+
+
+class _TelescopeContainers:
+    """
+    Per-telescope containers and array buffers of a `SimTelEventSource`,
+    reused for all events if ``reuse_containers`` is True.
+    """
+
+    # container class for each data level with a per-telescope map
+    container_classes = {
+        "r0": R0CameraContainer,
+        "r1": R1CameraContainer,
+        "dl0": DL0CameraContainer,
+        "dl1": DL1CameraContainer,
+        "simulation": SimulatedCameraContainer,
+        "pointing": TelescopePointingContainer,
+        "calibration": EventCameraCalibrationContainer,
+    }
+
+    def __init__(self, n_pixels):
+        self.containers = {
+            level: container_class()
+            for level, container_class in self.container_classes.items()
+        }
+        self.buffers = {"true_image": np.zeros(n_pixels, dtype=np.float32)}
+
+    def insert(self, data, tel_id):
+        """Reset the containers in place and insert them into the maps of ``data``"""
+        for level, container in self.containers.items():
+            container.reset()
+            getattr(data, level).tel[tel_id] = container
+
+    def empty(self, name, shape, dtype):
+        """
+        Buffer ``name`` with the given shape and dtype,
+        only allocated if it does not exist yet or shape or dtype changed.
+        """
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self.buffers[name] = np.empty(shape, dtype=dtype)
+        return buffer
 
 
 class SimTelEventSource(EventSource):
@@ -175,6 +263,18 @@ class SimTelEventSource(EventSource):
         base_class=GainSelector, default_value="ThresholdGainSelector"
     ).tag(config=True)
 
+    reuse_containers = Bool(
+        False,
+        help=(
+            "Reset and fill the same containers for each event instead of"
+            " allocating new ones and write the R1 waveforms and time shifts into"
+            " reused arrays. An event is then only valid until the next"
+            " event is read, so events must not be stored."
+        ),
+    ).tag(config=True)
+
+    yields_new_containers = True
+
     def __init__(self, input_url=None, config=None, parent=None, **kwargs):
         """
         EventSource for simtelarray files using the pyeventio library.
@@ -217,6 +317,11 @@ class SimTelEventSource(EventSource):
         )
         self.log.debug(f"Using gain selector {self.gain_selector}")
 
+        # events have to be copied when prefetching if containers are reused
+        self.yields_new_containers = not self.reuse_containers
+        self._event_container = None
+        self._telescope_containers = {}
+
     @observe("allowed_tels")
     def _observe_allowed_tels(self, change):
         # this can run in __init__ before file_ is created
@@ -352,15 +457,39 @@ class SimTelEventSource(EventSource):
             self.log.warning(msg)
             warnings.warn(msg)
 
-    def _generate_events(self):
-        data = ArrayEventContainer()
-        data.meta["origin"] = "hessio"
-        data.meta["input_url"] = self.input_url
-        data.meta["max_events"] = self.max_events
+    def _new_event_container(self):
+        if not self.reuse_containers:
+            return ArrayEventContainer()
+
+        if self._event_container is None:
+            self._event_container = ArrayEventContainer()
+        else:
+            self._event_container.reset()
+        return self._event_container
+
+    def _pooled_containers(self, data, tel_id):
+        """
+        Insert the reused containers of telescope ``tel_id`` into ``data``,
+        returns None if containers are not reused.
+        """
+        if not self.reuse_containers:
+            return None
 
-        self._fill_array_pointing(data)
+        pool = self._telescope_containers.get(tel_id)
+        if pool is None:
+            n_pixels = self.subarray.tel[tel_id].camera.geometry.n_pixels
+            pool = self._telescope_containers[tel_id] = _TelescopeContainers(n_pixels)
 
+        pool.insert(data, tel_id)
+        return pool
+
+    def _generate_events(self):
         for counter, array_event in enumerate(self.file_):
+            data = self._new_event_container()
+            data.meta["origin"] = "hessio"
+            data.meta["input_url"] = self.input_url
+            data.meta["max_events"] = self.max_events
+            self._fill_array_pointing(data)
 
             event_id = array_event.get("event_id", -1)
             obs_id = self.file_.header["run"]
@@ -373,34 +502,27 @@ class SimTelEventSource(EventSource):
             if data.trigger.event_type == EventType.SUBARRAY:
                 self._fill_simulated_event_information(data, array_event)
 
-            # this should be done in a nicer way to not re-allocate the
-            # data each time (right now it's just deleted and garbage
-            # collected)
-            data.r0.tel.clear()
-            data.r1.tel.clear()
-            data.dl0.tel.clear()
-            data.dl1.tel.clear()
-            data.pointing.tel.clear()
-            data.simulation.tel.clear()
-
             telescope_events = array_event["telescope_events"]
             tracking_positions = array_event["tracking_positions"]
 
             for tel_id, telescope_event in telescope_events.items():
+                pool = self._pooled_containers(data, tel_id)
+
                 adc_samples = telescope_event.get("adc_samples")
                 if adc_samples is None:
                     adc_samples = telescope_event["adc_sums"][:, :, np.newaxis]
 
                 n_gains, n_pixels, n_samples = adc_samples.shape
-                true_image = (
-                    array_event.get("photoelectrons", {})
-                    .get(tel_id - 1, {})
-                    .get("photoelectrons", np.zeros(n_pixels, dtype="float32"))
-                )
+                photoelectrons = array_event.get("photoelectrons", {}).get(tel_id - 1)
+                if photoelectrons is not None and "photoelectrons" in photoelectrons:
+                    true_image = photoelectrons["photoelectrons"]
+                elif pool is None:
+                    true_image = np.zeros(n_pixels, dtype="float32")
+                else:
+                    true_image = pool.buffers["true_image"]
+                    true_image.fill(0)
 
-                data.simulation.tel[tel_id] = SimulatedCameraContainer(
-                    true_image=true_image
-                )
+                data.simulation.tel[tel_id].true_image = true_image
 
                 self._fill_event_pointing(
                     data.pointing.tel[tel_id], tracking_positions[tel_id]
@@ -415,16 +537,28 @@ class SimTelEventSource(EventSource):
                 dc_to_pe = array_event["laser_calibrations"][tel_id]["calib"]
                 # todo: store pedestal and dc_to_pe somewhere?
                 #
+                out = None
+                if pool is not None:
+                    out = pool.empty(
+                        "r1_waveform",
+                        (n_pixels, n_samples),
+                        r1_waveform_dtype(adc_samples, pedestal, dc_to_pe),
+                    )
+
                 r1.waveform, r1.selected_gain_channel = apply_simtel_r1_calibration(
-                    adc_samples, pedestal, dc_to_pe, self.gain_selector
+                    adc_samples, pedestal, dc_to_pe, self.gain_selector, out=out
                 )
 
                 # get time_shift from laser calibration
                 time_calib = array_event["laser_calibrations"][tel_id]["tm_calib"]
-                pix_index = np.arange(n_pixels)
+                time_shift = None
+                if pool is not None:
+                    time_shift = pool.empty("time_shift", (n_pixels,), time_calib.dtype)
 
                 dl1_calib = data.calibration.tel[tel_id].dl1
-                dl1_calib.time_shift = time_calib[r1.selected_gain_channel, pix_index]
+                dl1_calib.time_shift = np.choose(
+                    r1.selected_gain_channel, time_calib, out=time_shift
+                )
 
             yield data
 
@@ -1,12 +1,14 @@
 from ctapipe.utils import get_dataset_path
 from ctapipe.io import DataLevel
-from ctapipe.io.dl1eventsource import DL1EventSource
-from ctapipe.io import EventSource
+from ctapipe.io.dl1eventsource import DL1EventSource, _event_row_ranges
+from ctapipe.io import EventSource, EventSeeker
+from ctapipe.core.traits import TraitError
 import astropy.units as u
 import subprocess
 import numpy as np
 import tempfile
 import pytest
+import tables
 
 d = tempfile.TemporaryDirectory()
 
@@ -91,3 +93,53 @@ def test_pointing(dl1_file):
             for tel in event.pointing.tel:
                 assert np.isclose(event.pointing.tel[tel].azimuth.to_value(u.deg), 0)
                 assert np.isclose(event.pointing.tel[tel].altitude.to_value(u.deg), 70)
+
+
+def test_event_row_ranges(tmp_path):
+    obs_ids = np.array([1, 1, 1, 1, 1, 2, 2, 2])
+    event_ids = np.array([5, 5, 5, 3, 4, 5, 5, 6])
+    data = np.zeros(len(obs_ids), dtype=[("obs_id", "i4"), ("event_id", "i8")])
+    data["obs_id"] = obs_ids
+    data["event_id"] = event_ids
+
+    with tables.open_file(tmp_path / "test.h5", "w") as f:
+        table = f.create_table("/", "trigger", obj=data)
+
+        assert _event_row_ranges(table) == {
+            (1, 5): (0, 3),
+            (1, 3): (3, 4),
+            (1, 4): (4, 5),
+            (2, 5): (5, 7),
+            (2, 6): (7, 8),
+        }
+
+
+def test_random_access(dl1_file):
+    with DL1EventSource(input_url=dl1_file) as source:
+        events = [
+            (event.count, event.index.event_id, set(event.dl1.tel))
+            for event in source
+        ]
+        assert len(events) == len(source)
+
+        seeker = EventSeeker(source)
+        for count, event_id, tels in reversed(events):
+            event = seeker.get_event_index(count)
+            assert event.count == count
+            assert event.index.event_id == event_id
+            assert set(event.dl1.tel) == tels
+
+            event = seeker.get_event_id(event_id)
+            assert event.count == count
+            assert set(event.dl1.tel) == tels
+            for tel_id in event.dl1.tel:
+                assert event.dl1.tel[tel_id].image.any()
+
+        with pytest.raises(IndexError):
+            seeker.get_event_index(len(source))
+
+
+def test_prefetch(dl1_file):
+    # PyTables is not thread-safe, events cannot be read in a background thread
+    with pytest.raises(TraitError):
+        DL1EventSource(input_url=dl1_file, prefetch=5)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+import tables
+
+from ctapipe.io.dl1index import (
+    compute_event_index,
+    create_table_indices,
+    event_index_filename,
+    iter_tables,
+    read_event_index,
+    write_event_index,
+)
+
+
+@pytest.fixture
+def h5file(tmp_path):
+    obs_ids = np.array([1, 1, 1, 1, 1, 2, 2, 2])
+    event_ids = np.array([5, 5, 5, 3, 4, 5, 5, 6])
+    data = np.zeros(
+        len(obs_ids), dtype=[("obs_id", "i4"), ("event_id", "i8"), ("tel_id", "i2")]
+    )
+    data["obs_id"] = obs_ids
+    data["event_id"] = event_ids
+    data["tel_id"] = np.arange(len(obs_ids))
+
+    with tables.open_file(tmp_path / "test.h5", "w") as f:
+        group = "/dl1/event/telescope/trigger"
+        f.create_table(group, "tel_001", obj=data, createparents=True)
+        f.create_table(group, "tel_002", obj=data[:3])
+        yield f
+
+
+def test_compute_event_index(h5file):
+    table = h5file.root.dl1.event.telescope.trigger.tel_001
+
+    # chunk size smaller than an event to test continuation across chunks
+    for chunk_size in (2, 3, 100):
+        index = compute_event_index(table, chunk_size=chunk_size)
+        assert index.tolist() == [
+            (1, 5, 0, 3),
+            (1, 3, 3, 4),
+            (1, 4, 4, 5),
+            (2, 5, 5, 7),
+            (2, 6, 7, 8),
+        ]
+
+
+def test_write_read_event_index(h5file):
+    table = h5file.root.dl1.event.telescope.trigger.tel_001
+    write_event_index(table)
+
+    # the index is stored in the sidecar file, the file itself is not changed
+    sidecar = event_index_filename(h5file.filename)
+    assert sidecar.name == "test.h5.index.h5"
+    with tables.open_file(sidecar) as f:
+        assert f.get_node(table._v_pathname).attrs.table_nrows == table.nrows
+    assert sorted(t.name for t in iter_tables(h5file, "/")) == ["tel_001", "tel_002"]
+    np.testing.assert_array_equal(read_event_index(table), compute_event_index(table))
+
+    # replaces an existing index
+    write_event_index(table)
+    np.testing.assert_array_equal(read_event_index(table), compute_event_index(table))
+
+    # the index is not used anymore when the table changes
+    table.append(table[-1:])
+    index = read_event_index(table)
+    assert index[-1].tolist() == (2, 6, 7, 9)
+
+    # tables without stored index
+    table = h5file.root.dl1.event.telescope.trigger.tel_002
+    np.testing.assert_array_equal(read_event_index(table), compute_event_index(table))
+
+
+def test_create_table_indices(h5file):
+    table = h5file.root.dl1.event.telescope.trigger.tel_001
+    indexed = create_table_indices(table, kinds={"event_id": "full", "foo": "light"})
+    assert indexed == ["event_id"]
+    assert table.cols.event_id.index.kind == "full"
+    assert not table.cols.obs_id.is_indexed
+
+    # replaces existing indices
+    create_table_indices(table)
+    assert table.cols.event_id.index.kind == "medium"
+    assert table.cols.obs_id.index.kind == "ultralight"
+    assert table.cols.tel_id.is_indexed
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+import tables
+from astropy import units as u
+from astropy.table import QTable
+
+from ctapipe.containers import (
+    EventIndexContainer,
+    HillasParametersContainer,
+    LeakageContainer,
+    SimulatedShowerContainer,
+    TelEventIndexContainer,
+)
+from ctapipe.io import HDF5TableWriter
+from ctapipe.io.dl1reader import read_dl1_parameters, _join_indices
+
+
+@pytest.fixture(scope="module")
+def dl1_parameters_file(tmp_path_factory):
+    """ a minimal DL1 file with parameters of two telescopes and true showers """
+    path = tmp_path_factory.mktemp("dl1reader") / "parameters.dl1.h5"
+
+    with HDF5TableWriter(path, mode="w", add_prefix=True) as writer:
+        for event_id in range(10):
+            index = EventIndexContainer(obs_id=1, event_id=event_id)
+            shower = SimulatedShowerContainer(energy=(event_id + 1) * u.TeV)
+            shower.prefix = "true"
+            writer.write("simulation/event/subarray/shower", [index, shower])
+
+            for tel_id in (1, 2):
+                # telescope 2 only sees even events
+                if tel_id == 2 and event_id % 2 == 1:
+                    continue
+
+                tel_index = TelEventIndexContainer(
+                    obs_id=1, event_id=event_id, tel_id=tel_id
+                )
+                hillas = HillasParametersContainer(
+                    intensity=10.0 * event_id, length=0.1 * event_id * u.m
+                )
+                writer.write(
+                    f"dl1/event/telescope/parameters/tel_{tel_id:03d}",
+                    [tel_index, hillas, LeakageContainer()],
+                )
+
+    return path
+
+
+def test_read_dl1_parameters(dl1_parameters_file):
+    result = read_dl1_parameters(dl1_parameters_file)
+    assert set(result.keys()) == {"tel_001", "tel_002"}
+
+    tel_001 = result["tel_001"]
+    assert isinstance(tel_001, QTable)
+    assert len(tel_001) == 10
+    assert len(result["tel_002"]) == 5
+    assert "leakage_intensity_width_1" in tel_001.colnames
+    assert tel_001["hillas_length"].unit == u.m
+
+    # showers are joined on the event
+    assert np.all(tel_001["event_id"] == np.arange(10))
+    assert np.allclose(tel_001["true_energy"].to_value(u.TeV), np.arange(10) + 1)
+    assert np.allclose(
+        result["tel_002"]["true_energy"].to_value(u.TeV), np.arange(0, 10, 2) + 1
+    )
+
+
+def test_read_dl1_parameters_selection(dl1_parameters_file):
+    with tables.open_file(dl1_parameters_file) as f:
+        table = read_dl1_parameters(
+            f,
+            telescopes=["tel_001"],
+            columns=["hillas_intensity"],
+            simulation_columns=["true_energy"],
+            condition="hillas_intensity > 25",
+            chunk_size=3,
+            stack=True,
+            as_table=False,
+        )
+
+    assert isinstance(table, np.ndarray)
+    assert table.dtype.names == (
+        "obs_id",
+        "event_id",
+        "tel_id",
+        "hillas_intensity",
+        "true_energy",
+    )
+    assert np.all(table["event_id"] == np.arange(3, 10))
+
+
+def test_read_dl1_parameters_stacked(dl1_parameters_file):
+    table = read_dl1_parameters(dl1_parameters_file, simulation=False, stack=True)
+    assert len(table) == 15
+    assert "true_energy" not in table.colnames
+    assert set(np.unique(table["tel_id"])) == {1, 2}
+
+    with pytest.raises(KeyError):
+        read_dl1_parameters(dl1_parameters_file, columns=["does_not_exist"])
+
+
+def test_join_indices():
+    right_obs_id = np.array([2, 1, 2, 1, 3])
+    right_event_id = np.array([5, 7, 1, 5, 5])
+    left_obs_id = np.array([1, 1, 2, 2, 3, 4, 3])
+    left_event_id = np.array([5, 7, 1, 7, 5, 5, 6])
+
+    indices = _join_indices(left_obs_id, left_event_id, right_obs_id, right_event_id)
+    assert indices.tolist() == [3, 1, 2, -1, 4, -1, -1]
+
+    empty = np.array([], dtype=int)
+    assert _join_indices(left_obs_id, left_event_id, empty, empty).tolist() == [-1] * 7
@@ -167,3 +167,41 @@ def test_allowed_tels_from_config():
     config = Config({"EventSource": {"input_url": dataset, "allowed_tels": {1, 3}}})
     reader = EventSource(config=config, parent=None)
     assert len(reader.allowed_tels) == 2
+
+
+def test_prefetch():
+    dataset = get_dataset_path("gamma_test_large.simtel.gz")
+
+    with EventSource(input_url=dataset, max_events=5) as source:
+        expected = [event.index.event_id for event in source]
+
+    with EventSource(input_url=dataset, max_events=5, prefetch=3) as source:
+        events = list(source)
+
+    assert [event.index.event_id for event in events] == expected
+    # all events are separate containers
+    assert len(set(map(id, events))) == len(events)
+
+
+def test_prefetch_stop_early():
+    dataset = get_dataset_path("gamma_test_large.simtel.gz")
+
+    with EventSource(input_url=dataset, prefetch=2) as source:
+        for event in source:
+            break
+
+    assert event.count == 0
+
+
+class BrokenReader(DummyReader):
+    def _generator(self):
+        yield 0
+        raise IOError("broken file")
+
+
+def test_prefetch_error():
+    dataset = get_dataset_path("gamma_test_large.simtel.gz")
+    reader = BrokenReader(input_url=dataset, prefetch=2)
+
+    with pytest.raises(IOError, match="broken file"):
+        list(reader)
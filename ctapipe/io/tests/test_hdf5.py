@@ -590,6 +590,23 @@ def test_column_transforms(tmp_path):
             assert np.allclose(data.value, [6.0, 6.0, 6.0])
 
 
+def test_column_transform_after_first_write(tmp_path):
+    """ a transform added after the table is initialized is applied """
+    tmp_file = tmp_path / "test_column_transform_after_first_write.hdf5"
+
+    class SomeContainer(Container):
+        value = Field(-1, "some value that should be transformed")
+
+    with HDF5TableWriter(tmp_file, group_name="data") as writer:
+        writer.write("mytable", SomeContainer(value=1.0))
+        writer.add_column_transform("mytable", "value", lambda x: 2 * x)
+        writer.write("mytable", SomeContainer(value=1.0))
+
+    with HDF5TableReader(tmp_file, mode="r") as reader:
+        values = [c.value for c in reader.read("/data/mytable", SomeContainer())]
+    assert values == [1.0, 2.0]
+
+
 def test_filters():
     from tables import Filters, open_file
 
@@ -664,6 +681,77 @@ def test_writing_nan_defaults():
             writer.write("params", params.values())
 
 
+@pytest.mark.parametrize("buffer_size", [None, 1, 7])
+def test_write_buffered(tmp_path, buffer_size):
+    """ rows are buffered and all appended when the writer is closed """
+    tmp_file = tmp_path / "test_write_buffered.hdf5"
+
+    class SomeContainer(Container):
+        value = Field(-1, "some value")
+        length = Field(0 * u.m, "some length", unit=u.cm)
+
+    with HDF5TableWriter(tmp_file, "data", buffer_size=buffer_size) as writer:
+        for i in range(20):
+            writer.write("table", SomeContainer(value=i, length=i * u.m))
+
+        writer.flush()
+        assert writer._tables["table"].nrows == 20
+
+        writer.write("table", SomeContainer(value=20, length=20 * u.m))
+
+    with tables.open_file(tmp_file, "r") as f:
+        table = f.root.data.table[:]
+
+    assert len(table) == 21
+    assert np.all(table["value"] == np.arange(21))
+    assert np.allclose(table["length"], 100 * np.arange(21))
+
+
+def test_read_chunked(tmp_path):
+    """ the same containers are yielded independent of the chunk size """
+    tmp_file = tmp_path / "test_read_chunked.hdf5"
+
+    class SomeContainer(Container):
+        value = Field(-1, "some value")
+        length = Field(0 * u.m, "some length", unit=u.cm)
+        image = Field(None, "some image")
+        event_type = Field(containers.EventType.SUBARRAY, "some enum")
+
+    with HDF5TableWriter(tmp_file, "data") as writer:
+        for i in range(10):
+            writer.write(
+                "table",
+                SomeContainer(
+                    value=i,
+                    length=i * u.m,
+                    image=np.full(5, i, dtype=np.float32) * u.deg,
+                    event_type=containers.EventType(32 if i % 2 else 255),
+                ),
+            )
+
+    with HDF5TableReader(tmp_file) as reader:
+        expected = [
+            c.as_dict()
+            for c in reader.read("/data/table", SomeContainer(), chunk_size=1)
+        ]
+        assert len(expected) == 10
+
+    for chunk_size in (None, 3, 100):
+        with HDF5TableReader(tmp_file) as reader:
+            result = [
+                c.as_dict()
+                for c in reader.read(
+                    "/data/table", SomeContainer(), chunk_size=chunk_size
+                )
+            ]
+
+        assert len(result) == len(expected)
+        for row, expected_row in zip(result, expected):
+            for key, value in expected_row.items():
+                assert type(row[key]) is type(value)
+                assert np.all(row[key] == value)
+
+
 ALL_CONTAINERS = []
 for name in dir(containers):
     try:
@@ -0,0 +1,107 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from ctapipe.containers import ArrayEventContainer
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+from ctapipe.io.sharedmemory import (  # noqa: E402
+    SharedArray,
+    SharedMemoryEventTransport,
+    SharedMemoryRingBuffer,
+    _HEADER_SIZE,
+)
+
+
+@pytest.fixture
+def ring_buffer():
+    buffer = SharedMemoryRingBuffer(size=1024)
+    yield buffer
+    buffer.close()
+    buffer.unlink()
+
+
+def test_ring_buffer_roundtrip(ring_buffer):
+    array = np.arange(10, dtype=np.float32).reshape(2, 5)
+    shared = ring_buffer.put(array)
+
+    assert isinstance(shared, SharedArray)
+    np.testing.assert_array_equal(ring_buffer.array(shared), array)
+    assert ring_buffer.describe(ring_buffer.array(shared)) == shared
+    assert ring_buffer.describe(array) is None
+
+    # access from a second handle, as done by other processes
+    other = SharedMemoryRingBuffer(name=ring_buffer.name)
+    np.testing.assert_array_equal(other.array(shared), array)
+    other.close()
+
+
+def test_ring_buffer_full_and_release(ring_buffer):
+    array = np.ones(64, dtype=np.float64)  # 512 bytes
+
+    assert ring_buffer.put(array) is not None
+    assert ring_buffer.put(array) is not None
+    assert ring_buffer.put(array) is None
+    assert ring_buffer.put(np.ones(1000)) is None
+    assert ring_buffer.put(np.array([None])) is None
+
+    ring_buffer.release(ring_buffer.position)
+    shared = ring_buffer.put(2 * array)
+    assert shared is not None
+    np.testing.assert_array_equal(ring_buffer.array(shared), 2 * array)
+
+
+def test_ring_buffer_wraps_around(ring_buffer):
+    small = np.zeros(40, dtype=np.float64)  # 320 bytes, 320 aligned
+    large = np.arange(96, dtype=np.float64)  # 768 bytes
+
+    ring_buffer.put(small)
+    ring_buffer.release(ring_buffer.position)
+    ring_buffer.put(small)
+
+    # doesn't fit between the current position and the end of the buffer,
+    # nor into the beginning as the second small array is still in use
+    assert ring_buffer.put(large) is None
+
+    ring_buffer.release(ring_buffer.position)
+    shared = ring_buffer.put(large)
+    # stored at the beginning of the buffer
+    assert shared.offset == _HEADER_SIZE
+    np.testing.assert_array_equal(ring_buffer.array(shared), large)
+
+
+def test_event_transport():
+    event = ArrayEventContainer()
+    waveform = np.random.default_rng(0).normal(size=(1, 10, 20))
+    event.r1.tel[1].waveform = waveform
+    event.dl1.tel[1].image = waveform.sum(axis=2)[0]
+    event.dl1.tel[1].image_mask = event.dl1.tel[1].image > 0
+
+    sender = SharedMemoryEventTransport(buffer_size=100000)
+    receiver = SharedMemoryEventTransport(buffer_size=100000)
+
+    try:
+        sender.pack(event)
+        assert isinstance(event.r1.tel[1].waveform, SharedArray)
+        assert isinstance(event.dl1.tel[1].image_mask, SharedArray)
+        # not set, so nothing to transport
+        assert event.dl1.tel[1].peak_time is None
+
+        received = receiver.unpack(pickle.loads(pickle.dumps(event)))
+        np.testing.assert_array_equal(received.r1.tel[1].waveform, waveform)
+        np.testing.assert_array_equal(
+            received.dl1.tel[1].image_mask, waveform.sum(axis=2)[0] > 0
+        )
+
+        # sending back arrays living in shared memory does not copy them
+        receiver.pack(received)
+        assert received.r1.tel[1].waveform == event.r1.tel[1].waveform
+        assert receiver.position[1] == 0
+
+        receiver.release(sender.position)
+    finally:
+        received = None
+        receiver.close()
+        sender.close()
@@ -236,6 +236,56 @@ def test_true_image():
                 assert np.count_nonzero(tel.true_image) > 0
 
 
+def test_reuse_containers():
+    """Reused containers and buffers are filled with the same data"""
+    with SimTelEventSource(input_url=gamma_test_large_path, max_events=5) as source:
+        expected = [copy.deepcopy(event) for event in source]
+
+    with SimTelEventSource(
+        input_url=gamma_test_large_path, max_events=5, reuse_containers=True
+    ) as source:
+        assert not source.yields_new_containers
+
+        buffers = {}
+        containers = {}
+        first = None
+        for event, expected_event in zip_longest(source, expected):
+            if first is None:
+                first = event
+            assert event is first
+
+            assert event.index.event_id == expected_event.index.event_id
+            assert set(event.r1.tel) == set(expected_event.r1.tel)
+            assert event.simulation.shower == expected_event.simulation.shower
+
+            for tel_id, r1 in event.r1.tel.items():
+                expected_r1 = expected_event.r1.tel[tel_id]
+                assert np.all(r1.waveform == expected_r1.waveform)
+                assert np.all(
+                    r1.selected_gain_channel == expected_r1.selected_gain_channel
+                )
+                assert np.all(
+                    event.simulation.tel[tel_id].true_image
+                    == expected_event.simulation.tel[tel_id].true_image
+                )
+                assert np.all(
+                    event.calibration.tel[tel_id].dl1.time_shift
+                    == expected_event.calibration.tel[tel_id].dl1.time_shift
+                )
+                assert event.dl1.tel[tel_id].image is None
+
+                # containers and buffers are allocated once per telescope
+                dl1 = containers.setdefault(tel_id, event.dl1.tel[tel_id])
+                assert event.dl1.tel[tel_id] is dl1
+                waveform = buffers.setdefault(tel_id, r1.waveform)
+                if waveform.shape == r1.waveform.shape:
+                    assert r1.waveform is waveform
+
+            # simulate processing, must not leak into the next event
+            for dl1 in event.dl1.tel.values():
+                dl1.image = np.ones(1)
+
+
 def test_camera_caching():
     """Test if same telescope types share a single instance of CameraGeometry"""
     source = SimTelEventSource(input_url=gamma_test_large_path)
@@ -305,6 +355,31 @@ def test_apply_simtel_r1_calibration_2_channel():
     assert r1_waveforms[1, 0] == (r0_waveforms[0, 1, 0] - ped[0, 1]) * dc_to_pe[0, 1]
 
 
+def test_apply_simtel_r1_calibration_out():
+    rng = np.random.default_rng(0)
+    r0_waveforms = rng.integers(0, 4500, (2, 100, 40)).astype(np.uint16)
+    pedestal = rng.uniform(200, 300, (2, 100)).astype(np.float32)
+    dc_to_pe = rng.uniform(0.01, 0.1, (2, 100)).astype(np.float32)
+    gain_selector = ThresholdGainSelector(threshold=4000)
+
+    out = np.full((100, 40), np.nan, dtype=np.float32)
+    r1_waveforms, selected_gain_channel = apply_simtel_r1_calibration(
+        r0_waveforms, pedestal, dc_to_pe, gain_selector, out=out
+    )
+    assert r1_waveforms is out
+
+    pixels = np.arange(100)
+    expected = (r0_waveforms - pedestal[..., np.newaxis]) * dc_to_pe[..., np.newaxis]
+    expected = expected[selected_gain_channel, pixels]
+    assert np.any(selected_gain_channel == 1)
+    assert np.allclose(r1_waveforms, expected, rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        apply_simtel_r1_calibration(
+            r0_waveforms, pedestal, dc_to_pe, gain_selector, out=out[:10]
+        )
+
+
 def test_effective_focal_length():
     test_file_url = (
         "https://github.com/cta-observatory/pyeventio/raw/master/tests"
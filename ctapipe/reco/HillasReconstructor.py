@@ -10,22 +10,22 @@ from ctapipe.reco.reco_algorithms import (
     InvalidWidthException,
     TooFewTelescopesException,
 )
-from ctapipe.containers import ReconstructedShowerContainer
-from itertools import combinations
-
-from ctapipe.coordinates import (
-    CameraFrame,
-    GroundFrame,
-    TiltedGroundFrame,
-    project_to_ground,
-    MissingFrameAttributeWarning,
+from ctapipe.reco.stereo_utils import (
+    group_events,
+    pair_indices,
+    pointing_matrices,
+    sum_by_event,
+    telescope_arrays,
+    tilted_positions,
 )
+from ctapipe.containers import ReconstructedShowerContainer
+from ctapipe.coordinates import project_tilted_to_ground
+
 from astropy.coordinates import (
-    SkyCoord,
     spherical_to_cartesian,
     cartesian_to_spherical,
 )
-import warnings
+from astropy.table import QTable
 
 import numpy as np
 
@@ -87,6 +87,118 @@ def line_line_intersection_3d(uvw_vectors, origins):
     return np.linalg.inv(S) @ C
 
 
+def _camera_to_horizon(x, y, focal_length, altitude, azimuth):
+    """
+    Direction vectors of camera positions ``x``, ``y`` for telescopes pointing
+    at ``altitude``, ``azimuth``, in the clockwise convention of `HillasPlane`.
+    Plain numpy version of the transformation from
+    `~ctapipe.coordinates.CameraFrame` into the horizontal frame.
+    """
+    fov_lat = x / focal_length
+    fov_lon = y / focal_length
+    telescope = np.column_stack(
+        [
+            np.cos(fov_lat) * np.cos(fov_lon),
+            np.cos(fov_lat) * np.sin(fov_lon),
+            np.sin(fov_lat),
+        ]
+    )
+    # the transposed matrix is the inverse rotation
+    horizon = np.einsum("nji,nj->ni", pointing_matrices(altitude, azimuth), telescope)
+    horizon[:, 1] *= -1
+    return horizon
+
+
+def _horizon_to_camera(vectors, focal_length, altitude, azimuth):
+    """ inverse of `_camera_to_horizon`, returns x and y """
+    horizon = vectors * np.array([1.0, -1.0, 1.0])
+    telescope = np.einsum("nij,nj->ni", pointing_matrices(altitude, azimuth), horizon)
+    fov_lon = np.arctan2(telescope[:, 1], telescope[:, 0])
+    fov_lat = np.arctan2(telescope[:, 2], np.hypot(telescope[:, 0], telescope[:, 1]))
+    return fov_lat * focal_length, fov_lon * focal_length
+
+
+def _plane_normals(a, b):
+    """ normal vectors of the planes spanned by the direction vectors a and b """
+    c = np.cross(np.cross(a, b), a)
+    normals = np.cross(a, c)
+    return normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+
+
+def _line_intersections(directions, origins, event_index, n_events):
+    """
+    Least-squares intersection point of the lines of each event,
+    see `line_line_intersection_3d`. NaN for events without a unique solution.
+    """
+    directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    norm_matrices = directions[:, :, np.newaxis] * directions[:, np.newaxis, :]
+    norm_matrices -= np.eye(3)
+
+    S = sum_by_event(norm_matrices, event_index, n_events)
+    C = sum_by_event(
+        np.einsum("nij,nj->ni", norm_matrices, origins), event_index, n_events
+    )
+
+    result = np.full((n_events, 3), np.nan)
+    with np.errstate(invalid="ignore"):
+        solvable = np.isfinite(S).all(axis=(1, 2)) & (np.linalg.det(S) != 0)
+    if solvable.any():
+        result[solvable] = np.linalg.solve(S[solvable], C[solvable, :, np.newaxis])[
+            ..., 0
+        ]
+    return result
+
+
+def _estimate_direction(normals, weights, event_index, n_events):
+    """
+    Weighted sum of the crossings of all pairs of hillas planes of each event,
+    returns the normalised direction and the mean angle to the crossings.
+    """
+    first, second = pair_indices(event_index, n_events)
+
+    # cross product automatically weighs in the angle between
+    # the two vectors: narrower angles have less impact,
+    # perpendicular vectors have the most
+    crossings = np.cross(normals[first], normals[second])
+
+    # two great circles cross each other twice (one would be
+    # the origin, the other one the direction of the gamma) it
+    # doesn't matter which we pick but it should at least be
+    # consistent: make sure to always take the "upper" solution
+    crossings[crossings[:, 2] < 0] *= -1
+    crossings *= (weights[first] * weights[second])[:, np.newaxis]
+
+    pair_event = event_index[first]
+    direction = sum_by_event(crossings, pair_event, n_events)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+
+        cos_angles = np.einsum("ni,ni->n", direction[pair_event], crossings)
+        cos_angles /= np.linalg.norm(crossings, axis=1)
+        off_angles = np.arccos(np.clip(cos_angles, -1.0, 1.0))
+
+        n_pairs = np.bincount(pair_event, minlength=n_events)
+        err_est_dir = sum_by_event(off_angles, pair_event, n_events) / n_pairs
+
+    return direction, err_est_dir
+
+
+def _estimate_core_position(psi, tilted, trans, event_index, n_events):
+    """
+    Intersection of the main axes of the images in the tilted frame of
+    the array pointing of each event, projected onto the ground.
+    ``tilted`` are the x, y positions of the telescope of each row in the tilted
+    frame, ``trans`` the transformation matrices into the tilted frame
+    of each event.
+    """
+    zeros = np.zeros(len(psi))
+    directions = np.column_stack([np.cos(psi), np.sin(psi), zeros])
+    origins = np.column_stack([tilted, zeros])
+
+    core_tilted = _line_intersections(directions, origins, event_index, n_events)
+    return project_tilted_to_ground(trans, core_tilted[:, 0], core_tilted[:, 1])
+
+
 class HillasReconstructor(Reconstructor):
     """
     class that reconstructs the direction of an atmospheric shower
@@ -133,9 +245,6 @@ class HillasReconstructor(Reconstructor):
             if any width is np.nan or 0
         """
 
-        # filter warnings for missing obs time. this is needed because MC data has no obs time
-        warnings.filterwarnings(action="ignore", category=MissingFrameAttributeWarning)
-
         # stereoscopy needs at least two telescopes
         if len(hillas_dict) < 2:
             raise TooFewTelescopesException(
@@ -170,7 +279,7 @@ class HillasReconstructor(Reconstructor):
         direction, err_est_dir = self.estimate_direction()
 
         # array pointing is needed to define the tilted frame
-        core_pos = self.estimate_core_position(hillas_dict, array_pointing)
+        core_pos = self.estimate_core_position(hillas_dict, subarray, array_pointing)
 
         # container class for reconstructed showers
         _, lat, lon = cartesian_to_spherical(*direction)
@@ -195,6 +304,139 @@ class HillasReconstructor(Reconstructor):
 
         return result
 
+    def predict_table(
+        self,
+        parameters,
+        subarray,
+        array_altitude,
+        array_azimuth,
+        telescope_altitude=None,
+        telescope_azimuth=None,
+    ):
+        """
+        Reconstruct all events of a table of hillas parameters at once,
+        with the same algorithm as `predict`, using array operations
+        over all telescope events instead of a loop over events.
+
+        Parameters
+        ----------
+        parameters: astropy.table.Table
+            One row per telescope event, with the columns ``obs_id``, ``event_id``,
+            ``tel_id`` and ``hillas_x``, ``hillas_y``, ``hillas_psi``,
+            ``hillas_intensity``, ``hillas_length`` and ``hillas_width`` as in
+            the DL1 parameter tables. Rows of the same event have to be consecutive.
+        subarray: ctapipe.instrument.SubarrayDescription
+            subarray information
+        array_altitude: u.Quantity
+            Altitude of the array pointing, scalar or for each row
+        array_azimuth: u.Quantity
+            Azimuth of the array pointing, scalar or for each row
+        telescope_altitude: u.Quantity or None
+            Altitude of the pointing of the telescope of each row,
+            if None, the array pointing is used for all telescopes
+        telescope_azimuth: u.Quantity or None
+            Azimuth of the pointing of the telescope of each row
+
+        Returns
+        -------
+        astropy.table.QTable
+            One row per event with ``obs_id``, ``event_id`` and the fields of
+            `~ctapipe.containers.ReconstructedShowerContainer` computed by
+            `predict`, except ``tel_ids``. Events with less than two telescopes
+            or any width that is 0 or nan have ``is_valid=False`` and nan values.
+        """
+        n_rows = len(parameters)
+        event_index, n_events, first_row = group_events(parameters)
+
+        def column(name, unit):
+            return u.Quantity(parameters[name]).to_value(unit)
+
+        def to_radians(angle):
+            return u.Quantity(angle).to_value(u.rad)
+
+        x = column("hillas_x", u.m)
+        y = column("hillas_y", u.m)
+        psi = column("hillas_psi", u.rad)
+        length = column("hillas_length", u.m)
+        width = column("hillas_width", u.m)
+        intensity = np.asarray(parameters["hillas_intensity"], dtype=np.float64)
+
+        tel_index, focal_length, positions = telescope_arrays(parameters, subarray)
+
+        array_altitude = np.broadcast_to(to_radians(array_altitude), n_rows)
+        array_azimuth = np.broadcast_to(to_radians(array_azimuth), n_rows)
+        divergent = telescope_altitude is not None
+        if divergent:
+            altitude = np.broadcast_to(to_radians(telescope_altitude), n_rows)
+            azimuth = np.broadcast_to(to_radians(telescope_azimuth), n_rows)
+        else:
+            altitude, azimuth = array_altitude, array_azimuth
+
+        # directions of the cog and of a point on the main axis
+        cog = _camera_to_horizon(x, y, focal_length, altitude, azimuth)
+        p2_x = x + 0.1 * np.cos(psi)
+        p2_y = y + 0.1 * np.sin(psi)
+        p2 = _camera_to_horizon(p2_x, p2_y, focal_length, altitude, azimuth)
+
+        # psi as seen by a telescope with the array pointing
+        if divergent:
+            cog_x, cog_y = _horizon_to_camera(
+                cog, focal_length, array_altitude, array_azimuth
+            )
+            p2_x, p2_y = _horizon_to_camera(
+                p2, focal_length, array_altitude, array_azimuth
+            )
+            psi = np.arctan2(cog_y - p2_y, cog_x - p2_x)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = intensity * (length / width)
+            direction, err_est_dir = _estimate_direction(
+                _plane_normals(cog, p2), weights, event_index, n_events
+            )
+
+        trans, tilted = tilted_positions(
+            subarray,
+            tel_index,
+            array_altitude[first_row],
+            array_azimuth[first_row],
+            event_index,
+        )
+        core_x, core_y = _estimate_core_position(
+            psi, tilted, trans, event_index, n_events
+        )
+        h_max = np.linalg.norm(
+            _line_intersections(cog, positions, event_index, n_events), axis=1
+        )
+
+        n_tels = np.bincount(event_index, minlength=n_events)
+        valid_width = np.isfinite(width) & (width != 0)
+        is_valid = (n_tels >= 2) & (
+            np.bincount(event_index, weights=valid_width, minlength=n_events) == n_tels
+        )
+
+        _, lat, lon = cartesian_to_spherical(*direction.T)
+        # astropy's coordinates system rotates counter-clockwise.
+        # Apparently we assume it to be clockwise.
+        # that's why lon get's a sign
+        result = QTable(
+            {
+                "obs_id": np.asarray(parameters["obs_id"])[first_row],
+                "event_id": np.asarray(parameters["event_id"])[first_row],
+                "alt": u.Quantity(lat, u.deg),
+                "az": -u.Quantity(lon, u.deg),
+                "core_x": u.Quantity(core_x, u.m),
+                "core_y": u.Quantity(core_y, u.m),
+                "h_max": u.Quantity(h_max, u.m),
+                "average_intensity": sum_by_event(intensity, event_index, n_events)
+                / n_tels,
+                "alt_uncert": u.Quantity(err_est_dir, u.rad),
+                "is_valid": is_valid,
+            }
+        )
+        for name in ["alt", "az", "core_x", "core_y", "h_max", "alt_uncert"]:
+            result[name][~is_valid] = np.nan
+        return result
+
     def initialize_hillas_planes(
         self, hillas_dict, subarray, telescopes_pointings, array_pointing
     ):
@@ -215,51 +457,49 @@ class HillasReconstructor(Reconstructor):
         """
 
         self.hillas_planes = {}
-        k = next(iter(telescopes_pointings))
-        horizon_frame = telescopes_pointings[k].frame
-        for tel_id, moments in hillas_dict.items():
-            # we just need any point on the main shower axis a bit away from the cog
-            p2_x = moments.x + 0.1 * u.m * np.cos(moments.psi)
-            p2_y = moments.y + 0.1 * u.m * np.sin(moments.psi)
-            focal_length = subarray.tel[tel_id].optics.equivalent_focal_length
-
-            pointing = SkyCoord(
-                alt=telescopes_pointings[tel_id].alt,
-                az=telescopes_pointings[tel_id].az,
-                frame=horizon_frame,
+        tel_ids = list(hillas_dict.keys())
+        hillas = list(hillas_dict.values())
+
+        x = u.Quantity([h.x for h in hillas]).to_value(u.m)
+        y = u.Quantity([h.y for h in hillas]).to_value(u.m)
+        psi = u.Quantity([h.psi for h in hillas]).to_value(u.rad)
+        focal_length = u.Quantity(
+            [subarray.tel[tel_id].optics.equivalent_focal_length for tel_id in tel_ids]
+        ).to_value(u.m)
+        altitude = u.Quantity(
+            [telescopes_pointings[tel_id].alt for tel_id in tel_ids]
+        ).to_value(u.rad)
+        azimuth = u.Quantity(
+            [telescopes_pointings[tel_id].az for tel_id in tel_ids]
+        ).to_value(u.rad)
+
+        # we just need any point on the main shower axis a bit away from the cog
+        cog = _camera_to_horizon(x, y, focal_length, altitude, azimuth)
+        p2_x = x + 0.1 * np.cos(psi)
+        p2_y = y + 0.1 * np.sin(psi)
+        p2 = _camera_to_horizon(p2_x, p2_y, focal_length, altitude, azimuth)
+
+        # re-project from sky to a "fake"-parallel-pointing telescope
+        # then recalculate the psi angle
+        if self.divergent_mode:
+            array_altitude = np.full(len(tel_ids), array_pointing.alt.to_value(u.rad))
+            array_azimuth = np.full(len(tel_ids), array_pointing.az.to_value(u.rad))
+            cog_x, cog_y = _horizon_to_camera(
+                cog, focal_length, array_altitude, array_azimuth
             )
-
-            camera_frame = CameraFrame(
-                focal_length=focal_length, telescope_pointing=pointing
+            p2_x, p2_y = _horizon_to_camera(
+                p2, focal_length, array_altitude, array_azimuth
             )
+            angle_psi_corr = np.arctan2(cog_y - p2_y, cog_x - p2_x)
+            self.corrected_angle_dict = dict(zip(tel_ids, angle_psi_corr * u.rad))
 
-            cog_coord = SkyCoord(x=moments.x, y=moments.y, frame=camera_frame,)
-            cog_coord = cog_coord.transform_to(horizon_frame)
-
-            p2_coord = SkyCoord(x=p2_x, y=p2_y, frame=camera_frame)
-            p2_coord = p2_coord.transform_to(horizon_frame)
-
-            # re-project from sky to a "fake"-parallel-pointing telescope
-            # then recalculate the psi angle
-            if self.divergent_mode:
-                camera_frame_parallel = CameraFrame(
-                    focal_length=focal_length, telescope_pointing=array_pointing
-                )
-                cog_sky_to_parallel = cog_coord.transform_to(camera_frame_parallel)
-                p2_sky_to_parallel = p2_coord.transform_to(camera_frame_parallel)
-                angle_psi_corr = np.arctan2(
-                    cog_sky_to_parallel.y - p2_sky_to_parallel.y,
-                    cog_sky_to_parallel.x - p2_sky_to_parallel.x,
-                )
-                self.corrected_angle_dict[tel_id] = angle_psi_corr
-
-            circle = HillasPlane(
-                p1=cog_coord,
-                p2=p2_coord,
+        for i, (tel_id, moments) in enumerate(zip(tel_ids, hillas)):
+            self.hillas_planes[tel_id] = HillasPlane.from_vectors(
+                a=cog[i],
+                b=p2[i],
                 telescope_position=subarray.positions[tel_id],
                 weight=moments.intensity * (moments.length / moments.width),
             )
-            self.hillas_planes[tel_id] = circle
 
     def estimate_direction(self):
         """calculates the origin of the gamma as the weighted average
@@ -273,32 +513,18 @@ class HillasReconstructor(Reconstructor):
             an error estimate
         """
 
-        crossings = []
-        for perm in combinations(self.hillas_planes.values(), 2):
-            n1, n2 = perm[0].norm, perm[1].norm
-            # cross product automatically weighs in the angle between
-            # the two vectors: narrower angles have less impact,
-            # perpendicular vectors have the most
-            crossing = np.cross(n1, n2)
-
-            # two great circles cross each other twice (one would be
-            # the origin, the other one the direction of the gamma) it
-            # doesn't matter which we pick but it should at least be
-            # consistent: make sure to always take the "upper" solution
-            if crossing[2] < 0:
-                crossing *= -1
-            crossings.append(crossing * perm[0].weight * perm[1].weight)
-
-        result = normalise(np.sum(crossings, axis=0))
-        off_angles = [angle(result, cross) for cross in crossings] * u.rad
-
-        err_est_dir = np.average(
-            off_angles, weights=[len(cross) for cross in crossings]
+        planes = list(self.hillas_planes.values())
+        normals = np.array([plane.norm for plane in planes])
+        weights = u.Quantity([plane.weight for plane in planes]).to_value(
+            u.dimensionless_unscaled
         )
 
-        return result, err_est_dir
+        direction, err_est_dir = _estimate_direction(
+            normals, weights, np.zeros(len(planes), dtype=int), 1
+        )
+        return direction[0], err_est_dir[0] * u.rad
 
-    def estimate_core_position(self, hillas_dict, array_pointing):
+    def estimate_core_position(self, hillas_dict, subarray, array_pointing):
         """
         Estimate the core position by intersection the major ellipse lines of each telescope.
 
@@ -306,6 +532,9 @@ class HillasReconstructor(Reconstructor):
         -----------
         hillas_dict: dict[HillasContainer]
             dictionary of hillas moments
+        subarray : ctapipe.instrument.SubarrayDescription
+            subarray information, the tilted telescope positions are taken
+            from its cache
         array_pointing: SkyCoord[HorizonFrame]
             Pointing direction of the array
 
@@ -322,30 +551,17 @@ class HillasReconstructor(Reconstructor):
         else:
             psi = u.Quantity([h.psi for h in hillas_dict.values()])
 
-        z = np.zeros(len(psi))
-        uvw_vectors = np.column_stack([np.cos(psi).value, np.sin(psi).value, z])
-
-        tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
-        ground_frame = GroundFrame()
-
-        positions = [
-            (
-                SkyCoord(*plane.pos, frame=ground_frame)
-                .transform_to(tilted_frame)
-                .cartesian.xyz
-            )
-            for plane in self.hillas_planes.values()
-        ]
-
-        core_position = line_line_intersection_3d(uvw_vectors, positions)
-
-        core_pos_tilted = SkyCoord(
-            x=core_position[0] * u.m, y=core_position[1] * u.m, frame=tilted_frame
+        trans, tilted = subarray.tilted_positions(array_pointing.alt, array_pointing.az)
+        tel_index = [subarray.tel_indices[tel_id] for tel_id in hillas_dict]
+        core_x, core_y = _estimate_core_position(
+            psi.to_value(u.rad),
+            tilted[tel_index],
+            trans[np.newaxis],
+            np.zeros(len(psi), dtype=int),
+            1,
         )
 
-        core_pos = project_to_ground(core_pos_tilted)
-
-        return core_pos.x, core_pos.y
+        return core_x[0] * u.m, core_y[0] * u.m
 
     def estimate_h_max(self):
         """
@@ -357,10 +573,15 @@ class HillasReconstructor(Reconstructor):
             the estimated max height
         """
         uvw_vectors = np.array([plane.a for plane in self.hillas_planes.values()])
-        positions = [plane.pos for plane in self.hillas_planes.values()]
+        positions = u.Quantity(
+            [plane.pos for plane in self.hillas_planes.values()]
+        ).to_value(u.m)
 
+        intersection = _line_intersections(
+            uvw_vectors, positions, np.zeros(len(positions), dtype=int), 1
+        )
         # not sure if its better to return the length of the vector of the z component
-        return np.linalg.norm(line_line_intersection_3d(uvw_vectors, positions)) * u.m
+        return np.linalg.norm(intersection[0]) * u.m
 
 
 class HillasPlane:
@@ -404,12 +625,26 @@ class HillasPlane:
             perpendicular to a, b and c
         """
 
-        self.pos = telescope_position
-
         # astropy's coordinates system rotates counter clockwise. Apparently we assume it to
         # be clockwise
-        self.a = np.array(spherical_to_cartesian(1, p1.alt, -p1.az)).ravel()
-        self.b = np.array(spherical_to_cartesian(1, p2.alt, -p2.az)).ravel()
+        a = np.array(spherical_to_cartesian(1, p1.alt, -p1.az)).ravel()
+        b = np.array(spherical_to_cartesian(1, p2.alt, -p2.az)).ravel()
+        self._set_vectors(a, b, telescope_position, weight)
+
+    @classmethod
+    def from_vectors(cls, a, b, telescope_position, weight=1):
+        """
+        Create a plane from two unit direction vectors [x, y, z] in the
+        clockwise horizontal frame described above instead of coordinates.
+        """
+        plane = cls.__new__(cls)
+        plane._set_vectors(np.asarray(a), np.asarray(b), telescope_position, weight)
+        return plane
+
+    def _set_vectors(self, a, b, telescope_position, weight):
+        self.pos = telescope_position
+        self.a = a
+        self.b = b
 
         # a and c form an orthogonal basis for the great circle
         # not really necessary since the norm can be calculated
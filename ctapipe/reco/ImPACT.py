@@ -9,16 +9,13 @@ import numpy.ma as ma
 from astropy import units as u
 from astropy.coordinates import SkyCoord, AltAz
 from iminuit import Minuit
+from numba import njit
 from scipy.optimize import minimize, least_squares
 from scipy.stats import norm
 
-from ctapipe.coordinates import (
-    NominalFrame,
-    TiltedGroundFrame,
-    GroundFrame,
-    project_to_ground,
-)
-from ctapipe.image import neg_log_likelihood, mean_poisson_likelihood_gaussian
+from ctapipe.coordinates import NominalFrame, project_tilted_to_ground
+from ctapipe.coordinates.ground_frames import get_shower_trans_matrix
+from ctapipe.image import neg_log_likelihood_pixels, mean_poisson_likelihood_gaussian
 from ctapipe.instrument import get_atmosphere_profile_functions
 from ctapipe.containers import (
     ReconstructedShowerContainer,
@@ -33,6 +30,41 @@ from ctapipe.utils.template_network_interpolator import (
 __all__ = ["ImPACTReconstructor", "energy_prior", "xmax_prior", "guess_shower_depth"]
 
 
+@njit
+def _template_coordinates(
+    pixel_x, pixel_y, tel_x, tel_y, source_x, source_y, core_x, core_y
+):
+    """
+    Impact distance of each telescope and the positions of its pixels
+    in the coordinates of the templates in degrees, i.e. the pixel positions
+    of `ImPACTReconstructor.rotate_translate` with the rotation angle given by
+    the direction from the core to the telescope, x and y swapped and x mirrored.
+    """
+    n_tels, n_pixels = pixel_x.shape
+    impact = np.empty(n_tels)
+    template_x = np.empty((n_tels, n_pixels))
+    template_y = np.empty((n_tels, n_pixels))
+    rad_to_deg = 180 / np.pi
+
+    for tel in range(n_tels):
+        delta_tel_x = tel_x[tel] - core_x
+        delta_tel_y = tel_y[tel] - core_y
+        impact[tel] = np.sqrt(delta_tel_x ** 2 + delta_tel_y ** 2)
+        phi = np.arctan2(delta_tel_x, delta_tel_y)
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+
+        for pixel in range(n_pixels):
+            delta_x = pixel_x[tel, pixel] - source_x
+            delta_y = pixel_y[tel, pixel] - source_y
+            along = delta_x * sin_phi + delta_y * cos_phi
+            across = delta_y * sin_phi - delta_x * cos_phi
+            template_x[tel, pixel] = -rad_to_deg * along
+            template_y[tel, pixel] = rad_to_deg * across
+
+    return impact, template_x, template_y
+
+
 def guess_shower_depth(energy):
     """
     Simple estimation of depth of shower max based on the expected gamma-ray elongation
@@ -106,6 +138,7 @@ class ImPACTReconstructor(Reconstructor):
         template_scale=1.0,
         xmax_offset=0,
         use_time_gradient=False,
+        regular_grid_templates=False,
     ):
 
         # First we create a dictionary of image template interpolators
@@ -135,6 +168,11 @@ class ImPACTReconstructor(Reconstructor):
         self.image, self.time = None, None
 
         self.tel_types, self.tel_id = None, None
+        self.type_rows = None
+
+        # Mask of the pixels of the images, their amplitudes and pedestals
+        self.pixel_mask = None
+        self.selected_image, self.selected_ped = None, None
 
         # We also need telescope positions
         self.tel_pos_x, self.tel_pos_y = None, None
@@ -147,6 +185,9 @@ class ImPACTReconstructor(Reconstructor):
         self.time_prediction = dict()
 
         self.array_direction = None
+        self.zenith = None
+        # transformation matrix of the tilted frame of the array pointing
+        self.shower_trans = None
         self.array_return = False
         self.nominal_frame = None
 
@@ -154,6 +195,8 @@ class ImPACTReconstructor(Reconstructor):
         self.template_scale = template_scale
         self.xmax_offset = xmax_offset
         self.use_time_gradient = use_time_gradient
+        # interpolate pickled templates with a TemplateGridInterpolator
+        self.regular_grid_templates = regular_grid_templates
 
     def initialise_templates(self, tel_type):
         """Check if templates for a given telescope type has been initialised
@@ -174,7 +217,8 @@ class ImPACTReconstructor(Reconstructor):
                 continue
 
             self.prediction[tel_type[t]] = TemplateNetworkInterpolator(
-                self.root_dir + "/" + self.file_names[tel_type[t]][0]
+                self.root_dir + "/" + self.file_names[tel_type[t]][0],
+                regular_grid=self.regular_grid_templates,
             )
             if self.use_time_gradient:
                 self.time_prediction[tel_type[t]] = TimeGradientInterpolator(
@@ -395,16 +439,8 @@ class ImPACTReconstructor(Reconstructor):
         float: Likelihood the model represents the camera image at this position
 
         """
-        # First we add units back onto everything.  Currently not
-        # handled very well, maybe in future we could just put
-        # everything in the correct units when loading in the class
-        # and ignore them from then on
-
-        zenith = (np.pi / 2) - self.array_direction.alt.to(u.rad).value
-        azimuth = self.array_direction.az
-
         # Geometrically calculate the depth of maximum given this test position
-        x_max = self.get_shower_max(source_x, source_y, core_x, core_y, zenith)
+        x_max = self.get_shower_max(source_x, source_y, core_x, core_y, self.zenith)
         x_max *= x_max_scale
 
         # Calculate expected Xmax given this energy
@@ -419,97 +455,100 @@ class ImPACTReconstructor(Reconstructor):
         if x_max_bin < -100:
             x_max_bin = -100
 
-        # Calculate impact distance for all telescopes
-        impact = np.sqrt(
-            (self.tel_pos_x - core_x) ** 2 + (self.tel_pos_y - core_y) ** 2
-        )
-        # And the expected rotation angle
-        phi = np.arctan2((self.tel_pos_x - core_x), (self.tel_pos_y - core_y)) * u.rad
-
-        # Rotate and translate all pixels such that they match the
-        # template orientation
-        pix_y_rot, pix_x_rot = self.rotate_translate(
-            self.pixel_x, self.pixel_y, source_x, source_y, phi
+        # Impact distances and pixel positions rotated and translated
+        # such that they match the template orientation
+        impact, template_x, template_y = _template_coordinates(
+            ma.getdata(self.pixel_x),
+            ma.getdata(self.pixel_y),
+            self.tel_pos_x,
+            self.tel_pos_y,
+            source_x,
+            source_y,
+            core_x,
+            core_y,
         )
 
-        # In the interpolator class we can gain speed advantages by using masked arrays
-        # so we need to make sure here everything is masked
-        prediction = ma.zeros(self.image.shape)
-        prediction.mask = ma.getmask(self.image)
+        prediction = np.zeros(self.pixel_x.shape)
+        time_gradients = np.zeros((self.pixel_x.shape[0], 2))
 
-        time_gradients = np.zeros((self.image.shape[0], 2))
-
-        # Loop over all telescope types and get prediction
-        for tel_type in np.unique(self.tel_types).tolist():
-            type_mask = self.tel_types == tel_type
-            prediction[type_mask] = self.image_prediction(
+        # Get the predictions of all telescopes of a type at once, the
+        # interpolator skips pixels masked in the positions
+        for tel_type, rows in self.type_rows.items():
+            energies = np.full(len(rows), energy)
+            x_max_bins = np.full(len(rows), x_max_bin)
+            empty = ~self.pixel_mask[rows]
+            prediction[rows] = self.image_prediction(
                 tel_type,
-                energy * np.ones_like(impact[type_mask]),
-                impact[type_mask],
-                x_max_bin * np.ones_like(impact[type_mask]),
-                -np.rad2deg(pix_x_rot[type_mask]),
-                np.rad2deg(pix_y_rot[type_mask]),
+                energies,
+                impact[rows],
+                x_max_bins,
+                ma.masked_array(template_x[rows], mask=empty),
+                ma.masked_array(template_y[rows], mask=empty),
             )
 
             if self.use_time_gradient:
-                time_gradients[type_mask] = self.predict_time(
-                    tel_type,
-                    energy * np.ones_like(impact[type_mask]),
-                    impact[type_mask],
-                    x_max_bin * np.ones_like(impact[type_mask]),
+                time_gradients[rows] = self.predict_time(
+                    tel_type, energies, impact[rows], x_max_bins
                 )
 
         if self.use_time_gradient:
-            time_mask = np.logical_and(np.invert(ma.getmask(self.image)), self.time > 0)
-            weight = np.sqrt(self.image) * time_mask
-            rv = norm()
+            pix_x_rot = -np.deg2rad(template_x)
+            time = ma.getdata(self.time)
+            image = ma.getdata(self.image)
+            # pixels with negative amplitudes do not contribute to the fit
+            time_mask = self.pixel_mask & (time > 0) & (image > 0)
+            weight = np.sqrt(np.where(time_mask, image, 0))
 
             sx = pix_x_rot * weight
             sxx = pix_x_rot * pix_x_rot * weight
 
-            sy = self.time * weight
-            sxy = self.time * pix_x_rot * weight
+            sy = time * weight
+            sxy = time * pix_x_rot * weight
             d = weight.sum(axis=1) * sxx.sum(axis=1) - sx.sum(axis=1) * sx.sum(axis=1)
             time_fit = (
                 weight.sum(axis=1) * sxy.sum(axis=1) - sx.sum(axis=1) * sy.sum(axis=1)
             ) / d
             time_fit /= -1 * (180 / math.pi)
             chi2 = -2 * np.log(
-                rv.pdf((time_fit - time_gradients.T[0]) / time_gradients.T[1])
+                norm.pdf((time_fit - time_gradients.T[0]) / time_gradients.T[1])
             )
 
+        # Only the pixels of the images are used from here on, as plain arrays
+        prediction = prediction[self.pixel_mask]
+
         # Likelihood function will break if we find a NaN or a 0
-        prediction[np.isnan(prediction)] = 1e-8
-        prediction[prediction < 1e-8] = 1e-8
+        prediction[~(prediction >= 1e-8)] = 1e-8
         prediction *= self.template_scale
 
         # Get likelihood that the prediction matched the camera image
-        like = neg_log_likelihood(self.image, prediction, self.spe, self.ped)
+        like = neg_log_likelihood_pixels(
+            self.selected_image, prediction, self.spe, self.selected_ped
+        )
         like[np.isnan(like)] = 1e9
-        like *= np.invert(ma.getmask(self.image))
-        like = ma.MaskedArray(like, mask=ma.getmask(self.image))
 
-        array_like = like
         if goodness_of_fit:
             return np.sum(
-                like - mean_poisson_likelihood_gaussian(prediction, self.spe, self.ped)
+                like
+                - mean_poisson_likelihood_gaussian(
+                    prediction, self.spe, self.selected_ped
+                )
             )
 
         prior_pen = 0
         # Add prior penalities if we have them
-        array_like += 1e-8
+        like += 1e-8
         if "energy" in self.priors:
             prior_pen += energy_prior(energy, index=-1)
         if "xmax" in self.priors:
             prior_pen += xmax_prior(energy, x_max)
 
-        array_like += prior_pen / float(len(array_like))
+        # the penalty is shared between the telescopes
+        like += prior_pen / float(len(self.tel_pos_x))
 
         if self.array_return:
-            array_like = array_like.ravel()
-            return array_like[np.invert(ma.getmask(array_like))]
+            return like
 
-        final_sum = array_like.sum()
+        final_sum = like.sum()
         if self.use_time_gradient:
             final_sum += chi2.sum()  # * np.sum(ma.getmask(self.image))
 
@@ -563,6 +602,7 @@ class ImPACTReconstructor(Reconstructor):
         tel_y,
         array_direction,
         hillas,
+        subarray=None,
     ):
         """The setter class is used to set the event properties within this
         class before minimisation can take place. This simply copies a
@@ -581,21 +621,40 @@ class ImPACTReconstructor(Reconstructor):
             Y position of pixels in nominal system
         type_tel: dict
             Type of telescope
-        tel_x: dict
+        tel_x: dict or None
             X position of telescope in TiltedGroundFrame
-        tel_y: dict
+        tel_y: dict or None
             Y position of telescope in TiltedGroundFrame
         array_direction: SkyCoord[AltAz]
             Array pointing direction in the AltAz Frame
         hillas: dict
             dictionary with telescope IDs as key and
             HillasParametersContainer instances as values
+        subarray: ctapipe.instrument.SubarrayDescription or None
+            If given, the telescope positions in the TiltedGroundFrame are
+            taken from its cache, `SubarrayDescription.tilted_positions`,
+            and ``tel_x`` and ``tel_y`` can be None
 
         Returns
         -------
         None
 
         """
+        if subarray is not None:
+            self.shower_trans, tilted_positions = subarray.tilted_positions(
+                array_direction.alt, array_direction.az
+            )
+            if tel_x is None:
+                tel_x, tel_y = {}, {}
+                for tel_id in image:
+                    index = subarray.tel_indices[tel_id]
+                    tel_x[tel_id] = tilted_positions[index, 0] * u.m
+                    tel_y[tel_id] = tilted_positions[index, 1] * u.m
+        else:
+            self.shower_trans = get_shower_trans_matrix(
+                array_direction.az.to_value(u.rad), array_direction.alt.to_value(u.rad)
+            )
+
         # First store these parameters in the class so we can use them
         # in minimisation For most values this is simply copying
         self.image = image
@@ -656,7 +715,18 @@ class ImPACTReconstructor(Reconstructor):
         self.image[mask] = ma.masked
         self.time[mask] = ma.masked
 
+        # Precompute everything get_likelihood needs as plain arrays,
+        # so the minimiser calls do not work on masked arrays
+        self.pixel_mask = ~ma.getmaskarray(self.image)
+        self.selected_image = ma.getdata(self.image)[self.pixel_mask]
+        self.selected_ped = ma.getdata(self.ped)[self.pixel_mask]
+        self.type_rows = {
+            tel_type: np.flatnonzero(self.tel_types == tel_type)
+            for tel_type in np.unique(self.tel_types).tolist()
+        }
+
         self.array_direction = array_direction
+        self.zenith = (np.pi / 2) - array_direction.alt.to_value(u.rad)
         self.nominal_frame = NominalFrame(origin=self.array_direction)
 
         # Finally run some functions to get ready for the event
@@ -693,12 +763,9 @@ class ImPACTReconstructor(Reconstructor):
 
         source_x = nominal_seed.fov_lon.to_value(u.rad)
         source_y = nominal_seed.fov_lat.to_value(u.rad)
-        ground = GroundFrame(x=shower_seed.core_x, y=shower_seed.core_y, z=0 * u.m)
-        tilted = ground.transform_to(
-            TiltedGroundFrame(pointing_direction=self.array_direction)
-        )
-        tilt_x = tilted.x.to(u.m).value
-        tilt_y = tilted.y.to(u.m).value
+        # ground to tilted frame, the seed core is at z=0
+        core = [shower_seed.core_x.to_value(u.m), shower_seed.core_y.to_value(u.m)]
+        tilt_x, tilt_y = self.shower_trans[:2, :2] @ core
         zenith = 90 * u.deg - self.array_direction.alt
 
         seeds = spread_line_seed(
@@ -734,15 +801,11 @@ class ImPACTReconstructor(Reconstructor):
         horizon = nominal.transform_to(AltAz())
 
         shower_result.alt, shower_result.az = horizon.alt, horizon.az
-        tilted = TiltedGroundFrame(
-            x=fit_params[2] * u.m,
-            y=fit_params[3] * u.m,
-            pointing_direction=self.array_direction,
+        core_x, core_y = project_tilted_to_ground(
+            self.shower_trans, fit_params[2], fit_params[3]
         )
-        ground = project_to_ground(tilted)
-
-        shower_result.core_x = ground.x
-        shower_result.core_y = ground.y
+        shower_result.core_x = core_x * u.m
+        shower_result.core_y = core_y * u.m
 
         shower_result.is_valid = True
 
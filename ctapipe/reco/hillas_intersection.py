@@ -16,17 +16,24 @@ from ctapipe.reco.reco_algorithms import (
     InvalidWidthException,
     TooFewTelescopesException,
 )
+from ctapipe.reco.stereo_utils import (
+    group_events,
+    pair_indices,
+    pointing_matrices,
+    sum_by_event,
+    telescope_arrays,
+    tilted_positions,
+)
 from ctapipe.containers import ReconstructedShowerContainer
 from ctapipe.instrument import get_atmosphere_profile_functions
 
 from astropy.coordinates import SkyCoord
+from astropy.table import QTable
 from ctapipe.coordinates import (
     NominalFrame,
     CameraFrame,
-    TiltedGroundFrame,
-    project_to_ground,
-    GroundFrame,
     MissingFrameAttributeWarning,
+    project_tilted_to_ground,
 )
 import copy
 import warnings
@@ -36,6 +43,47 @@ from ctapipe.core import traits
 __all__ = ["HillasIntersection"]
 
 
+def _unit_vectors(lon, lat):
+    """ cartesian unit vectors of spherical coordinates in rad, shape (n, 3) """
+    return np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
+def _spherical(vectors):
+    """ lon, lat in rad of cartesian vectors of shape (n, 3) """
+    lon = np.arctan2(vectors[:, 1], vectors[:, 0])
+    lat = np.arctan2(vectors[:, 2], np.hypot(vectors[:, 0], vectors[:, 1]))
+    return lon, lat
+
+
+def _camera_to_nominal(x, y, focal_length, altitude, azimuth, origin_alt, origin_az):
+    """
+    fov_lat, fov_lon in rad of camera positions of telescopes pointing at
+    ``altitude``, ``azimuth`` in the `~ctapipe.coordinates.NominalFrame`
+    with origin ``origin_alt``, ``origin_az``, without astropy frames
+    """
+    # equidistant mapping as in the CameraFrame to TelescopeFrame transformation
+    telescope = _unit_vectors(y / focal_length, x / focal_length)
+    horizon = np.einsum(
+        "nji,nj->ni", pointing_matrices(altitude, azimuth), telescope
+    )
+    nominal = np.einsum(
+        "nij,nj->ni", pointing_matrices(origin_alt, origin_az), horizon
+    )
+    fov_lon, fov_lat = _spherical(nominal)
+    return fov_lat, fov_lon
+
+
+def _weighted_mean_and_std(values, weights, event_index, n_events):
+    """ weighted mean and standard deviation of ``values`` per event """
+    sum_weights = sum_by_event(weights, event_index, n_events)
+    mean = sum_by_event(weights * values, event_index, n_events) / sum_weights
+    deviation = (values - mean[event_index]) ** 2
+    var = sum_by_event(weights * deviation, event_index, n_events) / sum_weights
+    return mean, np.sqrt(var)
+
+
 class HillasIntersection(Reconstructor):
     """
     This class is a simple re-implementation of Hillas parameter based event
@@ -125,20 +173,16 @@ class HillasIntersection(Reconstructor):
                 tel_id: array_pointing for tel_id in hillas_dict.keys()
             }
 
-        tilted_frame = TiltedGroundFrame(pointing_direction=array_pointing)
-
-        ground_positions = subarray.tel_coords
-        grd_coord = GroundFrame(
-            x=ground_positions.x, y=ground_positions.y, z=ground_positions.z
+        trans, tilted = subarray.tilted_positions(
+            array_pointing.alt, array_pointing.az
         )
-
-        tilt_coord = grd_coord.transform_to(tilted_frame)
-
         tel_x = {
-            tel_id: tilt_coord.x[tel_id - 1] for tel_id in list(hillas_dict.keys())
+            tel_id: tilted[subarray.tel_indices[tel_id], 0] * u.m
+            for tel_id in hillas_dict
         }
         tel_y = {
-            tel_id: tilt_coord.y[tel_id - 1] for tel_id in list(hillas_dict.keys())
+            tel_id: tilted[subarray.tel_indices[tel_id], 1] * u.m
+            for tel_id in hillas_dict
         }
 
         nom_frame = NominalFrame(origin=array_pointing)
@@ -171,13 +215,12 @@ class HillasIntersection(Reconstructor):
         nom = SkyCoord(fov_lon=src_x * u.rad, fov_lat=src_y * u.rad, frame=nom_frame)
         # nom = sky_pos.transform_to(nom_frame)
         sky_pos = nom.transform_to(array_pointing.frame)
-        tilt = SkyCoord(x=core_x * u.m, y=core_y * u.m, frame=tilted_frame,)
-        grd = project_to_ground(tilt)
+        ground_x, ground_y = project_tilted_to_ground(trans, core_x, core_y)
         x_max = self.reconstruct_xmax(
             nom.fov_lon,
             nom.fov_lat,
-            tilt.x,
-            tilt.y,
+            core_x * u.m,
+            core_y * u.m,
             hillas_dict_mod,
             tel_x,
             tel_y,
@@ -189,8 +232,8 @@ class HillasIntersection(Reconstructor):
         result = ReconstructedShowerContainer(
             alt=sky_pos.altaz.alt.to(u.rad),
             az=sky_pos.altaz.az.to(u.rad),
-            core_x=grd.x,
-            core_y=grd.y,
+            core_x=ground_x * u.m,
+            core_y=ground_y * u.m,
             core_uncert=u.Quantity(np.sqrt(core_err_x ** 2 + core_err_y ** 2), u.m),
             tel_ids=[h for h in hillas_dict_mod.keys()],
             average_intensity=np.mean([h.intensity for h in hillas_dict_mod.values()]),
@@ -204,6 +247,185 @@ class HillasIntersection(Reconstructor):
 
         return result
 
+    def predict_table(
+        self,
+        parameters,
+        subarray,
+        array_altitude,
+        array_azimuth,
+        telescope_altitude=None,
+        telescope_azimuth=None,
+    ):
+        """
+        Reconstruct all events of a table of hillas parameters at once,
+        with the same algorithm as `predict`. The intersections, weights
+        and heights of all telescope pairs of all events are computed
+        with array operations, the positions of the telescopes in the
+        tilted frame once per distinct pointing.
+
+        Parameters
+        ----------
+        parameters: astropy.table.Table
+            One row per telescope event, with the columns ``obs_id``, ``event_id``,
+            ``tel_id`` and ``hillas_x``, ``hillas_y``, ``hillas_psi``,
+            ``hillas_intensity`` and ``hillas_width`` as in the DL1 parameter
+            tables. Rows of the same event have to be consecutive.
+        subarray: ctapipe.instrument.SubarrayDescription
+            subarray information
+        array_altitude: u.Quantity
+            Altitude of the array pointing, scalar or for each row
+        array_azimuth: u.Quantity
+            Azimuth of the array pointing, scalar or for each row
+        telescope_altitude: u.Quantity or None
+            Altitude of the pointing of the telescope of each row,
+            if None, the array pointing is used for all telescopes
+        telescope_azimuth: u.Quantity or None
+            Azimuth of the pointing of the telescope of each row
+
+        Returns
+        -------
+        astropy.table.QTable
+            One row per event with ``obs_id``, ``event_id`` and the fields of
+            `~ctapipe.containers.ReconstructedShowerContainer` computed by
+            `predict`, except ``tel_ids``. Events with less than two telescopes
+            or any width that is 0 or nan have ``is_valid=False`` and nan values.
+        """
+        n_rows = len(parameters)
+        event_index, n_events, first_row = group_events(parameters)
+
+        def to_value(values, unit):
+            return np.broadcast_to(u.Quantity(values).to_value(unit), n_rows)
+
+        x = to_value(parameters["hillas_x"], u.m)
+        y = to_value(parameters["hillas_y"], u.m)
+        psi = to_value(parameters["hillas_psi"], u.rad)
+        width = to_value(parameters["hillas_width"], u.m)
+        intensity = np.asarray(parameters["hillas_intensity"], dtype=np.float64)
+        tel_index, focal_length, _ = telescope_arrays(parameters, subarray)
+
+        array_altitude = to_value(array_altitude, u.rad)
+        array_azimuth = to_value(array_azimuth, u.rad)
+        if telescope_altitude is None:
+            altitude, azimuth = array_altitude, array_azimuth
+        else:
+            altitude = to_value(telescope_altitude, u.rad)
+            azimuth = to_value(telescope_azimuth, u.rad)
+
+        event_alt = array_altitude[first_row]
+        event_az = array_azimuth[first_row]
+
+        # image centroids in the nominal frame of the array pointing
+        cog_x, cog_y = _camera_to_nominal(
+            x, y, focal_length, altitude, azimuth, array_altitude, array_azimuth
+        )
+
+        trans, tilted = tilted_positions(
+            subarray, tel_index, event_alt, event_az, event_index
+        )
+        tel_x, tel_y = tilted.T
+
+        first, second = pair_indices(event_index, n_events)
+        pair_event = event_index[first]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = self._weight_method(intensity[first], intensity[second])
+            weight *= self.weight_sin(psi[first], psi[second])
+
+            # source position by intersection in the nominal frame
+            src_x, src_y = self.intersect_lines(
+                cog_x[first],
+                cog_y[first],
+                psi[first],
+                cog_x[second],
+                cog_y[second],
+                psi[second],
+            )
+            src_x, err_x = _weighted_mean_and_std(src_x, weight, pair_event, n_events)
+            src_y, err_y = _weighted_mean_and_std(src_y, weight, pair_event, n_events)
+
+            # core position by intersection in the tilted frame
+            core_x, core_y = self.intersect_lines(
+                tel_x[first],
+                tel_y[first],
+                psi[first],
+                tel_x[second],
+                tel_y[second],
+                psi[second],
+            )
+            core_x, core_err_x = _weighted_mean_and_std(
+                core_x, weight, pair_event, n_events
+            )
+            core_y, core_err_y = _weighted_mean_and_std(
+                core_y, weight, pair_event, n_events
+            )
+
+            # the source position is used as (fov_lon, fov_lat), as in predict
+            horizon = np.einsum(
+                "nji,nj->ni",
+                pointing_matrices(event_alt, event_az),
+                _unit_vectors(src_x, src_y),
+            )
+            az, alt = _spherical(horizon)
+            ground_x, ground_y = project_tilted_to_ground(trans, core_x, core_y)
+
+            height = get_shower_height(
+                src_x[event_index],
+                src_y[event_index],
+                cog_x,
+                cog_y,
+                core_x[event_index],
+                core_y[event_index],
+                tel_x,
+                tel_y,
+            )
+            mean_height = sum_by_event(
+                height * intensity, event_index, n_events
+            ) / sum_by_event(intensity, event_index, n_events)
+
+        # height above ground of the detector, see reconstruct_xmax
+        mean_height *= np.cos(np.pi / 2 - event_alt)
+        mean_height += 2100
+        mean_height[~(mean_height <= 100000)] = 100000
+
+        n_tels = np.bincount(event_index, minlength=n_events)
+        valid_width = np.isfinite(width) & (width != 0)
+        is_valid = (n_tels >= 2) & (
+            np.bincount(event_index, weights=valid_width, minlength=n_events) == n_tels
+        )
+
+        src_error = np.sqrt(err_x ** 2 + err_y ** 2)
+        result = QTable(
+            {
+                "obs_id": np.asarray(parameters["obs_id"])[first_row],
+                "event_id": np.asarray(parameters["event_id"])[first_row],
+                "alt": u.Quantity(alt, u.rad).to(u.deg),
+                "az": u.Quantity(az % (2 * np.pi), u.rad).to(u.deg),
+                "core_x": u.Quantity(ground_x, u.m),
+                "core_y": u.Quantity(ground_y, u.m),
+                "core_uncert": u.Quantity(
+                    np.sqrt(core_err_x ** 2 + core_err_y ** 2), u.m
+                ),
+                "average_intensity": sum_by_event(intensity, event_index, n_events)
+                / n_tels,
+                "alt_uncert": u.Quantity(src_error, u.rad),
+                "az_uncert": u.Quantity(src_error, u.rad),
+                "h_max": u.Quantity(mean_height, u.m),
+                "is_valid": is_valid,
+            }
+        )
+        for name in [
+            "alt",
+            "az",
+            "core_x",
+            "core_y",
+            "core_uncert",
+            "alt_uncert",
+            "az_uncert",
+            "h_max",
+        ]:
+            result[name][~is_valid] = np.nan
+        return result
+
     def reconstruct_nominal(self, hillas_parameters):
         """
         Perform event reconstruction by simple Hillas parameter intersection
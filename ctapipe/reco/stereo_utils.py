@@ -0,0 +1,124 @@
+"""
+Array operations shared by the stereo reconstructors to reconstruct all
+events of a table of telescope events at once.
+
+The telescope events of one event are consecutive rows of the table, the
+functions here take the index of the event of each row, as returned by
+`group_events`, to combine the rows per event.
+"""
+import numpy as np
+from astropy import units as u
+
+from ..coordinates.ground_frames import get_shower_trans_matrix
+
+__all__ = [
+    "pointing_matrices",
+    "group_events",
+    "telescope_arrays",
+    "sum_by_event",
+    "pair_indices",
+    "tilted_positions",
+]
+
+
+def pointing_matrices(altitude, azimuth):
+    """
+    Rotation matrices from the horizontal frame into the frame of telescopes
+    pointing at ``altitude``, ``azimuth`` (in rad), as used by
+    `~ctapipe.coordinates.TelescopeFrame`. Shape (n, 3, 3).
+    """
+    cos_alt, sin_alt = np.cos(altitude), np.sin(altitude)
+    cos_az, sin_az = np.cos(azimuth), np.sin(azimuth)
+    zero = np.zeros_like(cos_alt)
+    return np.stack(
+        [
+            np.stack([cos_alt * cos_az, cos_alt * sin_az, sin_alt], axis=-1),
+            np.stack([-sin_az, cos_az, zero], axis=-1),
+            np.stack([-sin_alt * cos_az, -sin_alt * sin_az, cos_alt], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def group_events(parameters):
+    """
+    Index of the event of each row of a table with consecutive rows
+    per (obs_id, event_id). Returns the event index, the number of events
+    and the first row of each event.
+    """
+    obs_id = np.asarray(parameters["obs_id"])
+    event_id = np.asarray(parameters["event_id"])
+
+    new_event = np.ones(len(parameters), dtype=bool)
+    new_event[1:] = (obs_id[1:] != obs_id[:-1]) | (event_id[1:] != event_id[:-1])
+    event_index = np.cumsum(new_event) - 1
+    return event_index, int(new_event.sum()), np.flatnonzero(new_event)
+
+
+def telescope_arrays(parameters, subarray):
+    """
+    index in the subarray, focal length and ground position in m
+    of the telescope of each row, from the ``tel_id`` column
+    """
+    tel_index = subarray.tel_ids_to_indices(np.asarray(parameters["tel_id"]))
+    focal_length = u.Quantity(
+        [tel.optics.equivalent_focal_length for tel in subarray.tel.values()]
+    ).to_value(u.m)
+    positions = u.Quantity(
+        [subarray.positions[tel_id] for tel_id in subarray.tel]
+    ).to_value(u.m)
+    return tel_index, focal_length[tel_index], positions[tel_index]
+
+
+def sum_by_event(values, event_index, n_events):
+    """ sum ``values`` of shape (n,) or (n, ...) per event """
+    values = np.asanyarray(values)
+    if values.ndim == 1:
+        return np.bincount(event_index, weights=values, minlength=n_events)
+
+    flat = values.reshape(len(values), -1)
+    sums = np.column_stack(
+        [
+            np.bincount(event_index, weights=column, minlength=n_events)
+            for column in flat.T
+        ]
+    )
+    return sums.reshape((n_events,) + values.shape[1:])
+
+
+def pair_indices(event_index, n_events):
+    """
+    All pairs of rows (i < j) of the same event, rows of an event
+    have to be consecutive. Returns the two row indices of each pair.
+    """
+    counts = np.bincount(event_index, minlength=n_events)
+    starts = np.cumsum(counts) - counts
+    first, second = [np.empty(0, dtype=int)], [np.empty(0, dtype=int)]
+    for n in np.unique(counts[counts > 1]):
+        i, j = np.triu_indices(n, 1)
+        offsets = starts[counts == n][:, np.newaxis]
+        first.append((offsets + i).ravel())
+        second.append((offsets + j).ravel())
+    return np.concatenate(first), np.concatenate(second)
+
+
+def tilted_positions(subarray, tel_index, altitude, azimuth, event_index):
+    """
+    Transformation matrices into the tilted frame of the pointing of each
+    event and x, y in m in that frame of the telescope of each row, as in
+    `~ctapipe.instrument.SubarrayDescription.tilted_positions`.
+    ``altitude`` and ``azimuth`` are given per event in rad.
+    """
+    pointings, pointing_index = np.unique(
+        np.column_stack([altitude, azimuth]), axis=0, return_inverse=True
+    )
+    pointing_index = pointing_index.ravel()
+    trans = get_shower_trans_matrix(pointings[:, 1], pointings[:, 0])
+
+    ground = u.Quantity(
+        [subarray.positions[tel_id] for tel_id in subarray.tel]
+    ).to_value(u.m)
+    tilted = np.einsum(
+        "nij,nj->ni", trans[pointing_index[event_index], :2], ground[tel_index]
+    )
+    return trans[pointing_index], tilted
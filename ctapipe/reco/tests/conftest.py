@@ -0,0 +1,97 @@
+"""
+common pytest fixtures for the tests of the reconstruction algorithms
+"""
+import astropy.units as u
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+
+from ctapipe.calib import CameraCalibrator
+from ctapipe.coordinates import AltAz
+from ctapipe.image.cleaning import tailcuts_clean
+from ctapipe.image.hillas import hillas_parameters, HillasParameterizationError
+from ctapipe.io import EventSource
+from ctapipe.utils import get_dataset_path
+
+
+@pytest.fixture(scope="session")
+def _hillas_events():
+    """
+    hillas parameters and array pointing of the events of a MC file, one
+    row per telescope in a DL1 table and one dict of parameters per event
+    """
+    filename = get_dataset_path("gamma_test_large.simtel.gz")
+    source = EventSource(filename, max_events=10)
+    subarray = source.subarray
+    calib = CameraCalibrator(subarray=subarray)
+
+    columns = {"obs_id": [], "event_id": [], "tel_id": []}
+    events = []
+    for event in source:
+        calib(event)
+        array_pointing = SkyCoord(
+            alt=event.pointing.array_altitude,
+            az=event.pointing.array_azimuth,
+            frame=AltAz(),
+        )
+
+        hillas_dict = {}
+        for tel_id, dl1 in event.dl1.tel.items():
+            geom = subarray.tel[tel_id].camera.geometry
+            mask = tailcuts_clean(geom, dl1.image, 10, 5)
+            try:
+                hillas_dict[tel_id] = hillas_parameters(geom[mask], dl1.image[mask])
+            except HillasParameterizationError:
+                continue
+
+        if len(hillas_dict) == 0:
+            continue
+
+        for tel_id, hillas in hillas_dict.items():
+            columns["obs_id"].append(event.index.obs_id)
+            columns["event_id"].append(event.index.event_id)
+            columns["tel_id"].append(tel_id)
+            for key, value in hillas.as_dict(add_prefix=True).items():
+                columns.setdefault(key, []).append(value)
+
+        events.append((hillas_dict, array_pointing))
+
+    table = Table(
+        {
+            key: u.Quantity(value) if isinstance(value[0], u.Quantity) else value
+            for key, value in columns.items()
+        }
+    )
+    return subarray, table, events
+
+
+@pytest.fixture(scope="function")
+def predict_hillas_table(_hillas_events):
+    """
+    Use this fixture to compare the batch reconstruction of a DL1 table of
+    hillas parameters to the per-event reconstruction. It returns a function
+    that takes the reconstructor and returns the result of ``predict_table``
+    and the result of ``predict`` for each of its rows, None for the events
+    that cannot be reconstructed.
+    """
+    subarray, table, events = _hillas_events
+
+    def predict(fit):
+        expected = []
+        for hillas_dict, array_pointing in events:
+            widths = [h.width.value for h in hillas_dict.values()]
+            if len(hillas_dict) >= 2 and all(w > 0 for w in widths):
+                expected.append(fit.predict(hillas_dict, subarray, array_pointing))
+            else:
+                expected.append(None)
+
+        array_pointing = events[-1][1]
+        result = fit.predict_table(
+            table,
+            subarray,
+            array_altitude=array_pointing.alt,
+            array_azimuth=array_pointing.az,
+        )
+        return result, expected
+
+    return predict
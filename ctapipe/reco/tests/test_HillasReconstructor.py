@@ -5,7 +5,11 @@ import pytest
 from ctapipe.image.cleaning import tailcuts_clean
 from ctapipe.image.hillas import hillas_parameters, HillasParameterizationError
 from ctapipe.io import EventSource
-from ctapipe.reco.HillasReconstructor import HillasReconstructor, HillasPlane
+from ctapipe.reco.HillasReconstructor import (
+    HillasReconstructor,
+    HillasPlane,
+    _camera_to_horizon,
+)
 from ctapipe.reco.reco_algorithms import (
     TooFewTelescopesException,
     InvalidWidthException,
@@ -13,6 +17,7 @@ from ctapipe.reco.reco_algorithms import (
 from ctapipe.utils import get_dataset_path
 from astropy.coordinates import SkyCoord, AltAz
 from ctapipe.calib import CameraCalibrator
+from ctapipe.coordinates import CameraFrame
 
 
 def test_estimator_results():
@@ -223,3 +228,51 @@ def test_invalid_events():
         hillas_dict_zero_width[tel_id]["width"] = np.nan * u.m
         with pytest.raises(InvalidWidthException):
             fit.predict(hillas_dict_nan_width, subarray, tel_azimuth, tel_altitude)
+
+
+def test_camera_to_horizon():
+    """ the numpy transformation agrees with the astropy frames """
+    x = np.array([0.0, 0.1, -0.3, 0.5])
+    y = np.array([0.0, -0.2, 0.4, 0.05])
+    focal_length = np.array([28.0, 16.0, 16.0, 5.6])
+    alt = np.deg2rad([70.0, 60.0, 45.0, 85.0])
+    az = np.deg2rad([0.0, 90.0, 200.0, 330.0])
+
+    vectors = _camera_to_horizon(x, y, focal_length, alt, az)
+
+    horizon_frame = AltAz()
+    for i in range(len(x)):
+        pointing = SkyCoord(alt=alt[i] * u.rad, az=az[i] * u.rad, frame=horizon_frame)
+        frame = CameraFrame(
+            focal_length=focal_length[i] * u.m, telescope_pointing=pointing
+        )
+        coord = SkyCoord(x=x[i] * u.m, y=y[i] * u.m, frame=frame)
+        expected = HillasPlane(
+            p1=coord.transform_to(horizon_frame),
+            p2=pointing,
+            telescope_position=[0, 0, 0] * u.m,
+        ).a
+        np.testing.assert_allclose(vectors[i], expected, atol=1e-12)
+
+
+def test_predict_table(predict_hillas_table):
+    """ batch reconstruction of a table gives the same results as predict """
+    result, expected = predict_hillas_table(HillasReconstructor())
+
+    assert len(result) == len(expected)
+    assert result["is_valid"].sum() > 0
+    for row, container in zip(result, expected):
+        if container is None:
+            assert not row["is_valid"]
+            continue
+
+        assert row["is_valid"]
+        for key in ["alt", "az", "core_x", "core_y", "h_max", "alt_uncert"]:
+            unit = row[key].unit
+            assert np.isclose(
+                row[key].to_value(unit),
+                u.Quantity(container[key]).to_value(unit),
+                rtol=1e-6,
+                atol=1e-6,
+            ), key
+        assert np.isclose(row["average_intensity"], container.average_intensity)
@@ -7,7 +7,8 @@ from ctapipe.containers import (
     ReconstructedShowerContainer,
     ReconstructedEnergyContainer,
 )
-from ctapipe.reco.ImPACT import ImPACTReconstructor
+from ctapipe.reco.ImPACT import ImPACTReconstructor, _template_coordinates
+from ctapipe.instrument import SubarrayDescription, TelescopeDescription
 from ctapipe.containers import HillasParametersContainer
 from astropy.coordinates import Angle, AltAz, SkyCoord
 
@@ -76,6 +77,26 @@ class TestImPACT:
         assert_allclose(xt, 1, rtol=0, atol=0.001)
         assert_allclose(yt, 0, rtol=0, atol=0.001)
 
+    def test_template_coordinates(self):
+        """Test compiled rotation and translation into the template frame"""
+        rng = np.random.default_rng(0)
+        pixel_x = rng.uniform(-0.05, 0.05, (2, 5))
+        pixel_y = rng.uniform(-0.05, 0.05, (2, 5))
+        tel_x = np.array([100.0, -50.0])
+        tel_y = np.array([20.0, 80.0])
+
+        impact, template_x, template_y = _template_coordinates(
+            pixel_x, pixel_y, tel_x, tel_y, 0.01, -0.02, 10.0, 5.0
+        )
+
+        phi = np.arctan2(tel_x - 10, tel_y - 5)
+        pix_y_rot, pix_x_rot = ImPACTReconstructor.rotate_translate(
+            pixel_x, pixel_y, 0.01, -0.02, phi
+        )
+        assert_allclose(impact, np.hypot(tel_x - 10, tel_y - 5))
+        assert_allclose(template_x, -np.rad2deg(pix_x_rot))
+        assert_allclose(template_y, np.rad2deg(pix_y_rot))
+
     def test_translation(self):
         """Test pixel translation function"""
         x = np.array([0])
@@ -109,6 +130,54 @@ class TestImPACT:
         shower_max = self.impact_reco.get_shower_max(0, 0, 0, 100, 0)
         assert_allclose(shower_max, 484.2442217190515, rtol=0.01)
 
+    def test_tilted_positions_from_subarray(self):
+        """
+        Test that the telescope positions in the tilted frame are taken
+        from the subarray if not given
+        """
+        tel = TelescopeDescription.from_name(optics_name="MST", camera_name="NectarCam")
+        subarray = SubarrayDescription(
+            "test",
+            tel_positions={1: [100, 0, 0] * u.m, 2: [0, 50, 0] * u.m},
+            tel_descriptions={1: tel, 2: tel},
+        )
+        image = np.array([1, 1, 1])
+        pixel_x = np.array([1, 1, 1]) * u.deg
+        pixel_y = np.array([1, 1, 1]) * u.deg
+        array_pointing = SkyCoord(
+            alt=70 * u.deg, az=0 * u.deg, frame=self.horizon_frame
+        )
+
+        self.impact_reco.set_event_properties(
+            {2: image},
+            {2: image},
+            {2: pixel_x},
+            {2: pixel_y},
+            {2: "DUMMY"},
+            None,
+            None,
+            array_direction=array_pointing,
+            hillas={2: self.h1},
+            subarray=subarray,
+        )
+        assert_allclose(self.impact_reco.tel_pos_x, [0], atol=1e-10)
+        assert_allclose(self.impact_reco.tel_pos_y, [50])
+
+        self.impact_reco.set_event_properties(
+            {1: image},
+            {1: image},
+            {1: pixel_x},
+            {1: pixel_y},
+            {1: "DUMMY"},
+            None,
+            None,
+            array_direction=array_pointing,
+            hillas={1: self.h1},
+            subarray=subarray,
+        )
+        assert_allclose(self.impact_reco.tel_pos_x, [100 * np.sin(np.deg2rad(70))])
+        assert_allclose(self.impact_reco.tel_pos_y, [0], atol=1e-10)
+
     @pytest.mark.skip("need a dataset for this to work")
     def test_image_prediction(self):
         pixel_x = np.array([0]) * u.deg
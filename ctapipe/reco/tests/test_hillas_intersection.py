@@ -297,3 +297,27 @@ def test_reconstruction():
         assert fit_result.is_valid
 
     assert reconstructed_events > 0
+
+
+def test_predict_table(predict_hillas_table):
+    """ batch reconstruction of a table gives the same results as predict """
+    result, expected = predict_hillas_table(HillasIntersection())
+
+    assert len(result) == len(expected)
+    assert result["is_valid"].sum() > 0
+    for row, container in zip(result, expected):
+        if container is None:
+            assert not row["is_valid"]
+            continue
+
+        assert row["is_valid"]
+        for key in ["alt", "az", "core_x", "core_y", "core_uncert", "h_max"]:
+            unit = row[key].unit
+            assert_allclose(
+                row[key].to_value(unit),
+                u.Quantity(container[key]).to_value(unit),
+                rtol=1e-6,
+                atol=1e-6,
+                err_msg=key,
+            )
+        assert_allclose(row["average_intensity"], container.average_intensity)
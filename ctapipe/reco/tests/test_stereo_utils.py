@@ -0,0 +1,27 @@
+import astropy.units as u
+import numpy as np
+
+from ctapipe.reco.stereo_utils import tilted_positions
+
+
+def test_tilted_positions(example_subarray):
+    """ tilted positions of each row match those of the subarray """
+    subarray = example_subarray
+    altitude = np.deg2rad([70.0, 70.0, 60.0])
+    azimuth = np.deg2rad([0.0, 0.0, 180.0])
+    event_index = np.array([0, 0, 1, 1, 1, 2, 2])
+    tel_index = np.array([0, 1, 0, 2, 3, 1, 4])
+
+    trans, tilted = tilted_positions(
+        subarray, tel_index, altitude, azimuth, event_index
+    )
+    assert trans.shape == (3, 3, 3)
+    assert tilted.shape == (7, 2)
+
+    for event in range(3):
+        expected_trans, expected_tilted = subarray.tilted_positions(
+            altitude[event] * u.rad, azimuth[event] * u.rad
+        )
+        rows = event_index == event
+        np.testing.assert_allclose(trans[event], expected_trans)
+        np.testing.assert_allclose(tilted[rows], expected_tilted[tel_index[rows]])
@@ -1,9 +1,11 @@
 """
 Merge DL1-files from stage1-process tool
 """
+import logging
 import sys
 import os
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from traitlets import List
 
@@ -75,6 +77,51 @@ parameter_nodes = {
 simu_images = {"/simulation/event/telescope/images"}
 
 
+def check_file_broken(file_path, usable_nodes, subarray):
+    """
+    Check that the file at ``file_path`` has the given subarray and
+    all required nodes of ``usable_nodes``.
+
+    This only reads the file, so it can run in a separate process.
+
+    Returns
+    -------
+    broken: bool
+        True if the subarray does not match or a required node is missing
+    messages: list[Tuple[int, str]]
+        log level and message for each problem found
+    """
+    broken = False
+    messages = []
+
+    # Check subarray
+    if subarray != SubarrayDescription.from_hdf(file_path):
+        messages.append((logging.CRITICAL, f"Subarray does not match for {file_path}"))
+        broken = True
+
+    # Gives warning if tables for listed nodes in 'optional_nodes'
+    # are missing but continues merging the rest of the file. Gives error
+    # if any other node from 'usable_nodes' is missing.
+    with tables.open_file(file_path, mode="r") as file:
+        for node in sorted(usable_nodes):
+            if node in optional_nodes and node not in file:
+                messages.append(
+                    (
+                        logging.WARNING,
+                        f"{node} is not in {file_path}. Continue with "
+                        "merging file. This table will be incomplete "
+                        "or empty",
+                    )
+                )
+                continue
+
+            if node not in file:
+                messages.append((logging.CRITICAL, f"{node} is not in {file_path}."))
+                broken = True
+
+    return broken, messages
+
+
 class MergeTool(Tool):
     name = "ctapipe-merge"
     description = "Merges DL1-files from the stage1-process tool"
@@ -127,6 +174,22 @@ class MergeTool(Tool):
     file_pattern = traits.Unicode(
         default_value="*.h5", help="Give a specific file pattern for the input files"
     ).tag(config=True)
+    chunk_size = traits.Int(
+        default_value=100_000_000,
+        min=1,
+        help=(
+            "Maximum number of bytes read at once when appending a table "
+            "of an input file to the output file"
+        ),
+    ).tag(config=True)
+    n_jobs = traits.Int(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of processes used to check the input files "
+            "while the already checked files are merged"
+        ),
+    ).tag(config=True)
 
     parser = ArgumentParser()
     parser.add_argument("input_files", nargs="*", type=Path)
@@ -138,6 +201,7 @@ class MergeTool(Tool):
         "o": "MergeTool.output_path",
         "pattern": "MergeTool.file_pattern",
         "p": "MergeTool.file_pattern",
+        "n-jobs": "MergeTool.n_jobs",
     }
 
     flags = {
@@ -216,35 +280,40 @@ class MergeTool(Tool):
         if self.skip_parameters is True:
             self.usable_nodes = self.usable_nodes - parameter_nodes
 
-    def check_file_broken(self, file):
-        # Check that the file is not broken or any node is missing
-        file_path = file.root._v_file.filename
-        current_subarray = SubarrayDescription.from_hdf(file_path)
-        broken = False
-
-        # Check subarray
-        if self.first_subarray != current_subarray:
-            self.log.critical(f"Subarray does not match for {file_path}")
-            broken = True
-
-        # Gives warning if tables for listed nodes in 'optional_nodes'
-        # are missing but continues merging the rest of the file. Gives error
-        # if any other node from 'usable_nodes' is missing, except
-        # 'skip_broken_files' is set to True, then skip files.
-        for node in self.usable_nodes:
-            if node in optional_nodes and node not in file:
-                self.log.warning(
-                    f"{node} is not in {file_path}. Continue with "
-                    "merging file. This table will be incomplete "
-                    "or empty"
-                )
-                continue
+        # Check if first file is simulation
+        with tables.open_file(self.input_files[0], mode="r") as file:
+            self.is_simulation = "/simulation" in file.root
+
+        if self.is_simulation:
+            self.log.info("Merging simulation-files")
+        else:
+            self.usable_nodes = self.usable_nodes - simu_nodes
+            self.log.info("Merging real data")
+
+    def _check_files(self):
+        """
+        Check all input files, yielding the path and whether the file is broken.
+        If ``n_jobs > 1``, the files are checked in parallel.
+        """
+        args = (
+            [str(path) for path in self.input_files],
+            [self.usable_nodes] * len(self.input_files),
+            [self.first_subarray] * len(self.input_files),
+        )
 
-            if node not in file:
-                self.log.critical(f"{node} is not in {file_path}.")
-                broken = True
+        if self.n_jobs > 1:
+            # HDF5 is not thread safe, so use processes and not threads
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                results = pool.map(check_file_broken, *args)
+                yield from self._log_check_results(results)
+        else:
+            yield from self._log_check_results(map(check_file_broken, *args))
 
-        return broken
+    def _log_check_results(self, results):
+        for path, (broken, messages) in zip(self.input_files, results):
+            for level, message in messages:
+                self.log.log(level, message)
+            yield path, broken
 
     def add_image_statistics(self, file):
         # Creates table for image statistics and adds the entries together.
@@ -255,13 +324,12 @@ class MergeTool(Tool):
             table_out = self.output_file.root[image_statistics_path]
             table_in = file.root[image_statistics_path]
 
-            for row in range(len(table_in)):
-                table_out.cols.counts[row] = np.add(
-                    table_out.cols.counts[row], table_in.cols.counts[row]
-                )
-                table_out.cols.cumulative_counts[row] = np.add(
-                    table_out.cols.cumulative_counts[row],
-                    table_in.cols.cumulative_counts[row],
+            for col in ("counts", "cumulative_counts"):
+                n_rows = len(table_in)
+                table_out.modify_column(
+                    stop=n_rows,
+                    column=np.add(table_out.col(col)[:n_rows], table_in.col(col)),
+                    colname=col,
                 )
 
         elif "/dl1/service" not in self.output_file:
@@ -290,9 +358,7 @@ class MergeTool(Tool):
                             output_node = self.output_file.get_node(tel_node_path)
                             input_node = file.root[tel_node_path]
 
-                            # cast needed for some image parameters that are sometimes
-                            # float32 and sometimes float64
-                            output_node.append(input_node[:].astype(output_node.dtype))
+                            self._append_table(output_node, input_node)
                         else:
                             target_group = self.output_file.root[node]
                             file.copy_node(tel, newparent=target_group)
@@ -304,12 +370,12 @@ class MergeTool(Tool):
                     # a column added erronouesly which prevents merging
                     # because it's variable length
                     # TODO: remove when we no longer want to support merging 0.8 files.
-                    data = file.root[node][:]
+                    transform = None
                     if node == "/dl1/monitoring/subarray/pointing":
-                        data = self.drop_column(data, "tels_with_trigger")
+                        transform = self._drop_tels_with_trigger
 
                     output_node = self.output_file.get_node(node)
-                    output_node.append(data)
+                    self._append_table(output_node, file.root[node], transform)
 
                 else:
                     group_path, table_name = os.path.split(node)
@@ -319,17 +385,41 @@ class MergeTool(Tool):
                     target_group = self.output_file.root[group_path]
                     if node == "/dl1/monitoring/subarray/pointing":
                         h5_node = file.root[node]
-                        data = self.drop_column(h5_node[:], "tels_with_trigger")
-                        self.output_file.create_table(
+                        dtype = self._drop_tels_with_trigger(h5_node[:0]).dtype
+                        output_node = self.output_file.create_table(
                             group_path,
                             table_name,
+                            description=dtype,
                             filters=h5_node.filters,
-                            obj=data,
+                            expectedrows=h5_node.nrows,
+                        )
+                        self._append_table(
+                            output_node, h5_node, self._drop_tels_with_trigger
                         )
 
                     else:
                         file.copy_node(node, newparent=target_group)
 
+    def _append_table(self, output_node, input_node, transform=None):
+        """
+        Append the rows of ``input_node`` to ``output_node``,
+        reading at most ``chunk_size`` bytes at once.
+        """
+        chunk_rows = max(1, self.chunk_size // input_node.rowsize)
+
+        for start in range(0, input_node.nrows, chunk_rows):
+            data = input_node.read(start, start + chunk_rows)
+            if transform is not None:
+                data = transform(data)
+
+            # cast needed for some image parameters that are sometimes
+            # float32 and sometimes float64
+            output_node.append(data.astype(output_node.dtype, copy=False))
+
+    @classmethod
+    def _drop_tels_with_trigger(cls, data):
+        return cls.drop_column(data, "tels_with_trigger")
+
     def _create_group(self, node):
         head, tail = os.path.split(node)
         self.output_file.create_group(head, tail, createparents=True)
@@ -347,33 +437,21 @@ class MergeTool(Tool):
     def start(self):
         merged_files_counter = 0
 
-        for i, current_file in enumerate(
-            tqdm(
-                self.input_files,
-                desc="Merging",
-                unit="Files",
-                disable=not self.progress_bar,
-            )
+        for current_file, broken in tqdm(
+            self._check_files(),
+            desc="Merging",
+            unit="Files",
+            total=len(self.input_files),
+            disable=not self.progress_bar,
         ):
+            if broken is True:
+                if self.skip_broken_files is True:
+                    continue
+                else:
+                    self.log.critical("Broken file detected.")
+                    sys.exit(1)
 
             with tables.open_file(current_file, mode="r") as file:
-                if i == 0:
-                    # Check if first file is simulation
-                    if "/simulation" not in file.root:
-                        self.usable_nodes = self.usable_nodes - simu_nodes
-                        self.log.info("Merging real data")
-                        self.is_simulation = False
-                    else:
-                        self.log.info("Merging simulation-files")
-                        self.is_simulation = True
-
-                if self.check_file_broken(file) is True:
-                    if self.skip_broken_files is True:
-                        continue
-                    else:
-                        self.log.critical("Broken file detected.")
-                        sys.exit(1)
-
                 self.merge_tables(file)
                 self.add_image_statistics(file)
 
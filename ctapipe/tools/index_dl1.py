@@ -0,0 +1,167 @@
+"""
+Generate index tables for an existing DL1 file
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import tables
+
+from ..core import Provenance, Tool
+from ..core.traits import Bool, Dict, Int, List, Path, Unicode
+from ..io.dl1index import (
+    DEFAULT_INDEX_KINDS,
+    compute_event_index,
+    create_table_indices,
+    event_index_filename,
+    iter_tables,
+    write_event_index,
+)
+
+
+def _compute_event_index(input_url, path):
+    """ compute the event index of a table, opening the file read-only """
+    with tables.open_file(input_url, mode="r") as h5file:
+        return compute_event_index(h5file.get_node(path))
+
+
+class IndexDL1Tool(Tool):
+    """
+    Add PyTables column indices and/or lightweight (obs_id, event_id) event
+    indices to the tables of an existing DL1 file.
+    """
+
+    name = "ctapipe-index-dl1"
+    description = __doc__
+    examples = """
+    To add all indices to the event tables of a file:
+    > ctapipe-index-dl1 --input events.dl1.h5
+
+    To only create the event indices of the parameter tables, using 4 processes:
+    > ctapipe-index-dl1 --input events.dl1.h5 --no-pytables-indices --n-jobs 4 \\
+        --IndexDL1Tool.table_paths=/dl1/event/telescope/parameters
+    """
+
+    input_url = Path(
+        exists=True, directory_ok=False, help="DL1 file to add the indices to"
+    ).tag(config=True)
+
+    table_paths = List(
+        Unicode(),
+        default_value=["/dl1/event", "/simulation/event"],
+        help=(
+            "Paths of the tables to index. For groups, all tables "
+            "below the group are indexed. Missing paths are ignored."
+        ),
+    ).tag(config=True)
+
+    pytables_indices = Bool(
+        default_value=True,
+        help="Create PyTables column indices for the columns in index_kinds",
+    ).tag(config=True)
+
+    index_kinds = Dict(
+        default_value=DEFAULT_INDEX_KINDS,
+        help=(
+            "Mapping of column name to the kind of PyTables index created "
+            "for that column (ultralight, light, medium or full)"
+        ),
+    ).tag(config=True)
+
+    optlevel = Int(
+        default_value=6, min=0, max=9, help="Optimization level of the PyTables indices"
+    ).tag(config=True)
+
+    event_index = Bool(
+        default_value=True,
+        help=(
+            "Store the (obs_id, event_id) to row range index of each table "
+            "with these columns in the sidecar file <input_url>.index.h5, "
+            "used e.g. by DL1EventSource"
+        ),
+    ).tag(config=True)
+
+    n_jobs = Int(
+        default_value=1,
+        min=1,
+        help="Number of processes used to compute the event indices",
+    ).tag(config=True)
+
+    aliases = {
+        "input": "IndexDL1Tool.input_url",
+        "i": "IndexDL1Tool.input_url",
+        "n-jobs": "IndexDL1Tool.n_jobs",
+    }
+
+    flags = {
+        "no-pytables-indices": (
+            {"IndexDL1Tool": {"pytables_indices": False}},
+            "Do not create PyTables column indices",
+        ),
+        "no-event-index": (
+            {"IndexDL1Tool": {"event_index": False}},
+            "Do not store the (obs_id, event_id) event indices",
+        ),
+    }
+
+    def setup(self):
+        self.indexed_tables = []
+        self.event_tables = []
+
+        with tables.open_file(self.input_url, mode="r") as h5file:
+            for path in self.table_paths:
+                if path not in h5file:
+                    self.log.info(f"{path} is not in {self.input_url}, skipping")
+                    continue
+
+                for table in iter_tables(h5file, path):
+                    self.indexed_tables.append(table._v_pathname)
+                    if {"obs_id", "event_id"}.issubset(table.colnames):
+                        self.event_tables.append(table._v_pathname)
+
+    def _compute_event_indices(self):
+        """ compute the event indices of all tables, in parallel if n_jobs > 1 """
+        if not self.event_index:
+            return {}
+
+        paths = self.event_tables
+        urls = [str(self.input_url)] * len(paths)
+
+        if self.n_jobs > 1:
+            # the indices are computed before the file is opened for writing,
+            # as a file cannot be read while it is open for writing
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                return dict(zip(paths, pool.map(_compute_event_index, urls, paths)))
+
+        return dict(zip(paths, map(_compute_event_index, urls, paths)))
+
+    def start(self):
+        event_indices = self._compute_event_indices()
+
+        if self.pytables_indices:
+            with tables.open_file(self.input_url, mode="a") as h5file:
+                for path in self.indexed_tables:
+                    indexed = create_table_indices(
+                        h5file.get_node(path),
+                        kinds=self.index_kinds,
+                        optlevel=self.optlevel,
+                    )
+                    self.log.debug(f"generated indices for {path}: {indexed}")
+            Provenance().add_output_file(str(self.input_url), role="DL1/Event")
+
+        if event_indices:
+            # event indices go to the sidecar file, the DL1 file is only read
+            with tables.open_file(self.input_url, mode="r") as h5file:
+                for path, index in event_indices.items():
+                    write_event_index(h5file.get_node(path), index)
+                    self.log.debug(f"generated event index for {path}")
+            Provenance().add_output_file(
+                str(event_index_filename(self.input_url)), role="DL1/Event/Index"
+            )
+
+    def finish(self):
+        self.log.info(f"Indexed {len(self.indexed_tables)} tables of {self.input_url}")
+
+
+def main():
+    """ run the tool"""
+    tool = IndexDL1Tool()
+    tool.run()
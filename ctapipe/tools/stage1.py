@@ -1,18 +1,81 @@
 """
 Generate DL1 (a or b) output files in HDF5 format from {R0,R1,DL0} inputs.
 """
+import pickle
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 from tqdm.autonotebook import tqdm
 
 from ..calib.camera import CameraCalibrator, GainSelector
 from ..core import Tool
-from ..core.traits import Bool, List, classes_with_traits
+from ..core.traits import Bool, Int, List, classes_with_traits
 from ..image import ImageCleaner, ImageProcessor
 from ..image.extractor import ImageExtractor
-from ..io import DataLevel, DL1Writer, EventSource, SimTelEventSource
+from ..io import (
+    DataLevel,
+    DL1Writer,
+    EventSource,
+    SharedMemoryEventTransport,
+    SimTelEventSource,
+)
 from ..io.dl1writer import DL1_DATA_MODEL_VERSION
 
+# per-process state of the workers used by Stage1Tool if n_workers > 1
+_worker_state = {}
+
+
+def _init_worker(config, subarray, is_simulation, process_images, shared_memory_size):
+    """ set up the calibration and image processing in a worker process """
+    # the components need the tool as parent to also see its tool-scoped config
+    tool = Stage1Tool(config=config)
+
+    _worker_state["transport"] = None
+    if shared_memory_size > 0:
+        _worker_state["transport"] = SharedMemoryEventTransport(shared_memory_size)
+    _worker_state["calibrate"] = CameraCalibrator(parent=tool, subarray=subarray)
+    _worker_state["process_images"] = None
+    if process_images:
+        _worker_state["process_images"] = ImageProcessor(
+            subarray=subarray, is_simulation=is_simulation, parent=tool
+        )
+
+
+def _process_batch(pickled_events):
+    """
+    Calibrate and process a batch of pickled events in a worker process.
+
+    Returns the processed events, the image quality query counts
+    of this batch (or None if images are not processed) and the position
+    of the shared memory transport of this worker (or None if not used)
+    """
+    calibrate = _worker_state["calibrate"]
+    process_images = _worker_state["process_images"]
+    transport = _worker_state["transport"]
+
+    if process_images is not None:
+        process_images.check_image.reset_counts()
+
+    events = [pickle.loads(event) for event in pickled_events]
+    if transport is not None:
+        for event in events:
+            transport.unpack(event)
+
+    calibrate.calibrate_batch(events)
+
+    for event in events:
+        if process_images is not None:
+            process_images(event)
+        if transport is not None:
+            transport.pack(event)
+
+    position = transport.position if transport is not None else None
+    if process_images is None:
+        return events, None, position
+    return events, process_images.check_image.get_counts(), position
+
 
 class Stage1Tool(Tool):
     """
@@ -35,12 +98,42 @@ class Stage1Tool(Tool):
 
     progress_bar = Bool(help="show progress bar during processing").tag(config=True)
 
+    n_workers = Int(
+        default_value=1,
+        min=1,
+        help=(
+            "Number of processes used for calibration and image processing. "
+            "If larger than 1, events are read and written in the main process "
+            "and processed in batches by a pool of worker processes. "
+            "The output is identical to processing with a single process."
+        ),
+    ).tag(config=True)
+
+    batch_size = Int(
+        default_value=20,
+        min=1,
+        help="Number of events sent to a worker process at once if n_workers > 1",
+    ).tag(config=True)
+
+    shared_memory_size = Int(
+        default_value=0,
+        min=0,
+        help=(
+            "Size in bytes of the shared memory buffer each process uses to send "
+            "waveforms and images to other processes if n_workers > 1. "
+            "If 0, events are sent completely pickled. Arrays not fitting "
+            "into the buffer are pickled, make sure /dev/shm is large enough "
+            "for (n_workers + 1) buffers."
+        ),
+    ).tag(config=True)
+
     aliases = {
         "input": "EventSource.input_url",
         "output": "DL1Writer.output_path",
         "allowed-tels": "EventSource.allowed_tels",
         "max-events": "EventSource.max_events",
         "image-cleaner-type": "ImageProcessor.image_cleaner_type",
+        "n-workers": "Stage1Tool.n_workers",
     }
 
     flags = {
@@ -120,20 +213,108 @@ class Stage1Tool(Tool):
             serialize_meta=True,
         )
 
+    def _process_serial(self, events):
+        """ calibrate and process the events in this process """
+        for event in events:
+            self.log.log(9, "Processessing event_id=%s", event.index.event_id)
+            self.calibrate(event)
+            if self.write_dl1.write_parameters:
+                self.process_images(event)
+            yield event
+
+    def _process_parallel(self, events):
+        """
+        calibrate and process the events in batches using a pool of
+        ``n_workers`` processes, yielding the processed events in input order
+        """
+        process_images = self.write_dl1.write_parameters
+        # keep enough batches in flight to keep all workers busy,
+        # but limit the number of events held in memory
+        max_pending = 2 * self.n_workers
+
+        transport = None
+        if self.shared_memory_size > 0:
+            transport = SharedMemoryEventTransport(self.shared_memory_size)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.config,
+                    self.event_source.subarray,
+                    self.event_source.is_simulation,
+                    process_images,
+                    self.shared_memory_size,
+                ),
+            ) as pool:
+                pending = deque()
+                events = iter(events)
+
+                while True:
+                    # event sources may reuse the same container for every event,
+                    # so each event is serialized directly when it is read
+                    batch = [
+                        self._serialize(event, transport)
+                        for event in islice(events, self.batch_size)
+                    ]
+                    if batch:
+                        future = pool.submit(_process_batch, batch)
+                        position = transport.position if transport else None
+                        pending.append((future, position))
+
+                    if pending and (len(pending) >= max_pending or not batch):
+                        yield from self._collect_batch(*pending.popleft(), transport)
+                    elif not batch:
+                        break
+        finally:
+            if transport is not None:
+                # the workers have exited, so also remove their buffers
+                transport.close(unlink_attached=True)
+
+    @staticmethod
+    def _serialize(event, transport):
+        """ pickle an event, moving its large arrays to shared memory if enabled """
+        if transport is not None:
+            transport.pack(event)
+        return pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _collect_batch(self, future, position, transport):
+        """
+        yield the events of a processed batch and merge the image statistics,
+        the shared memory of the batch is released once all events were consumed
+        """
+        events, image_counts, worker_position = future.result()
+        if image_counts is not None:
+            self.process_images.check_image.merge_counts(*image_counts)
+
+        if transport is None:
+            yield from events
+            return
+
+        for event in events:
+            transport.unpack(event)
+        yield from events
+        transport.release(position)
+        transport.release(worker_position)
+
     def start(self):
         self.event_source.subarray.info(printer=self.log.info)
-        for event in tqdm(
+        events = tqdm(
             self.event_source,
             desc=self.event_source.__class__.__name__,
             total=self.event_source.max_events,
             unit="ev",
             disable=not self.progress_bar,
-        ):
+        )
 
-            self.log.log(9, "Processessing event_id=%s", event.index.event_id)
-            self.calibrate(event)
-            if self.write_dl1.write_parameters:
-                self.process_images(event)
+        if self.n_workers > 1:
+            self.log.info("Processing events using %d processes", self.n_workers)
+            events = self._process_parallel(events)
+        else:
+            events = self._process_serial(events)
+
+        for event in events:
             self.write_dl1(event)
 
     def finish(self):
@@ -2,6 +2,7 @@
 Test individual tool functionality
 """
 
+import json
 import os
 import shlex
 import sys
@@ -170,6 +171,113 @@ def test_merge(tmpdir):
                         )
 
 
+def test_merge_chunked_parallel(tmpdir):
+    """check that merging in small chunks and with several processes works"""
+    from ctapipe.tools.dl1_merge import MergeTool
+    from ctapipe.tools.stage1 import Stage1Tool
+
+    config = Path("./examples/stage1_config.json").absolute()
+    tmpdir = Path(tmpdir)
+
+    inputs = []
+    for max_events in (5, 10):
+        path = tmpdir / f"events_{max_events}.dl1.h5"
+        assert (
+            run_tool(
+                Stage1Tool(),
+                argv=[
+                    f"--config={config}",
+                    f"--input={GAMMA_TEST_LARGE}",
+                    f"--output={path}",
+                    "--write-parameters",
+                    "--write-images",
+                    f"--max-events={max_events}",
+                ],
+                cwd=tmpdir,
+            )
+            == 0
+        )
+        inputs.append(str(path))
+
+    outputs = [tmpdir / "merged.dl1.h5", tmpdir / "merged_chunked.dl1.h5"]
+    assert run_tool(MergeTool(), argv=[*inputs, f"--o={outputs[0]}"], cwd=tmpdir) == 0
+    assert (
+        run_tool(
+            MergeTool(),
+            argv=[
+                *inputs,
+                f"--o={outputs[1]}",
+                "--n-jobs=2",
+                "--MergeTool.chunk_size=1000",
+            ],
+            cwd=tmpdir,
+        )
+        == 0
+    )
+
+    with tables.open_file(outputs[0]) as merged, tables.open_file(
+        outputs[1]
+    ) as chunked:
+        for path in (
+            "/dl1/event/subarray/trigger",
+            "/dl1/event/telescope/trigger",
+            "/dl1/event/telescope/images/tel_001",
+            "/dl1/event/telescope/parameters/tel_001",
+            "/dl1/monitoring/subarray/pointing",
+            "/dl1/service/image_statistics",
+        ):
+            np.testing.assert_array_equal(merged.root[path][:], chunked.root[path][:])
+
+
+def test_index_dl1(tmpdir):
+    from ctapipe.tools.index_dl1 import IndexDL1Tool
+    from ctapipe.tools.stage1 import Stage1Tool
+    from ctapipe.io.dl1index import compute_event_index, event_index_filename
+
+    config = Path("./examples/stage1_config.json").absolute()
+    path = Path(tmpdir) / "events.dl1.h5"
+    assert (
+        run_tool(
+            Stage1Tool(),
+            argv=[
+                f"--config={config}",
+                f"--input={GAMMA_TEST_LARGE}",
+                f"--output={path}",
+                "--write-parameters",
+                "--max-events=10",
+            ],
+            cwd=tmpdir,
+        )
+        == 0
+    )
+
+    assert (
+        run_tool(
+            IndexDL1Tool(),
+            argv=[
+                f"--input={path}",
+                "--n-jobs=2",
+                "--IndexDL1Tool.table_paths=/dl1/event/telescope/parameters",
+                "--IndexDL1Tool.table_paths=/does/not/exist",
+            ],
+            cwd=tmpdir,
+        )
+        == 0
+    )
+
+    with tables.open_file(path) as f, tables.open_file(
+        event_index_filename(path)
+    ) as index_file:
+        for table in f.root.dl1.event.telescope.parameters:
+            assert table.cols.event_id.is_indexed
+            assert table.cols.obs_id.is_indexed
+            index = index_file.get_node(table._v_pathname)
+            np.testing.assert_array_equal(index.read(), compute_event_index(table))
+
+        assert not f.root.dl1.event.subarray.trigger.cols.event_id.is_indexed
+        assert "/dl1/event/subarray/trigger" not in index_file
+
+
 def test_stage_1(tmpdir):
     from ctapipe.tools.stage1 import Stage1Tool
 
@@ -252,6 +360,95 @@ def test_stage_1(tmpdir):
             assert "peak_time" in dl1_image.dtype.names
 
 
+def test_stage1_multiprocessing(tmpdir):
+    """check that processing with multiple workers gives the same output"""
+    from ctapipe.tools.stage1 import Stage1Tool
+    from ctapipe.io import read_table
+
+    config = Path("./examples/stage1_config.json").absolute()
+    outputs = []
+    for n_workers, shared_memory_size in ((1, 0), (2, 0), (2, 10_000_000)):
+        output = Path(tmpdir) / f"events_{n_workers}_{shared_memory_size}.dl1.h5"
+        assert (
+            run_tool(
+                Stage1Tool(),
+                argv=[
+                    f"--config={config}",
+                    f"--input={GAMMA_TEST_LARGE}",
+                    f"--output={output}",
+                    "--write-parameters",
+                    "--write-images",
+                    "--max-events=20",
+                    f"--n-workers={n_workers}",
+                    "--Stage1Tool.batch_size=3",
+                    f"--Stage1Tool.shared_memory_size={shared_memory_size}",
+                ],
+                cwd=tmpdir,
+            )
+            == 0
+        )
+        outputs.append(output)
+
+    for path in (
+        "/dl1/event/telescope/parameters/tel_001",
+        "/dl1/event/telescope/images/tel_001",
+        "/dl1/service/image_statistics",
+    ):
+        serial = read_table(outputs[0], path)
+        for output in outputs[1:]:
+            parallel = read_table(output, path)
+            assert serial.colnames == parallel.colnames
+            for col in serial.colnames:
+                np.testing.assert_array_equal(serial[col], parallel[col])
+
+
+def test_stage1_multiprocessing_tool_config(tmpdir):
+    """check that the worker processes also use config scoped to the tool"""
+    from ctapipe.tools.stage1 import Stage1Tool
+    from ctapipe.io import read_table
+
+    # a picture threshold that no pixel passes, only set for the tool
+    config = Path(tmpdir) / "tool_config.json"
+    config.write_text(
+        json.dumps(
+            {
+                "Stage1Tool": {
+                    "ImageProcessor": {
+                        "image_cleaner_type": "TailcutsImageCleaner",
+                        "TailcutsImageCleaner": {
+                            "picture_threshold_pe": [["type", "*", 1e6]]
+                        },
+                    }
+                }
+            }
+        )
+    )
+
+    for n_workers in (1, 2):
+        output = Path(tmpdir) / f"events_{n_workers}.dl1.h5"
+        assert (
+            run_tool(
+                Stage1Tool(),
+                argv=[
+                    f"--config={config}",
+                    f"--input={GAMMA_TEST_LARGE}",
+                    f"--output={output}",
+                    "--write-parameters",
+                    "--write-images",
+                    "--max-events=20",
+                    f"--n-workers={n_workers}",
+                    "--Stage1Tool.batch_size=3",
+                ],
+                cwd=tmpdir,
+            )
+            == 0
+        )
+
+        images = read_table(output, "/dl1/event/telescope/images/tel_001")
+        assert len(images) > 0
+        assert not np.any(images["image_mask"])
+
+
 def test_stage1_datalevels(tmpdir):
     """test the dl1 tool on a file not providing r1 or dl0"""
     from ctapipe.io import EventSource
@@ -2,6 +2,7 @@
 from .fitshistogram import Histogram
 from .table_interpolator import TableInterpolator
 from .unstructured_interpolator import UnstructuredInterpolator
+from .template_grid_interpolator import TemplateGridInterpolator
 from .datasets import (
     find_all_matching_datasets,
     get_table_dataset,
@@ -17,6 +18,7 @@ __all__ = [
     "Histogram",
     "TableInterpolator",
     "UnstructuredInterpolator",
+    "TemplateGridInterpolator",
     "find_all_matching_datasets",
     "get_table_dataset",
     "get_dataset_path",
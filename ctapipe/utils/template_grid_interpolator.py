@@ -0,0 +1,261 @@
+"""
+Interpolation of ImPACT image templates stored on a regular grid of
+(energy, impact distance, xmax) points.
+
+The image templates are generated on a regular grid, so instead of a Delaunay
+triangulation of the grid points (see `UnstructuredInterpolator`), the
+templates are stored in a single contiguous array of shape
+(n_energy, n_impact, n_xmax, n_x, n_y), which can be memory-mapped from
+disk, and interpolated by a compiled function: multilinear in the
+shower parameters and bilinear in the pixel positions.
+"""
+from pathlib import Path
+
+import numpy as np
+import numpy.ma as ma
+from numba import njit
+
+__all__ = ["TemplateGridInterpolator"]
+
+
+@njit
+def _grid_cell(axis, value):
+    """
+    Indices of the grid points around ``value`` and the weight of the upper one,
+    values outside of the grid are clipped to its edges
+    """
+    n_points = len(axis)
+    if n_points == 1 or value <= axis[0]:
+        return 0, min(1, n_points - 1), 0.0
+    if value >= axis[-1]:
+        return n_points - 2, n_points - 1, 1.0
+
+    lower = np.searchsorted(axis, value, side="right") - 1
+    weight = (value - axis[lower]) / (axis[lower + 1] - axis[lower])
+    return lower, lower + 1, weight
+
+
+@njit
+def _interpolate_templates(
+    templates,
+    energy_axis,
+    impact_axis,
+    xmax_axis,
+    bounds,
+    energy,
+    impact,
+    xmax,
+    x,
+    y,
+    mask,
+    out,
+):
+    """
+    Interpolate the templates for the shower parameters of each row of ``x``
+    and ``y`` at these positions, storing the result in ``out``.
+    Positions outside of ``bounds`` and not selected by ``mask`` are set to 0.
+    """
+    n_x, n_y = templates.shape[3], templates.shape[4]
+    scale_x = (n_x - 1) / (bounds[0, 1] - bounds[0, 0])
+    scale_y = (n_y - 1) / (bounds[1, 1] - bounds[1, 0])
+
+    cell = np.empty((3, 2), dtype=np.int64)
+    cell_weights = np.empty(3)
+    corners = np.empty((8, 3), dtype=np.int64)
+    corner_weights = np.empty(8)
+
+    for row in range(x.shape[0]):
+        cell[0, 0], cell[0, 1], cell_weights[0] = _grid_cell(energy_axis, energy[row])
+        cell[1, 0], cell[1, 1], cell_weights[1] = _grid_cell(impact_axis, impact[row])
+        cell[2, 0], cell[2, 1], cell_weights[2] = _grid_cell(xmax_axis, xmax[row])
+
+        # the 8 templates around the shower parameters and their weights
+        for corner in range(8):
+            weight = 1.0
+            for dim in range(3):
+                upper = (corner >> dim) & 1
+                corners[corner, dim] = cell[dim, upper]
+                if upper:
+                    weight *= cell_weights[dim]
+                else:
+                    weight *= 1 - cell_weights[dim]
+            corner_weights[corner] = weight
+
+        for pixel in range(x.shape[1]):
+            out[row, pixel] = 0.0
+            if not mask[row, pixel]:
+                continue
+
+            pos_x = (x[row, pixel] - bounds[0, 0]) * scale_x
+            pos_y = (y[row, pixel] - bounds[1, 0]) * scale_y
+            if not (0 <= pos_x <= n_x - 1 and 0 <= pos_y <= n_y - 1):
+                continue
+
+            x0 = min(int(pos_x), n_x - 2)
+            y0 = min(int(pos_y), n_y - 2)
+            weight_x = pos_x - x0
+            weight_y = pos_y - y0
+
+            value = 0.0
+            for corner in range(8):
+                if corner_weights[corner] == 0:
+                    continue
+                template = templates[
+                    corners[corner, 0], corners[corner, 1], corners[corner, 2]
+                ]
+                value += corner_weights[corner] * (
+                    (1 - weight_x)
+                    * (
+                        (1 - weight_y) * template[x0, y0]
+                        + weight_y * template[x0, y0 + 1]
+                    )
+                    + weight_x
+                    * (
+                        (1 - weight_y) * template[x0 + 1, y0]
+                        + weight_y * template[x0 + 1, y0 + 1]
+                    )
+                )
+            out[row, pixel] = value
+
+
+class TemplateGridInterpolator:
+    """
+    Image templates on a regular (energy, impact distance, xmax) grid,
+    interpolated multilinearly in these parameters and bilinearly in the
+    pixel positions.
+
+    Parameters
+    ----------
+    energy: ndarray
+        Increasing energy values of the grid
+    impact: ndarray
+        Increasing impact distance values of the grid
+    xmax: ndarray
+        Increasing xmax values of the grid
+    templates: ndarray
+        Template images of shape (n_energy, n_impact, n_xmax, n_x, n_y)
+    bounds: tuple
+        ((x_min, x_max), (y_min, y_max)), the positions of the first and last
+        template pixels along both axes of the images
+    """
+
+    def __init__(self, energy, impact, xmax, templates, bounds):
+        self.energy = np.asarray(energy, dtype=np.float64)
+        self.impact = np.asarray(impact, dtype=np.float64)
+        self.xmax = np.asarray(xmax, dtype=np.float64)
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+
+        expected_shape = (len(self.energy), len(self.impact), len(self.xmax))
+        if templates.ndim != 5 or templates.shape[:3] != expected_shape:
+            raise ValueError(
+                f"Templates of shape {templates.shape} do not match"
+                f" the grid of shape {expected_shape}"
+            )
+        if min(templates.shape[3:]) < 2:
+            raise ValueError("Template images need at least 2 pixels along each axis")
+
+        # memory-mapped arrays are kept as they are
+        self.templates = templates
+
+    @classmethod
+    def from_dict(cls, templates, bounds, dtype=np.float32):
+        """
+        Create from a dictionary of template images by (energy, impact, xmax)
+        as stored in the pickled template files of `TemplateNetworkInterpolator`.
+
+        Raises
+        ------
+        ValueError
+            if the keys do not form a complete regular grid
+        """
+        keys = np.array(list(templates.keys()), dtype=np.float64)
+        if keys.ndim != 2 or keys.shape[1] != 3:
+            raise ValueError("Template keys must be (energy, impact, xmax)")
+
+        axes = [np.unique(keys[:, dim]) for dim in range(3)]
+        shape = tuple(len(axis) for axis in axes)
+        if len(keys) != np.prod(shape):
+            raise ValueError("Template keys do not form a regular grid")
+
+        images = list(templates.values())
+        grid = np.empty(shape + np.shape(images[0]), dtype=dtype)
+        indices = [np.searchsorted(axis, keys[:, dim]) for dim, axis in enumerate(axes)]
+        for energy_index, impact_index, xmax_index, image in zip(*indices, images):
+            grid[energy_index, impact_index, xmax_index] = image
+
+        return cls(*axes, grid, bounds)
+
+    def save(self, path):
+        """
+        Store the templates in the directory ``path``, the images as
+        ``templates.npy`` to be memory-mapped by `load`, the grid as ``grid.npz``
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "templates.npy", np.ascontiguousarray(self.templates))
+        np.savez(
+            path / "grid.npz",
+            energy=self.energy,
+            impact=self.impact,
+            xmax=self.xmax,
+            bounds=self.bounds,
+        )
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Load templates stored with `save`. By default the template images are
+        memory-mapped, so only the parts used are read from disk.
+        """
+        path = Path(path)
+        templates = np.load(path / "templates.npy", mmap_mode=mmap_mode)
+        with np.load(path / "grid.npz") as grid:
+            return cls(
+                grid["energy"], grid["impact"], grid["xmax"], templates, grid["bounds"]
+            )
+
+    def __call__(self, energy, impact, xmax, xb, yb):
+        """
+        Evaluate interpolated templates for shower parameters and pixel positions
+
+        Parameters
+        ----------
+        energy: array-like
+            Energy of each interpolated template
+        impact: array-like
+            Impact distance of each interpolated template
+        xmax: array-like
+            Depth of maximum of each interpolated template
+        xb: array-like
+            Pixel X positions at which to evaluate each template, shape (n, n_pixels).
+            Masked positions are not evaluated.
+        yb: array-like
+            Pixel Y positions at which to evaluate each template
+
+        Returns
+        -------
+        ndarray: Pixel amplitude expectation values, 0 outside of the templates
+        """
+        x = np.atleast_2d(ma.getdata(xb)).astype(np.float64)
+        y = np.atleast_2d(ma.getdata(yb)).astype(np.float64)
+        mask = ~(
+            np.atleast_2d(ma.getmaskarray(xb)) | np.atleast_2d(ma.getmaskarray(yb))
+        )
+
+        shape = (len(x),)
+        out = np.empty(x.shape)
+        _interpolate_templates(
+            self.templates,
+            self.energy,
+            self.impact,
+            self.xmax,
+            self.bounds,
+            np.broadcast_to(np.asarray(energy, dtype=np.float64), shape),
+            np.broadcast_to(np.asarray(impact, dtype=np.float64), shape),
+            np.broadcast_to(np.asarray(xmax, dtype=np.float64), shape),
+            x,
+            y,
+            mask,
+            out,
+        )
+        return out
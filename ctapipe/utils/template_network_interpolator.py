@@ -1,8 +1,10 @@
 from .unstructured_interpolator import UnstructuredInterpolator
+from .template_grid_interpolator import TemplateGridInterpolator
 import numpy as np
 import pickle
 import gzip
 import numpy.ma as ma
+from pathlib import Path
 
 
 class TemplateNetworkInterpolator:
@@ -10,26 +12,50 @@ class TemplateNetworkInterpolator:
     Class for interpolating between the the predictions
     """
 
-    def __init__(self, template_file):
+    bounds = ((-5, 1), (-1.5, 1.5))
+
+    def __init__(self, template_file, regular_grid=False):
         """
+        Pickled templates are interpolated by an `UnstructuredInterpolator`,
+        or by a `TemplateGridInterpolator` if ``regular_grid`` is set.
+        Directories written by `TemplateGridInterpolator.save` are always
+        interpolated by a `TemplateGridInterpolator`.
+
+        The two differ in the pixel y positions: `TemplateGridInterpolator`
+        maps y linearly onto the template bounds, while
+        `UnstructuredInterpolator` adds y to that mapped position,
+        so they only agree for y = 0.
 
         Parameters
         ----------
         template_file: str
-            Location of pickle file containing ImPACT NN templates
+            Location of pickle file containing ImPACT NN templates,
+            or of a directory written by `TemplateGridInterpolator.save`
+        regular_grid: bool
+            Use a `TemplateGridInterpolator` for pickled templates, which
+            requires their keys to form a regular (energy, impact, xmax) grid
         """
+        if Path(template_file).is_dir():
+            self.interpolator = TemplateGridInterpolator.load(template_file)
+            return
 
         file_list = gzip.open(template_file)
         input_dict = pickle.load(file_list)
-        self.interpolator = UnstructuredInterpolator(
-            input_dict, remember_last=True, bounds=((-5, 1), (-1.5, 1.5))
-        )
+        if regular_grid:
+            self.interpolator = TemplateGridInterpolator.from_dict(
+                input_dict, self.bounds
+            )
+        else:
+            self.interpolator = UnstructuredInterpolator(
+                input_dict, remember_last=True, bounds=self.bounds
+            )
 
     def reset(self):
         """
         Reset method to delete some saved results from the previous event
         """
-        self.interpolator.reset()
+        if isinstance(self.interpolator, UnstructuredInterpolator):
+            self.interpolator.reset()
 
     def __call__(self, energy, impact, xmax, xb, yb):
         """
@@ -52,10 +78,13 @@ class TemplateNetworkInterpolator:
         -------
         ndarray: Pixel amplitude expectation values
         """
-        array = np.stack((energy, impact, xmax), axis=-1)
-        points = ma.dstack((xb, yb))
+        if isinstance(self.interpolator, TemplateGridInterpolator):
+            interpolated_value = self.interpolator(energy, impact, xmax, xb, yb)
+        else:
+            array = np.stack((energy, impact, xmax), axis=-1)
+            points = ma.dstack((xb, yb))
+            interpolated_value = self.interpolator(array, points)
 
-        interpolated_value = self.interpolator(array, points)
         interpolated_value[interpolated_value < 0] = 0
         interpolated_value = interpolated_value
 
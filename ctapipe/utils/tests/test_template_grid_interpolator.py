@@ -0,0 +1,118 @@
+import gzip
+import pickle
+
+import numpy as np
+import numpy.ma as ma
+import pytest
+
+from ctapipe.utils.template_grid_interpolator import TemplateGridInterpolator
+from ctapipe.utils.template_network_interpolator import TemplateNetworkInterpolator
+
+BOUNDS = ((-5, 1), (-1.5, 1.5))
+
+
+def linear_templates():
+    """ templates linear in all parameters, which are interpolated exactly """
+    energy = np.array([0.1, 1.0, 10.0])
+    impact = np.array([0.0, 100.0, 200.0, 300.0])
+    xmax = np.array([-100.0, 0.0, 200.0])
+    x = np.linspace(*BOUNDS[0], 7)
+    y = np.linspace(*BOUNDS[1], 4)
+
+    grid = np.meshgrid(energy, impact, xmax, x, y, indexing="ij")
+    templates = model(*grid)
+    return energy, impact, xmax, templates
+
+
+def model(energy, impact, xmax, x, y):
+    return 10 + energy + 0.01 * impact + 0.001 * xmax + 2 * x - 3 * y
+
+
+def test_interpolation():
+    """ multilinear interpolation reproduces linear templates """
+    interpolator = TemplateGridInterpolator(*linear_templates(), bounds=BOUNDS)
+    rng = np.random.default_rng(0)
+
+    energy = np.array([0.5, 3.0])
+    impact = np.array([50.0, 250.0])
+    xmax = np.array([-50.0, 150.0])
+    x = rng.uniform(-5, 1, (2, 10))
+    y = rng.uniform(-1.5, 1.5, (2, 10))
+
+    result = interpolator(energy, impact, xmax, x, y)
+    expected = model(
+        energy[:, np.newaxis], impact[:, np.newaxis], xmax[:, np.newaxis], x, y
+    )
+    assert result.shape == (2, 10)
+    assert np.allclose(result, expected)
+
+    # shower parameters are clipped to the grid, positions outside are 0
+    x[0, 0] = 2
+    result = interpolator([20.0, 0.1], [-10.0, 300.0], [0.0, 0.0], x, y)
+    assert result[0, 0] == 0
+    assert np.allclose(result[0, 1:], model(10.0, 0.0, 0.0, x[0, 1:], y[0, 1:]))
+    assert np.allclose(result[1], model(0.1, 300.0, 0.0, x[1], y[1]))
+
+    # masked positions are not evaluated
+    masked_x = ma.masked_array(x, mask=np.zeros_like(x, dtype=bool))
+    masked_x[1, :5] = ma.masked
+    result = interpolator(energy, impact, xmax, masked_x, y)
+    assert np.all(result[1, :5] == 0)
+    assert np.allclose(result[1, 5:], expected[1, 5:])
+
+
+def linear_template_dict():
+    energy, impact, xmax, templates = linear_templates()
+    return {
+        (e, i, x): templates[e_index, i_index, x_index]
+        for e_index, e in enumerate(energy)
+        for i_index, i in enumerate(impact)
+        for x_index, x in enumerate(xmax)
+    }
+
+
+def test_from_dict_and_save(tmp_path):
+    energy, impact, xmax, templates = linear_templates()
+    template_dict = linear_template_dict()
+
+    interpolator = TemplateGridInterpolator.from_dict(template_dict, BOUNDS)
+    assert interpolator.templates.dtype == np.float32
+    assert np.allclose(interpolator.templates, templates)
+    assert np.all(interpolator.impact == impact)
+
+    interpolator.save(tmp_path / "templates")
+    loaded = TemplateGridInterpolator.load(tmp_path / "templates")
+    assert isinstance(loaded.templates, np.memmap)
+
+    args = ([1.0], [120.0], [10.0], np.array([[0.1, -2.0]]), np.array([[0.3, 1.0]]))
+    assert np.all(loaded(*args) == interpolator(*args))
+
+    # not a regular grid
+    del template_dict[(energy[0], impact[0], xmax[0])]
+    with pytest.raises(ValueError):
+        TemplateGridInterpolator.from_dict(template_dict, BOUNDS)
+
+
+def test_network_interpolator_regular_grid(tmp_path):
+    """ grid and unstructured interpolation agree along the x axis """
+    template_file = tmp_path / "templates.template.gz"
+    with gzip.open(template_file, "wb") as f:
+        pickle.dump(linear_template_dict(), f)
+
+    unstructured = TemplateNetworkInterpolator(template_file)
+    grid = TemplateNetworkInterpolator(template_file, regular_grid=True)
+    assert isinstance(grid.interpolator, TemplateGridInterpolator)
+
+    energy = np.array([0.5, 3.0])
+    impact = np.array([50.0, 250.0])
+    xmax = np.array([-50.0, 150.0])
+    x = np.tile(np.linspace(-4.5, 0.5, 6), (2, 1))
+    y = np.zeros_like(x)
+
+    expected = model(
+        energy[:, np.newaxis], impact[:, np.newaxis], xmax[:, np.newaxis], x, y
+    )
+    grid_result = grid(energy, impact, xmax, x, y)
+    unstructured_result = ma.getdata(unstructured(energy, impact, xmax, x, y))
+    assert np.allclose(grid_result, expected, rtol=1e-5)
+    assert np.allclose(unstructured_result, grid_result, rtol=1e-5)
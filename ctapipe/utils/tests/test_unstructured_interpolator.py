@@ -80,6 +80,35 @@ def test_remember_last():
     assert np.all(np.abs(interpolated_points - interpolated_points_mask) < 1e-10)
 
 
+def test_remember_last_simplices():
+    """
+    Check the simplices of the previous call are only reused if every point is
+    still inside the simplex found for it
+    """
+
+    # two triangles: (0, 0), (1, 0), (0, 1) and (1, 0), (0, 1), (3, 3)
+    keys = [(0, 0), (1, 0), (0, 1), (3, 3)]
+    interpolation_points = {key: key[0] + 2.0 * key[1] for key in keys}
+    interpolator = UnstructuredInterpolator(interpolation_points, remember_last=True)
+
+    def expected(points):
+        return points[:, 0] + 2 * points[:, 1]
+
+    points = np.array([[0.2, 0.2], [1.0, 1.0]])
+    assert np.allclose(interpolator(points), expected(points))
+    previous = interpolator._previous_m
+
+    # points moved inside their simplices, the previous simplices are reused
+    points = np.array([[0.3, 0.3], [1.2, 1.2]])
+    assert np.allclose(interpolator(points), expected(points))
+    assert interpolator._previous_m is previous
+
+    # both points inside the previous simplices, but not their own ones
+    points = points[::-1]
+    assert np.allclose(interpolator(points), expected(points))
+    assert interpolator._previous_m is not previous
+
+
 def test_masked_input():
     """
     Now lets test how well this all works if we pass a masked input
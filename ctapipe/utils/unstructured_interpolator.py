@@ -95,15 +95,12 @@ class UnstructuredInterpolator:
         # In
         if self._remember and self._previous_v is not 0:
 
-            previous_keys = self.keys[self._previous_v.ravel()]
-            hull = Delaunay(previous_keys)
-
             if np.all(eval_points is not None):
                 shape_check = eval_points.shape == self._previous_shape
             else:
                 shape_check = True
 
-            if np.all(hull.find_simplex(points) >= 0) and shape_check:
+            if shape_check and self._in_previous_simplices(points):
                 v = self._previous_v
                 m = self._previous_m
             else:
@@ -157,6 +154,20 @@ class UnstructuredInterpolator:
 
         return p_values
 
+    def _in_previous_simplices(self, points):
+        """
+        Check if each point is still inside the simplex found for it in the
+        previous call, using the stored barycentric transforms instead of
+        triangulating the previous vertices again
+        """
+        m = self._previous_m
+        if len(m) != len(points):
+            return False
+
+        n = self._num_dimensions
+        b = np.einsum("ijk,ik->ij", m[:, :n, :n], points - m[:, n, :])
+        return np.all(b >= 0) and np.all(b.sum(axis=1) <= 1)
+
     def _call_class_function(self, point_num, eval_points):
         """
         Function to loop over class function and return array of outputs
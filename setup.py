@@ -24,6 +24,7 @@ entry_points["console_scripts"] = [
     "ctapipe-display-dl1 = ctapipe.tools.display_dl1:main",
     "ctapipe-stage1 = ctapipe.tools.stage1:main",
     "ctapipe-merge = ctapipe.tools.dl1_merge:main",
+    "ctapipe-index-dl1 = ctapipe.tools.index_dl1:main",
 ]
 tests_require = ["pytest"]
 docs_require = [